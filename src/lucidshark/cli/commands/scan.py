@@ -119,7 +119,7 @@ class ScanCommand(Command):
             # CLI --fail-on overrides all config thresholds
             if args.fail_on:
                 # CLI flag applies to all issues regardless of domain
-                active_issues = [i for i in result.issues if not i.ignored]
+                active_issues = (i for i in result.issues if not i.ignored)
                 if check_severity_threshold(active_issues, args.fail_on):
                     return EXIT_ISSUES_FOUND
             else:
@@ -12,12 +12,14 @@ Uses pathspec library for full gitignore compliance including:
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 from typing import TYPE_CHECKING, List, Optional, Tuple
 
 import pathspec
 
 from lucidshark.core.logging import get_logger
+from lucidshark.core.paths import find_first_file
 
 if TYPE_CHECKING:
     pass
@@ -26,6 +28,64 @@ LOGGER = get_logger(__name__)
 
 LUCIDSHARKIGNORE_NAMES = [".lucidsharkignore"]
 
+# Characters that end the literal (non-glob) head of a pattern
+_GLOB_CHARS = frozenset("*?[\\")
+
+
+def _literal_base(pattern: str) -> Optional[str]:
+    """Extract the literal directory prefix of an anchored gitignore pattern.
+
+    For example ``scripts/**`` -> ``scripts`` and ``/src/gen/*.py`` ->
+    ``src/gen``. Only anchored patterns (leading or inner slash) have a
+    base: unanchored ones such as ``*.log`` or ``build/`` can match at
+    any depth.
+
+    Args:
+        pattern: Cleaned gitignore-style pattern.
+
+    Returns:
+        Literal base path, or None if the pattern has no literal head.
+    """
+    pattern = pattern.rstrip()
+    if pattern.startswith("!"):
+        return None
+    if pattern.startswith("/"):
+        pattern = pattern[1:]
+    elif "/" not in pattern.rstrip("/"):
+        return None
+
+    base: List[str] = []
+    for segment in pattern.split("/"):
+        if not segment or _GLOB_CHARS.intersection(segment):
+            break
+        base.append(segment)
+    return "/".join(base) or None
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_patterns(
+    patterns: Tuple[str, ...],
+) -> Tuple[pathspec.PathSpec, Optional[Tuple[str, ...]]]:
+    """Compile cleaned patterns into a PathSpec plus literal base prefixes.
+
+    Cached process-wide so that every IgnorePatterns built from the same
+    rules (e.g. global + domain merges repeated per scan) reuses one
+    compiled spec instead of re-translating each pattern to a regex.
+
+    Args:
+        patterns: Cleaned gitignore-style patterns.
+
+    Returns:
+        Tuple of (compiled PathSpec, base prefixes). The prefixes are
+        "<base>/" strings when every pattern is anchored under a literal
+        base directory, so a path outside all bases can be rejected with
+        one startswith() (Deno glob strategy); None otherwise.
+    """
+    spec = pathspec.PathSpec.from_lines("gitignore", patterns)
+    bases = [_literal_base(p) for p in patterns]
+    prefixes = None if None in bases else tuple({f"{b}/" for b in bases})
+    return spec, prefixes
+
 
 class IgnorePatterns:
     """Manages ignore patterns from multiple sources."""
@@ -34,25 +94,30 @@ class IgnorePatterns:
         self,
         patterns: List[str],
         source: str = "config",
+        cleaned_already: bool = False,
     ) -> None:
         """Initialize with a list of gitignore-style patterns.
 
         Args:
             patterns: List of gitignore-style patterns.
             source: Source description for logging.
+            cleaned_already: If True, patterns are known to contain no
+                blank lines or comments and the cleaning pass is skipped.
         """
         self._source = source
-        self._raw_patterns = patterns
+        # Stored as a tuple so merges can be cached on (source, patterns)
+        self._raw_patterns: Tuple[str, ...] = tuple(patterns)
 
         # Filter out empty lines and comments for the PathSpec
-        clean_patterns = [
-            p for p in patterns if p.strip() and not p.strip().startswith("#")
-        ]
+        if cleaned_already:
+            clean_patterns = patterns
+        else:
+            clean_patterns = [
+                p for p in patterns if p.strip() and not p.strip().startswith("#")
+            ]
 
-        self._spec = pathspec.PathSpec.from_lines(
-            "gitignore",
-            clean_patterns,
-        )
+        # Instances with identical rules share one compiled PathSpec
+        self._spec, self._base_prefixes = _compile_patterns(tuple(clean_patterns))
 
         if clean_patterns:
             LOGGER.debug(f"Loaded {len(clean_patterns)} ignore patterns from {source}")
@@ -76,8 +141,31 @@ class IgnorePatterns:
             rel_path = path
 
         # pathspec expects forward-slash paths
-        rel_str = str(rel_path).replace("\\", "/")
-        return self._spec.match_file(rel_str)
+        return self.matches_rel(str(rel_path).replace("\\", "/"))
+
+    def matches_rel(self, rel_posix: str) -> bool:
+        """Check if a root-relative POSIX path matches any ignore pattern.
+
+        Callers testing the same path against several pattern sets can
+        compute the relative path once and use this directly.
+
+        Args:
+            rel_posix: Forward-slash path relative to the project root.
+
+        Returns:
+            True if path should be ignored, False otherwise.
+        """
+        if self._base_prefixes is not None:
+            # Mirror pathspec's normalization of a leading "/" or "./"
+            if rel_posix.startswith("/"):
+                head = rel_posix[1:]
+            elif rel_posix.startswith("./"):
+                head = rel_posix[2:]
+            else:
+                head = rel_posix
+            if not f"{head}/".startswith(self._base_prefixes):
+                return False
+        return self._spec.match_file(rel_posix)
 
     def get_exclude_patterns(self) -> List[str]:
         """Get patterns suitable for scanner --exclude flags.
@@ -105,9 +193,14 @@ class IgnorePatterns:
             return None
 
         try:
-            content = file_path.read_text(encoding="utf-8")
-            patterns = content.splitlines()
-            return cls(patterns, source=str(file_path))
+            lines = file_path.read_text(encoding="utf-8").splitlines()
+            # Drop blanks/comments in a single pass. Only the test uses the
+            # stripped text: surrounding whitespace (e.g. an escaped trailing
+            # space) is significant to gitignore and must reach pathspec.
+            patterns = [
+                line for line in lines if (s := line.strip()) and not s.startswith("#")
+            ]
+            return cls(patterns, source=str(file_path), cleaned_already=True)
         except Exception as e:
             LOGGER.warning(f"Failed to load ignore file {file_path}: {e}")
             return None
@@ -116,21 +209,43 @@ class IgnorePatterns:
     def merge(cls, *pattern_sets: Optional["IgnorePatterns"]) -> "IgnorePatterns":
         """Merge multiple IgnorePatterns instances.
 
+        Merges are cached on the sources and patterns of the inputs, so
+        repeating the same merge (e.g. global + domain excludes for every
+        domain of every scan) returns one shared instance.
+
         Args:
             pattern_sets: IgnorePatterns instances to merge.
 
         Returns:
-            New IgnorePatterns with combined patterns.
+            IgnorePatterns with combined patterns.
         """
-        all_patterns: List[str] = []
-        sources: List[str] = []
+        return _merge_cached(
+            tuple(
+                (ps._source, ps._raw_patterns) for ps in pattern_sets if ps is not None
+            )
+        )
 
-        for ps in pattern_sets:
-            if ps is not None:
-                all_patterns.extend(ps._raw_patterns)
-                sources.append(ps._source)
 
-        return cls(all_patterns, source="+".join(sources) if sources else "empty")
+@functools.lru_cache(maxsize=32)
+def _merge_cached(parts: Tuple[Tuple[str, Tuple[str, ...]], ...]) -> IgnorePatterns:
+    """Build the merge of (source, patterns) pairs, cached on the pairs.
+
+    Args:
+        parts: Source and raw patterns of each merged IgnorePatterns.
+
+    Returns:
+        IgnorePatterns with combined patterns.
+    """
+    all_patterns: List[str] = []
+    sources: List[str] = []
+
+    for source, patterns in parts:
+        all_patterns.extend(patterns)
+        sources.append(source)
+
+    return IgnorePatterns(
+        all_patterns, source="+".join(sources) if sources else "empty"
+    )
 
 
 def find_lucidsharkignore(project_root: Path) -> Optional[Path]:
@@ -142,11 +257,7 @@ def find_lucidsharkignore(project_root: Path) -> Optional[Path]:
     Returns:
         Path to ignore file if found, None otherwise.
     """
-    for name in LUCIDSHARKIGNORE_NAMES:
-        ignore_path = project_root / name
-        if ignore_path.exists():
-            return ignore_path
-    return None
+    return find_first_file(project_root, LUCIDSHARKIGNORE_NAMES)
 
 
 def load_ignore_patterns(
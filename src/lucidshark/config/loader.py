@@ -9,12 +9,13 @@ Handles loading configuration from YAML files with:
 
 from __future__ import annotations
 
+import copy
+import functools
 import os
 import re
+import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
-import yaml
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
 from lucidshark.config.models import (
     CoveragePipelineConfig,
@@ -32,6 +33,7 @@ from lucidshark.config.models import (
 )
 from lucidshark.config.validation import validate_config
 from lucidshark.core.logging import get_logger
+from lucidshark.core.paths import find_first_file
 from lucidshark.bootstrap.paths import get_lucidshark_home
 
 LOGGER = get_logger(__name__)
@@ -80,21 +82,26 @@ def load_config(
         ConfigError: If specified config file doesn't exist or has parse errors.
     """
     sources: List[str] = []
+    # Owned by this function, so each layer is merged into it in place
     merged: Dict[str, Any] = {}
 
     # Layer 1: Global config
+    # find_*_config already verified these files exist
     global_path = find_global_config()
-    if global_path and global_path.exists():
+    if global_path:
         try:
             global_dict = load_yaml_file(global_path)
             validate_config(global_dict, source=str(global_path))
-            merged = merge_configs(merged, global_dict)
+            _merge_into(merged, global_dict)
             sources.append(f"global:{global_path}")
             LOGGER.debug(f"Loaded global config from {global_path}")
         except Exception as e:
             LOGGER.warning(f"Failed to load global config: {e}")
 
     # Layer 2: Project or custom config
+    # PyYAML is imported lazily to keep it off the CLI startup path
+    import yaml
+
     project_dict: Dict[str, Any] = {}
     if cli_config_path:
         if not cli_config_path.exists():
@@ -108,7 +115,7 @@ def load_config(
             raise ConfigError(f"Invalid YAML in {cli_config_path}: {e}") from e
     else:
         project_path = find_project_config(project_root)
-        if project_path and project_path.exists():
+        if project_path:
             try:
                 project_dict = load_yaml_file(project_path)
                 validate_config(project_dict, source=str(project_path))
@@ -118,11 +125,11 @@ def load_config(
                 raise ConfigError(f"Invalid YAML in {project_path}: {e}") from e
 
     if project_dict:
-        merged = merge_configs(merged, project_dict)
+        _merge_into(merged, project_dict)
 
     # Layer 3: CLI overrides
     if cli_overrides:
-        merged = merge_configs(merged, cli_overrides)
+        _merge_into(merged, cli_overrides)
         sources.append("cli")
         LOGGER.debug("Applied CLI overrides")
 
@@ -146,11 +153,7 @@ def find_project_config(project_root: Path) -> Optional[Path]:
     Returns:
         Path to config file if found, None otherwise.
     """
-    for name in PROJECT_CONFIG_NAMES:
-        config_path = project_root / name
-        if config_path.exists():
-            return config_path
-    return None
+    return find_first_file(project_root, PROJECT_CONFIG_NAMES)
 
 
 def find_global_config() -> Optional[Path]:
@@ -159,17 +162,18 @@ def find_global_config() -> Optional[Path]:
     Returns:
         Path to global config if it exists, None otherwise.
     """
-    home = get_lucidshark_home()
-    config_path = home / "config" / GLOBAL_CONFIG_NAME
-    if config_path.exists():
-        return config_path
+    config_path = os.path.join(get_lucidshark_home(), "config", GLOBAL_CONFIG_NAME)
+    if os.path.isfile(config_path):
+        return Path(config_path)
     return None
 
 
 def load_yaml_file(path: Path) -> Dict[str, Any]:
     """Load and parse a YAML config file.
 
-    Performs environment variable expansion on string values.
+    Performs environment variable expansion on string values. Parsed
+    documents are cached per file identity and modification time, so
+    repeated loads of an unchanged file skip the YAML parse.
 
     Args:
         path: Path to YAML file.
@@ -181,10 +185,10 @@ def load_yaml_file(path: Path) -> Dict[str, Any]:
         yaml.YAMLError: If YAML parsing fails.
         FileNotFoundError: If file doesn't exist.
     """
-    with open(path, "r", encoding="utf-8") as f:
-        content = f.read()
-
-    data = yaml.safe_load(content)
+    st = os.stat(path)
+    data = _parse_yaml_cached(
+        os.path.abspath(path), st.st_ino, st.st_mtime_ns, st.st_size
+    )
 
     if data is None:
         return {}
@@ -194,37 +198,92 @@ def load_yaml_file(path: Path) -> Dict[str, Any]:
             f"Config file must be a YAML mapping, got {type(data).__name__}"
         )
 
-    # Expand environment variables
+    # Expand environment variables. This rebuilds every dict and list,
+    # so callers never share (or mutate) the cached document.
     return expand_env_vars(data)
 
 
-def expand_env_vars(data: Any) -> Any:
-    """Recursively expand environment variables in config values.
+@functools.lru_cache(maxsize=128)
+def _parse_yaml_cached(path: str, inode: int, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file, cached on (path, inode, mtime, size).
+
+    The stat fields are only part of the cache key: any change to the
+    file produces a new key and therefore a fresh parse.
+
+    Args:
+        path: Absolute path to YAML file.
+        inode: File inode number.
+        mtime_ns: File modification time in nanoseconds.
+        size: File size in bytes.
+
+    Returns:
+        Parsed YAML document (not yet env-expanded). Must not be mutated.
+    """
+    import yaml
+
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    # Hand the parser the whole file at once rather than a stream
+    return yaml.load(Path(path).read_bytes(), Loader=loader)
+
+
+def expand_env_vars(data: Any, env: Optional[Mapping[str, str]] = None) -> Any:
+    """Expand environment variables in config values.
 
-    Supports ${VAR} and ${VAR:-default} syntax.
+    Supports ${VAR} and ${VAR:-default} syntax. Walks nested dicts and
+    lists with an explicit stack, building new containers so the input
+    is never mutated.
 
     Args:
         data: Config data (dict, list, or scalar).
+        env: Mapping to resolve variables from. Defaults to os.environ.
 
     Returns:
         Data with environment variables expanded.
     """
-    if isinstance(data, dict):
-        return {k: expand_env_vars(v) for k, v in data.items()}
-    elif isinstance(data, list):
-        return [expand_env_vars(item) for item in data]
-    elif isinstance(data, str):
-        return ENV_VAR_PATTERN.sub(_env_var_replacer, data)
-    else:
+    replacer: Callable[[re.Match[str]], str] = (
+        _env_var_replacer
+        if env is None
+        else functools.partial(_env_var_replacer, env=env)
+    )
+
+    data_type = type(data)
+    if data_type is str:
+        # Most config strings contain no variable reference at all
+        if "$" not in data:
+            return data
+        return ENV_VAR_PATTERN.sub(replacer, data)
+    if data_type is not dict and data_type is not list:
         return data
 
+    result = dict(data) if data_type is dict else list(data)
+    stack: List[Any] = [result]
+
+    while stack:
+        container = stack.pop()
+        items = container.items() if type(container) is dict else enumerate(container)
+        # Only existing keys are reassigned, so iterating while writing is safe
+        for key, value in items:
+            value_type = type(value)
+            if value_type is str:
+                if "$" in value:
+                    container[key] = ENV_VAR_PATTERN.sub(replacer, value)
+            elif value_type is dict or value_type is list:
+                child = dict(value) if value_type is dict else list(value)
+                container[key] = child
+                stack.append(child)
 
-def _env_var_replacer(match: re.Match[str]) -> str:
+    return result
+
+
+def _env_var_replacer(
+    match: re.Match[str], env: Optional[Mapping[str, str]] = None
+) -> str:
     """Replace environment variable reference with its value."""
     var_name = match.group(1)
     default_value = match.group(2)
 
-    value = os.environ.get(var_name)
+    value = (os.environ if env is None else env).get(var_name)
     if value is not None:
         return value
     if default_value is not None:
@@ -249,21 +308,38 @@ def merge_configs(base: Dict[str, Any], overlay: Dict[str, Any]) -> Dict[str, An
     Returns:
         Merged configuration dictionary.
     """
-    result = base.copy()
-
-    for key, overlay_value in overlay.items():
-        if (
-            key in result
-            and isinstance(result[key], dict)
-            and isinstance(overlay_value, dict)
-        ):
-            result[key] = merge_configs(result[key], overlay_value)
-        else:
-            result[key] = overlay_value
-
+    result = copy.deepcopy(base)
+    _merge_into(result, overlay)
     return result
 
 
+def _merge_into(base: Dict[str, Any], overlay: Dict[str, Any]) -> None:
+    """Deep merge overlay into base in place, with overlay taking precedence.
+
+    Follows the same rules as merge_configs but writes directly into
+    base, for callers that own it. Walks the overlay with an explicit
+    stack instead of recursing.
+
+    Args:
+        base: Configuration dictionary to merge into (mutated).
+        overlay: Overlay configuration to merge on top.
+    """
+    stack = [(base, overlay)]
+
+    while stack:
+        dst, src = stack.pop()
+        for key, overlay_value in src.items():
+            base_value = dst.get(key)
+            if isinstance(overlay_value, dict) and isinstance(base_value, dict):
+                if base_value.keys().isdisjoint(overlay_value):
+                    # No shared keys, so nothing below needs a deep merge
+                    base_value.update(overlay_value)
+                else:
+                    stack.append((base_value, overlay_value))
+            else:
+                dst[key] = overlay_value
+
+
 def _parse_tool_config(tool_data: Dict[str, Any]) -> ToolConfig:
     """Parse a single tool configuration.
 
@@ -294,6 +370,28 @@ def _parse_tool_config(tool_data: Dict[str, Any]) -> ToolConfig:
     )
 
 
+def _parse_tools(tools_data: List[Any]) -> List[ToolConfig]:
+    """Parse a domain's tools list.
+
+    Entries are either tool config dicts or plain tool-name strings;
+    anything else is skipped.
+
+    Args:
+        tools_data: Raw tools list from a domain configuration.
+
+    Returns:
+        List of ToolConfig instances.
+    """
+    tools = []
+    for tool_data in tools_data:
+        if isinstance(tool_data, dict):
+            tools.append(_parse_tool_config(tool_data))
+        elif isinstance(tool_data, str):
+            # Simple string format: just the tool name
+            tools.append(ToolConfig(name=tool_data))
+    return tools
+
+
 def _parse_domain_pipeline_config(
     domain_data: Optional[Dict[str, Any]],
 ) -> Optional[DomainPipelineConfig]:
@@ -309,15 +407,7 @@ def _parse_domain_pipeline_config(
         return None
 
     enabled = domain_data.get("enabled", True)
-    tools_data = domain_data.get("tools", [])
-
-    tools = []
-    for tool_data in tools_data:
-        if isinstance(tool_data, dict):
-            tools.append(_parse_tool_config(tool_data))
-        elif isinstance(tool_data, str):
-            # Simple string format: just the tool name
-            tools.append(ToolConfig(name=tool_data))
+    tools = _parse_tools(domain_data.get("tools", []))
 
     exclude = domain_data.get("exclude", [])
     threshold_scope = domain_data.get("threshold_scope", "changed")
@@ -349,15 +439,7 @@ def _parse_coverage_pipeline_config(
     if coverage_data is None:
         return None
 
-    # Parse tools the same way as _parse_domain_pipeline_config
-    tools_data = coverage_data.get("tools", [])
-    tools = []
-    for tool_data in tools_data:
-        if isinstance(tool_data, dict):
-            tools.append(_parse_tool_config(tool_data))
-        elif isinstance(tool_data, str):
-            # Simple string format: just the tool name
-            tools.append(ToolConfig(name=tool_data))
+    tools = _parse_tools(coverage_data.get("tools", []))
 
     return CoveragePipelineConfig(
         enabled=coverage_data.get("enabled", False),
@@ -386,15 +468,7 @@ def _parse_duplication_pipeline_config(
     if duplication_data is None:
         return None
 
-    # Parse tools the same way as _parse_domain_pipeline_config
-    tools_data = duplication_data.get("tools", [])
-    tools = []
-    for tool_data in tools_data:
-        if isinstance(tool_data, dict):
-            tools.append(_parse_tool_config(tool_data))
-        elif isinstance(tool_data, str):
-            # Simple string format: just the tool name
-            tools.append(ToolConfig(name=tool_data))
+    tools = _parse_tools(duplication_data.get("tools", []))
 
     return DuplicationPipelineConfig(
         enabled=duplication_data.get("enabled", False),
@@ -454,6 +528,18 @@ def _parse_overview_config(
     )
 
 
+# Parser for each PipelineConfig domain field
+_PIPELINE_DOMAIN_PARSERS: Tuple[Tuple[str, Callable[[Any], Any]], ...] = (
+    ("linting", _parse_domain_pipeline_config),
+    ("type_checking", _parse_domain_pipeline_config),
+    ("testing", _parse_domain_pipeline_config),
+    ("coverage", _parse_coverage_pipeline_config),
+    ("security", _parse_domain_pipeline_config),
+    ("duplication", _parse_duplication_pipeline_config),
+    ("formatting", _parse_domain_pipeline_config),
+)
+
+
 def dict_to_config(data: Dict[str, Any]) -> LucidSharkConfig:
     """Convert validated dict to typed LucidSharkConfig.
 
@@ -463,6 +549,10 @@ def dict_to_config(data: Dict[str, Any]) -> LucidSharkConfig:
     Returns:
         Typed LucidSharkConfig instance.
     """
+    # No config file and no overrides: every field takes its default
+    if not data:
+        return LucidSharkConfig()
+
     # Parse output config
     output_data = data.get("output", {})
     output = OutputConfig(
@@ -486,6 +576,10 @@ def dict_to_config(data: Dict[str, Any]) -> LucidSharkConfig:
             k: v for k, v in domain_data.items() if k not in ("enabled", "plugin")
         }
 
+        # Intern YAML-parsed keys so later lookups with the (already
+        # interned) domain literals hit dict's identity fast path
+        if isinstance(domain, str):
+            domain = sys.intern(domain)
         scanners[domain] = ScannerDomainConfig(
             enabled=enabled,
             plugin=plugin,
@@ -500,15 +594,10 @@ def dict_to_config(data: Dict[str, Any]) -> LucidSharkConfig:
     pipeline = PipelineConfig(
         enrichers=pipeline_data.get("enrichers", []),
         max_workers=pipeline_data.get("max_workers", 4),
-        linting=_parse_domain_pipeline_config(pipeline_data.get("linting")),
-        type_checking=_parse_domain_pipeline_config(pipeline_data.get("type_checking")),
-        testing=_parse_domain_pipeline_config(pipeline_data.get("testing")),
-        coverage=_parse_coverage_pipeline_config(pipeline_data.get("coverage")),
-        security=_parse_domain_pipeline_config(pipeline_data.get("security")),
-        duplication=_parse_duplication_pipeline_config(
-            pipeline_data.get("duplication")
-        ),
-        formatting=_parse_domain_pipeline_config(pipeline_data.get("formatting")),
+        **{
+            name: parser(pipeline_data.get(name))
+            for name, parser in _PIPELINE_DOMAIN_PARSERS
+        },
     )
 
     # Parse project config
@@ -7,16 +7,20 @@ Core fields are validated, while plugin-specific options are passed through.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Union
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Union
 
 
-# Default plugins per domain (used when not specified in config)
-DEFAULT_PLUGINS: Dict[str, str] = {
-    "sca": "trivy",
-    "container": "trivy",
-    "sast": "opengrep",
-    "iac": "checkov",
-}
+# Default plugins per domain (used when not specified in config).
+# Read-only: a shared lookup table that callers must not mutate.
+DEFAULT_PLUGINS: Mapping[str, str] = MappingProxyType(
+    {
+        "sca": "trivy",
+        "container": "trivy",
+        "sast": "opengrep",
+        "iac": "checkov",
+    }
+)
 
 # Valid severity values for fail_on
 VALID_SEVERITIES = {"critical", "high", "medium", "low", "info"}
@@ -83,7 +87,7 @@ class FailOnConfig:
         return getattr(self, domain, None)
 
 
-@dataclass
+@dataclass(slots=True)
 class OutputConfig:
     """Output formatting configuration."""
 
@@ -102,7 +106,7 @@ class ToolConfig:
     mandatory: bool = False  # If True, tool must run or scan fails
 
 
-@dataclass
+@dataclass(slots=True)
 class DomainPipelineConfig:
     """Configuration for a pipeline domain (linting, type_checking, testing, etc.)."""
 
@@ -123,7 +127,7 @@ class DomainPipelineConfig:
     post_command: Optional[str] = None  # Shell command to run after main command
 
 
-@dataclass
+@dataclass(slots=True)
 class CoveragePipelineConfig:
     """Coverage-specific pipeline configuration."""
 
@@ -243,7 +247,7 @@ class PipelineConfig:
         return None
 
 
-@dataclass
+@dataclass(slots=True)
 class ScannerDomainConfig:
     """Configuration for a scanner domain (sca, sast, iac, container).
 
@@ -435,9 +439,10 @@ class LucidSharkConfig:
         Returns:
             Plugin name, falling back to default if not specified.
         """
-        # Check legacy scanners config first
-        domain_config = self.get_scanner_config(domain)
-        if domain_config.plugin:
+        # Check legacy scanners config first (without building a default
+        # ScannerDomainConfig for unconfigured domains)
+        domain_config = self.scanners.get(domain)
+        if domain_config is not None and domain_config.plugin:
             return domain_config.plugin
 
         # Check pipeline.security.tools
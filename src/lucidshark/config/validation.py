@@ -6,27 +6,26 @@ Plugin-specific options are passed through without validation.
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
 from difflib import get_close_matches
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
-
-import yaml
+from typing import AbstractSet, Any, Dict, FrozenSet, List, Optional, Tuple
 
 from lucidshark.core.logging import get_logger
 
 LOGGER = get_logger(__name__)
 
 
-class ValidationSeverity(Enum):
+class ValidationSeverity(str, Enum):
     """Severity level for validation issues."""
 
     ERROR = "error"  # Config will fail at runtime
     WARNING = "warning"  # Likely mistake but config usable
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ConfigValidationIssue:
     """A validation issue for configuration with severity."""
 
@@ -52,170 +51,205 @@ class ConfigValidationIssue:
 
 
 # Valid top-level keys (core config)
-VALID_TOP_LEVEL_KEYS: Set[str] = {
-    "version",
-    "project",
-    "fail_on",
-    "ignore",
-    "exclude",  # Alias for ignore
-    "ignore_issues",
-    "output",
-    "scanners",
-    "enrichers",
-    "pipeline",
-    "ai",
-}
+VALID_TOP_LEVEL_KEYS: FrozenSet[str] = frozenset(
+    {
+        "version",
+        "project",
+        "fail_on",
+        "ignore",
+        "exclude",  # Alias for ignore
+        "ignore_issues",
+        "output",
+        "scanners",
+        "enrichers",
+        "pipeline",
+        "ai",
+    }
+)
 
 # Valid keys under output section
-VALID_OUTPUT_KEYS: Set[str] = {
-    "format",
-}
+VALID_OUTPUT_KEYS: FrozenSet[str] = frozenset(
+    {
+        "format",
+    }
+)
 
 # Valid keys under pipeline section
-VALID_PIPELINE_KEYS: Set[str] = {
-    "enrichers",
-    "max_workers",
-    "linting",
-    "type_checking",
-    "formatting",
-    "security",
-    "testing",
-    "coverage",
-    "duplication",
-}
+VALID_PIPELINE_KEYS: FrozenSet[str] = frozenset(
+    {
+        "enrichers",
+        "max_workers",
+        "linting",
+        "type_checking",
+        "formatting",
+        "security",
+        "testing",
+        "coverage",
+        "duplication",
+    }
+)
 
 # Valid keys under pipeline domain sections (linting, type_checking, testing, etc.)
 # All domains support custom commands via 'command', 'pre_command', and 'post_command'
-VALID_PIPELINE_DOMAIN_KEYS: Set[str] = {
-    "enabled",
-    "tools",
-    "exclude",
-    "threshold_scope",  # Scope for threshold check: "changed", "project", or "both"
-    "command",  # Custom shell command to run instead of plugins
-    "pre_command",  # Shell command to run before main command (e.g., cleanup)
-    "post_command",  # Shell command to run after main command
-}
+VALID_PIPELINE_DOMAIN_KEYS: FrozenSet[str] = frozenset(
+    {
+        "enabled",
+        "tools",
+        "exclude",
+        "threshold_scope",  # Scope for threshold check: "changed", "project", or "both"
+        "command",  # Custom shell command to run instead of plugins
+        "pre_command",  # Shell command to run before main command (e.g., cleanup)
+        "post_command",  # Shell command to run after main command
+    }
+)
 
 # Valid keys under pipeline.testing section (same as domain keys)
-VALID_PIPELINE_TESTING_KEYS: Set[str] = VALID_PIPELINE_DOMAIN_KEYS
+VALID_PIPELINE_TESTING_KEYS: FrozenSet[str] = VALID_PIPELINE_DOMAIN_KEYS
 
 # Valid keys under pipeline.coverage section
-VALID_PIPELINE_COVERAGE_KEYS: Set[str] = {
-    "enabled",
-    "tools",
-    "threshold",
-    "threshold_scope",  # Scope for threshold check: "changed", "project", or "both"
-    "extra_args",  # Extra arguments to pass to Maven/Gradle
-    "exclude",
-    "command",  # Custom shell command to run coverage
-    "pre_command",  # Shell command to run before coverage (e.g., cleanup)
-    "post_command",  # Shell command to run after coverage
-}
+VALID_PIPELINE_COVERAGE_KEYS: FrozenSet[str] = frozenset(
+    {
+        "enabled",
+        "tools",
+        "threshold",
+        "threshold_scope",  # Scope for threshold check: "changed", "project", or "both"
+        "extra_args",  # Extra arguments to pass to Maven/Gradle
+        "exclude",
+        "command",  # Custom shell command to run coverage
+        "pre_command",  # Shell command to run before coverage (e.g., cleanup)
+        "post_command",  # Shell command to run after coverage
+    }
+)
 
 # Valid keys under pipeline.security section
-VALID_PIPELINE_SECURITY_KEYS: Set[str] = {
-    "enabled",
-    "tools",
-    "exclude",
-}
+VALID_PIPELINE_SECURITY_KEYS: FrozenSet[str] = frozenset(
+    {
+        "enabled",
+        "tools",
+        "exclude",
+    }
+)
 
 # Valid keys under pipeline.duplication section
-VALID_PIPELINE_DUPLICATION_KEYS: Set[str] = {
-    "enabled",
-    "tools",
-    "threshold",
-    "threshold_scope",  # Scope for threshold check: "changed", "project", or "both"
-    "min_lines",
-    "min_chars",
-    "exclude",
-    "baseline",
-    "cache",
-    "use_git",
-}
+VALID_PIPELINE_DUPLICATION_KEYS: FrozenSet[str] = frozenset(
+    {
+        "enabled",
+        "tools",
+        "threshold",
+        "threshold_scope",  # Scope for threshold check: "changed", "project", or "both"
+        "min_lines",
+        "min_chars",
+        "exclude",
+        "baseline",
+        "cache",
+        "use_git",
+    }
+)
 
 # Pipeline domains that require tools when enabled
-PIPELINE_DOMAINS_REQUIRING_TOOLS: Set[str] = {
-    "linting",
-    "type_checking",
-    "formatting",
-    "testing",
-    "coverage",
-}
+PIPELINE_DOMAINS_REQUIRING_TOOLS: FrozenSet[str] = frozenset(
+    {
+        "linting",
+        "type_checking",
+        "formatting",
+        "testing",
+        "coverage",
+    }
+)
 
 # Valid keys under scanners.<domain> (framework-level, not plugin-specific)
-VALID_SCANNER_DOMAIN_KEYS: Set[str] = {
-    "enabled",
-    "plugin",
-    # Everything else is plugin-specific and passed through
-}
+VALID_SCANNER_DOMAIN_KEYS: FrozenSet[str] = frozenset(
+    {
+        "enabled",
+        "plugin",
+        # Everything else is plugin-specific and passed through
+    }
+)
 
 # Valid domain names
-VALID_DOMAINS: Set[str] = {
-    "sca",
-    "sast",
-    "iac",
-    "container",
-}
+VALID_DOMAINS: FrozenSet[str] = frozenset(
+    {
+        "sca",
+        "sast",
+        "iac",
+        "container",
+    }
+)
 
 # Valid severity values
-VALID_SEVERITIES: Set[str] = {
-    "critical",
-    "high",
-    "medium",
-    "low",
-    "info",
-}
+VALID_SEVERITIES: FrozenSet[str] = frozenset(
+    {
+        "critical",
+        "high",
+        "medium",
+        "low",
+        "info",
+    }
+)
 
 # Valid fail_on domains (for dict format)
-VALID_FAIL_ON_DOMAINS: Set[str] = {
-    "linting",
-    "type_checking",
-    "formatting",
-    "security",
-    "testing",
-    "coverage",
-    "duplication",
-}
+VALID_FAIL_ON_DOMAINS: FrozenSet[str] = frozenset(
+    {
+        "linting",
+        "type_checking",
+        "formatting",
+        "security",
+        "testing",
+        "coverage",
+        "duplication",
+    }
+)
 
 # Valid fail_on values per domain type
-VALID_FAIL_ON_VALUES: Dict[str, Set[str]] = {
-    "linting": {"error", "none"},
-    "type_checking": {"error", "none"},
-    "formatting": {"error", "none"},
-    "security": {"critical", "high", "medium", "low", "info", "none"},
-    "testing": {"any", "none"},
-    "coverage": {"any", "none", "below_threshold"},
-    "duplication": {
-        "any",
-        "none",
-        "above_threshold",
-    },  # Can also be a percentage like "5%" - validated separately
+VALID_FAIL_ON_VALUES: Dict[str, FrozenSet[str]] = {
+    "linting": frozenset({"error", "none"}),
+    "type_checking": frozenset({"error", "none"}),
+    "formatting": frozenset({"error", "none"}),
+    "security": frozenset({"critical", "high", "medium", "low", "info", "none"}),
+    "testing": frozenset({"any", "none"}),
+    "coverage": frozenset({"any", "none", "below_threshold"}),
+    # Can also be a percentage like "5%" - validated separately
+    "duplication": frozenset({"any", "none", "above_threshold"}),
 }
 
 # Valid keys under ai section
-VALID_AI_KEYS: Set[str] = {
-    "enabled",
-    "provider",
-    "model",
-    "api_key",
-    "send_code_snippets",
-    "base_url",
-    "temperature",
-    "max_tokens",
-    "timeout",
-    "cache_enabled",
-    "prompt_version",
-}
+VALID_AI_KEYS: FrozenSet[str] = frozenset(
+    {
+        "enabled",
+        "provider",
+        "model",
+        "api_key",
+        "send_code_snippets",
+        "base_url",
+        "temperature",
+        "max_tokens",
+        "timeout",
+        "cache_enabled",
+        "prompt_version",
+    }
+)
 
 # Valid AI providers
-VALID_AI_PROVIDERS: Set[str] = {
-    "openai",
-    "anthropic",
-    "ollama",
-}
-
-
-@dataclass
+VALID_AI_PROVIDERS: FrozenSet[str] = frozenset(
+    {
+        "openai",
+        "anthropic",
+        "ollama",
+    }
+)
+
+
+# Message fragments that mark a validation warning as an error
+_ERROR_PHRASES: Tuple[str, ...] = (
+    "must be a",
+    "Invalid severity",
+    "Invalid value",
+    "Config must be",
+    "Coverage requires testing",  # Coverage depends on testing
+)
+
+
+@dataclass(slots=True, frozen=True)
 class ConfigValidationWarning:
     """A validation warning for configuration."""
 
@@ -253,6 +287,9 @@ def validate_config(
         )
         return warnings  # type: ignore[unreachable]
 
+    # Bind append once; it is called from every branch of the walk below
+    warnings_append = warnings.append
+
     # Check top-level keys
     for key in data.keys():
         if key not in VALID_TOP_LEVEL_KEYS:
@@ -263,7 +300,7 @@ def validate_config(
                 key=key,
                 suggestion=suggestion,
             )
-            warnings.append(warning)
+            warnings_append(warning)
             _log_warning(warning)
 
     # Validate fail_on (string or dict format)
@@ -279,7 +316,7 @@ def validate_config(
                     key="fail_on",
                     suggestion=suggestion,
                 )
-                warnings.append(warning)
+                warnings_append(warning)
                 _log_warning(warning)
         elif isinstance(fail_on, dict):
             # Dict format - validate each domain key and value
@@ -292,10 +329,10 @@ def validate_config(
                         key=f"fail_on.{domain}",
                         suggestion=suggestion,
                     )
-                    warnings.append(warning)
+                    warnings_append(warning)
                     _log_warning(warning)
                 elif not isinstance(value, str):
-                    warnings.append(
+                    warnings_append(
                         ConfigValidationWarning(
                             message=f"'fail_on.{domain}' must be a string, got {type(value).__name__}",
                             source=source,
@@ -303,7 +340,7 @@ def validate_config(
                         )
                     )
                 else:
-                    valid_values = VALID_FAIL_ON_VALUES.get(domain, set())
+                    valid_values = VALID_FAIL_ON_VALUES.get(domain, frozenset())
                     if value.lower() not in valid_values:
                         warning = ConfigValidationWarning(
                             message=f"Invalid value '{value}' for 'fail_on.{domain}'. "
@@ -311,10 +348,10 @@ def validate_config(
                             source=source,
                             key=f"fail_on.{domain}",
                         )
-                        warnings.append(warning)
+                        warnings_append(warning)
                         _log_warning(warning)
         else:
-            warnings.append(
+            warnings_append(
                 ConfigValidationWarning(
                     message=f"'fail_on' must be a string or mapping, got {type(fail_on).__name__}",
                     source=source,
@@ -326,7 +363,7 @@ def validate_config(
     ignore = data.get("ignore")
     if ignore is not None:
         if not isinstance(ignore, list):
-            warnings.append(
+            warnings_append(
                 ConfigValidationWarning(
                     message=f"'ignore' must be a list, got {type(ignore).__name__}",
                     source=source,
@@ -338,7 +375,7 @@ def validate_config(
     exclude = data.get("exclude")
     if exclude is not None:
         if not isinstance(exclude, list):
-            warnings.append(
+            warnings_append(
                 ConfigValidationWarning(
                     message=f"'exclude' must be a list, got {type(exclude).__name__}",
                     source=source,
@@ -350,7 +387,7 @@ def validate_config(
     ignore_issues = data.get("ignore_issues")
     if ignore_issues is not None:
         if not isinstance(ignore_issues, list):
-            warnings.append(
+            warnings_append(
                 ConfigValidationWarning(
                     message=f"'ignore_issues' must be a list, got {type(ignore_issues).__name__}",
                     source=source,
@@ -362,7 +399,7 @@ def validate_config(
             for i, entry in enumerate(ignore_issues):
                 if isinstance(entry, str):
                     if not entry.strip():
-                        warnings.append(
+                        warnings_append(
                             ConfigValidationWarning(
                                 message=f"'ignore_issues[{i}]' is an empty string",
                                 source=source,
@@ -371,7 +408,7 @@ def validate_config(
                         )
                 elif isinstance(entry, dict):
                     if "rule_id" not in entry:
-                        warnings.append(
+                        warnings_append(
                             ConfigValidationWarning(
                                 message=f"'ignore_issues[{i}]' must have a 'rule_id' field",
                                 source=source,
@@ -379,7 +416,7 @@ def validate_config(
                             )
                         )
                     elif not isinstance(entry["rule_id"], str):
-                        warnings.append(
+                        warnings_append(
                             ConfigValidationWarning(
                                 message=f"'ignore_issues[{i}].rule_id' must be a string",
                                 source=source,
@@ -388,7 +425,7 @@ def validate_config(
                         )
                     reason = entry.get("reason")
                     if reason is not None and not isinstance(reason, str):
-                        warnings.append(
+                        warnings_append(
                             ConfigValidationWarning(
                                 message=f"'ignore_issues[{i}].reason' must be a string",
                                 source=source,
@@ -404,7 +441,7 @@ def validate_config(
                         if isinstance(expires, _dt.date):
                             pass  # valid date object
                         elif not isinstance(expires, str):
-                            warnings.append(
+                            warnings_append(
                                 ConfigValidationWarning(
                                     message=f"'ignore_issues[{i}].expires' must be a string (YYYY-MM-DD)",
                                     source=source,
@@ -415,7 +452,7 @@ def validate_config(
                             import re
 
                             if not re.match(r"^\d{4}-\d{2}-\d{2}$", expires):
-                                warnings.append(
+                                warnings_append(
                                     ConfigValidationWarning(
                                         message=f"'ignore_issues[{i}].expires' must be YYYY-MM-DD format, got '{expires}'",
                                         source=source,
@@ -425,7 +462,7 @@ def validate_config(
                     paths = entry.get("paths")
                     if paths is not None:
                         if not isinstance(paths, list):
-                            warnings.append(
+                            warnings_append(
                                 ConfigValidationWarning(
                                     message=f"'ignore_issues[{i}].paths' must be a list of patterns",
                                     source=source,
@@ -435,7 +472,7 @@ def validate_config(
                         else:
                             for j, pattern in enumerate(paths):
                                 if not isinstance(pattern, str):
-                                    warnings.append(
+                                    warnings_append(
                                         ConfigValidationWarning(
                                             message=f"'ignore_issues[{i}].paths[{j}]' must be a string",
                                             source=source,
@@ -443,7 +480,7 @@ def validate_config(
                                         )
                                     )
                                 elif not pattern.strip():
-                                    warnings.append(
+                                    warnings_append(
                                         ConfigValidationWarning(
                                             message=f"'ignore_issues[{i}].paths[{j}]' is an empty string",
                                             source=source,
@@ -452,7 +489,7 @@ def validate_config(
                                     )
                     for key in entry:
                         if key not in _VALID_IGNORE_ISSUE_KEYS:
-                            warnings.append(
+                            warnings_append(
                                 ConfigValidationWarning(
                                     message=f"Unknown key 'ignore_issues[{i}].{key}'",
                                     source=source,
@@ -460,7 +497,7 @@ def validate_config(
                                 )
                             )
                 else:
-                    warnings.append(
+                    warnings_append(
                         ConfigValidationWarning(
                             message=f"'ignore_issues[{i}]' must be a string or mapping, got {type(entry).__name__}",
                             source=source,
@@ -472,7 +509,7 @@ def validate_config(
     output = data.get("output")
     if output is not None:
         if not isinstance(output, dict):
-            warnings.append(
+            warnings_append(
                 ConfigValidationWarning(
                     message=f"'output' must be a mapping, got {type(output).__name__}",
                     source=source,
@@ -489,14 +526,14 @@ def validate_config(
                         key=f"output.{key}",
                         suggestion=suggestion,
                     )
-                    warnings.append(warning)
+                    warnings_append(warning)
                     _log_warning(warning)
 
     # Validate scanners section
     scanners = data.get("scanners")
     if scanners is not None:
         if not isinstance(scanners, dict):
-            warnings.append(
+            warnings_append(
                 ConfigValidationWarning(
                     message=f"'scanners' must be a mapping, got {type(scanners).__name__}",
                     source=source,
@@ -514,14 +551,14 @@ def validate_config(
                         key=f"scanners.{domain}",
                         suggestion=suggestion,
                     )
-                    warnings.append(warning)
+                    warnings_append(warning)
                     _log_warning(warning)
 
                 if isinstance(domain_config, dict):
                     # Validate enabled type
                     enabled = domain_config.get("enabled")
                     if enabled is not None and not isinstance(enabled, bool):
-                        warnings.append(
+                        warnings_append(
                             ConfigValidationWarning(
                                 message=f"'scanners.{domain}.enabled' must be a boolean",
                                 source=source,
@@ -532,7 +569,7 @@ def validate_config(
                     # Validate plugin type
                     plugin = domain_config.get("plugin")
                     if plugin is not None and not isinstance(plugin, str):
-                        warnings.append(
+                        warnings_append(
                             ConfigValidationWarning(
                                 message=f"'scanners.{domain}.plugin' must be a string",
                                 source=source,
@@ -546,7 +583,7 @@ def validate_config(
     pipeline = data.get("pipeline")
     if pipeline is not None:
         if not isinstance(pipeline, dict):
-            warnings.append(
+            warnings_append(
                 ConfigValidationWarning(
                     message=f"'pipeline' must be a mapping, got {type(pipeline).__name__}",
                     source=source,
@@ -563,13 +600,13 @@ def validate_config(
                         key=f"pipeline.{key}",
                         suggestion=suggestion,
                     )
-                    warnings.append(warning)
+                    warnings_append(warning)
                     _log_warning(warning)
 
             # Validate enrichers is a list
             enrichers = pipeline.get("enrichers")
             if enrichers is not None and not isinstance(enrichers, list):
-                warnings.append(
+                warnings_append(
                     ConfigValidationWarning(
                         message="'pipeline.enrichers' must be a list",
                         source=source,
@@ -580,7 +617,7 @@ def validate_config(
             # Validate max_workers is an integer
             max_workers = pipeline.get("max_workers")
             if max_workers is not None and not isinstance(max_workers, int):
-                warnings.append(
+                warnings_append(
                     ConfigValidationWarning(
                         message="'pipeline.max_workers' must be an integer",
                         source=source,
@@ -612,13 +649,13 @@ def validate_config(
                                 key=f"pipeline.{domain}.{key}",
                                 suggestion=suggestion,
                             )
-                            warnings.append(warning)
+                            warnings_append(warning)
                             _log_warning(warning)
 
                     # Check tools is specified when enabled
                     tools = domain_config.get("tools")
                     if is_enabled and tools is None:
-                        warnings.append(
+                        warnings_append(
                             ConfigValidationWarning(
                                 message=f"'pipeline.{domain}.tools' is required when {domain} is enabled",
                                 source=source,
@@ -626,7 +663,7 @@ def validate_config(
                             )
                         )
                     elif tools is not None and not isinstance(tools, list):
-                        warnings.append(
+                        warnings_append(
                             ConfigValidationWarning(
                                 message=f"'pipeline.{domain}.tools' must be a list",
                                 source=source,
@@ -640,7 +677,7 @@ def validate_config(
                         if threshold is not None and not isinstance(
                             threshold, (int, float)
                         ):
-                            warnings.append(
+                            warnings_append(
                                 ConfigValidationWarning(
                                     message="'pipeline.coverage.threshold' must be a number",
                                     source=source,
@@ -651,7 +688,7 @@ def validate_config(
                     # Validate exclude is a list (if present in domain config)
                     exclude = domain_config.get("exclude")
                     if exclude is not None and not isinstance(exclude, list):
-                        warnings.append(
+                        warnings_append(
                             ConfigValidationWarning(
                                 message=f"'pipeline.{domain}.exclude' must be a list",
                                 source=source,
@@ -662,7 +699,7 @@ def validate_config(
                     # Validate command, pre_command, and post_command (all domains)
                     cmd = domain_config.get("command")
                     if cmd is not None and not isinstance(cmd, str):
-                        warnings.append(
+                        warnings_append(
                             ConfigValidationWarning(
                                 message=f"'pipeline.{domain}.command' must be a string",
                                 source=source,
@@ -671,7 +708,7 @@ def validate_config(
                         )
                     pre_cmd = domain_config.get("pre_command")
                     if pre_cmd is not None and not isinstance(pre_cmd, str):
-                        warnings.append(
+                        warnings_append(
                             ConfigValidationWarning(
                                 message=f"'pipeline.{domain}.pre_command' must be a string",
                                 source=source,
@@ -680,7 +717,7 @@ def validate_config(
                         )
                     post_cmd = domain_config.get("post_command")
                     if post_cmd is not None and not isinstance(post_cmd, str):
-                        warnings.append(
+                        warnings_append(
                             ConfigValidationWarning(
                                 message=f"'pipeline.{domain}.post_command' must be a string",
                                 source=source,
@@ -700,14 +737,14 @@ def validate_config(
                             key=f"pipeline.security.{key}",
                             suggestion=suggestion,
                         )
-                        warnings.append(warning)
+                        warnings_append(warning)
                         _log_warning(warning)
 
                 # Validate tools is a list of dicts with name and domains
                 tools = security_config.get("tools")
                 if tools is not None:
                     if not isinstance(tools, list):
-                        warnings.append(
+                        warnings_append(
                             ConfigValidationWarning(
                                 message="'pipeline.security.tools' must be a list",
                                 source=source,
@@ -718,7 +755,7 @@ def validate_config(
                         for i, tool in enumerate(tools):
                             if isinstance(tool, dict):
                                 if "name" not in tool:
-                                    warnings.append(
+                                    warnings_append(
                                         ConfigValidationWarning(
                                             message=f"'pipeline.security.tools[{i}]' must have a 'name' field",
                                             source=source,
@@ -729,7 +766,7 @@ def validate_config(
                 # Validate exclude is a list (if present in security config)
                 exclude = security_config.get("exclude")
                 if exclude is not None and not isinstance(exclude, list):
-                    warnings.append(
+                    warnings_append(
                         ConfigValidationWarning(
                             message="'pipeline.security.exclude' must be a list",
                             source=source,
@@ -749,13 +786,13 @@ def validate_config(
                             key=f"pipeline.duplication.{key}",
                             suggestion=suggestion,
                         )
-                        warnings.append(warning)
+                        warnings_append(warning)
                         _log_warning(warning)
 
                 # Validate threshold is a number
                 threshold = duplication_config.get("threshold")
                 if threshold is not None and not isinstance(threshold, (int, float)):
-                    warnings.append(
+                    warnings_append(
                         ConfigValidationWarning(
                             message="'pipeline.duplication.threshold' must be a number",
                             source=source,
@@ -766,7 +803,7 @@ def validate_config(
                 # Validate exclude is a list
                 exclude = duplication_config.get("exclude")
                 if exclude is not None and not isinstance(exclude, list):
-                    warnings.append(
+                    warnings_append(
                         ConfigValidationWarning(
                             message="'pipeline.duplication.exclude' must be a list",
                             source=source,
@@ -791,7 +828,7 @@ def validate_config(
             )
 
             if coverage_enabled and not testing_enabled:
-                warnings.append(
+                warnings_append(
                     ConfigValidationWarning(
                         message=(
                             "Coverage requires testing to be enabled. Testing produces the coverage "
@@ -806,7 +843,7 @@ def validate_config(
     ai = data.get("ai")
     if ai is not None:
         if not isinstance(ai, dict):
-            warnings.append(
+            warnings_append(
                 ConfigValidationWarning(
                     message=f"'ai' must be a mapping, got {type(ai).__name__}",
                     source=source,
@@ -823,13 +860,13 @@ def validate_config(
                         key=f"ai.{key}",
                         suggestion=suggestion,
                     )
-                    warnings.append(warning)
+                    warnings_append(warning)
                     _log_warning(warning)
 
             # Validate enabled type
             enabled = ai.get("enabled")
             if enabled is not None and not isinstance(enabled, bool):
-                warnings.append(
+                warnings_append(
                     ConfigValidationWarning(
                         message="'ai.enabled' must be a boolean",
                         source=source,
@@ -841,7 +878,7 @@ def validate_config(
             provider = ai.get("provider")
             if provider is not None:
                 if not isinstance(provider, str):
-                    warnings.append(
+                    warnings_append(
                         ConfigValidationWarning(
                             message="'ai.provider' must be a string",
                             source=source,
@@ -856,13 +893,13 @@ def validate_config(
                         key="ai.provider",
                         suggestion=suggestion,
                     )
-                    warnings.append(warning)
+                    warnings_append(warning)
                     _log_warning(warning)
 
             # Validate send_code_snippets type
             send_code = ai.get("send_code_snippets")
             if send_code is not None and not isinstance(send_code, bool):
-                warnings.append(
+                warnings_append(
                     ConfigValidationWarning(
                         message="'ai.send_code_snippets' must be a boolean",
                         source=source,
@@ -873,7 +910,7 @@ def validate_config(
             # Validate cache_enabled type
             cache_enabled = ai.get("cache_enabled")
             if cache_enabled is not None and not isinstance(cache_enabled, bool):
-                warnings.append(
+                warnings_append(
                     ConfigValidationWarning(
                         message="'ai.cache_enabled' must be a boolean",
                         source=source,
@@ -884,7 +921,7 @@ def validate_config(
             # Validate temperature is a number
             temperature = ai.get("temperature")
             if temperature is not None and not isinstance(temperature, (int, float)):
-                warnings.append(
+                warnings_append(
                     ConfigValidationWarning(
                         message="'ai.temperature' must be a number",
                         source=source,
@@ -895,7 +932,7 @@ def validate_config(
             # Validate max_tokens is an integer
             max_tokens = ai.get("max_tokens")
             if max_tokens is not None and not isinstance(max_tokens, int):
-                warnings.append(
+                warnings_append(
                     ConfigValidationWarning(
                         message="'ai.max_tokens' must be an integer",
                         source=source,
@@ -906,17 +943,26 @@ def validate_config(
     return warnings
 
 
-def _suggest_key(invalid_key: str, valid_keys: Set[str]) -> Optional[str]:
+def _suggest_key(invalid_key: str, valid_keys: AbstractSet[str]) -> Optional[str]:
     """Suggest a valid key for a potential typo.
 
     Args:
         invalid_key: The invalid key entered.
-        valid_keys: Set of valid keys.
+        valid_keys: Set (or frozenset) of valid keys.
 
     Returns:
         Closest matching valid key, or None if no good match.
     """
-    matches = get_close_matches(invalid_key, list(valid_keys), n=1, cutoff=0.6)
+    if not isinstance(valid_keys, frozenset):
+        valid_keys = frozenset(valid_keys)
+    return _closest_key(invalid_key, valid_keys)
+
+
+@functools.lru_cache(maxsize=256)
+def _closest_key(invalid_key: str, valid_keys: FrozenSet[str]) -> Optional[str]:
+    """Memoized fuzzy match behind _suggest_key."""
+    # get_close_matches only iterates the candidates, so no list copy is needed
+    matches = get_close_matches(invalid_key, valid_keys, n=1, cutoff=0.6)
     return matches[0] if matches else None
 
 
@@ -953,10 +999,14 @@ def validate_config_file(config_path: Path) -> Tuple[bool, List[ConfigValidation
         )
         return False, issues
 
-    # Try to parse YAML
+    # Try to parse YAML (PyYAML is imported lazily to keep it off the
+    # CLI startup path)
+    import yaml
+
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     try:
-        with open(config_path, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        data = yaml.load(config_path.read_bytes(), Loader=loader)
     except yaml.YAMLError as e:
         # Extract line number from YAML error if available
         error_msg = f"Invalid YAML syntax: {e}"
@@ -988,16 +1038,7 @@ def validate_config_file(config_path: Path) -> Tuple[bool, List[ConfigValidation
     for warning in warnings:
         # Determine severity based on message content
         # Type mismatches, invalid values, and dependency errors are errors
-        is_error = any(
-            phrase in warning.message
-            for phrase in [
-                "must be a",
-                "Invalid severity",
-                "Invalid value",
-                "Config must be",
-                "Coverage requires testing",  # Coverage depends on testing
-            ]
-        )
+        is_error = any(phrase in warning.message for phrase in _ERROR_PHRASES)
 
         issues.append(
             ConfigValidationIssue(
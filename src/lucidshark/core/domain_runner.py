@@ -6,9 +6,25 @@ across both CLI and MCP interfaces.
 
 from __future__ import annotations
 
+import functools
+import operator
 import subprocess
+from dataclasses import replace
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
 
 if TYPE_CHECKING:
     from lucidshark.core.models import ToolDomain
@@ -21,76 +37,126 @@ from lucidshark.core.streaming import StreamEvent, StreamHandler, StreamType
 LOGGER = get_logger(__name__)
 
 # Plugin to supported languages mapping
-PLUGIN_LANGUAGES: Dict[str, List[str]] = {
-    # Linters
-    "ruff": ["python"],
-    "eslint": ["javascript", "typescript"],
-    "biome": ["javascript", "typescript"],
-    "clippy": ["rust"],
-    "golangci_lint": ["go"],
-    "checkstyle": ["java"],
-    "pmd": ["java"],
-    # Type checkers
-    "mypy": ["python"],
-    "pyright": ["python"],
-    "typescript": ["typescript"],
-    "spotbugs": ["java"],
-    "cargo_check": ["rust"],
-    "go_vet": ["go"],
-    # Test runners
-    "pytest": ["python"],
-    "jest": ["javascript", "typescript"],
-    "vitest": ["javascript", "typescript"],
-    "karma": ["javascript", "typescript"],
-    "playwright": ["javascript", "typescript"],
-    "maven": ["java", "kotlin"],
-    "cargo": ["rust"],
-    "go_test": ["go"],
-    # Coverage
-    "coverage_py": ["python"],
-    "istanbul": ["javascript", "typescript"],
-    "vitest_coverage": ["javascript", "typescript"],
-    "jacoco": ["java", "kotlin"],
-    "tarpaulin": ["rust"],
-    "go_cover": ["go"],
-    # Duplication detection
-    "duplo": [
-        "python",
-        "rust",
-        "java",
-        "javascript",
-        "typescript",
-        "c",
-        "c++",
-        "csharp",
-        "go",
-        "ruby",
-    ],
-    # Formatters
-    "ruff_format": ["python"],
-    "prettier": ["javascript", "typescript"],
-    "rustfmt": ["rust"],
-    "google_java_format": ["java"],
-    "gofmt": ["go"],
+PLUGIN_LANGUAGES: Mapping[str, FrozenSet[str]] = MappingProxyType(
+    {
+        # Linters
+        "ruff": frozenset({"python"}),
+        "eslint": frozenset({"javascript", "typescript"}),
+        "biome": frozenset({"javascript", "typescript"}),
+        "clippy": frozenset({"rust"}),
+        "golangci_lint": frozenset({"go"}),
+        "checkstyle": frozenset({"java"}),
+        "pmd": frozenset({"java"}),
+        # Type checkers
+        "mypy": frozenset({"python"}),
+        "pyright": frozenset({"python"}),
+        "typescript": frozenset({"typescript"}),
+        "spotbugs": frozenset({"java"}),
+        "cargo_check": frozenset({"rust"}),
+        "go_vet": frozenset({"go"}),
+        # Test runners
+        "pytest": frozenset({"python"}),
+        "jest": frozenset({"javascript", "typescript"}),
+        "vitest": frozenset({"javascript", "typescript"}),
+        "karma": frozenset({"javascript", "typescript"}),
+        "playwright": frozenset({"javascript", "typescript"}),
+        "maven": frozenset({"java", "kotlin"}),
+        "cargo": frozenset({"rust"}),
+        "go_test": frozenset({"go"}),
+        # Coverage
+        "coverage_py": frozenset({"python"}),
+        "istanbul": frozenset({"javascript", "typescript"}),
+        "vitest_coverage": frozenset({"javascript", "typescript"}),
+        "jacoco": frozenset({"java", "kotlin"}),
+        "tarpaulin": frozenset({"rust"}),
+        "go_cover": frozenset({"go"}),
+        # Duplication detection
+        "duplo": frozenset(
+            {
+                "python",
+                "rust",
+                "java",
+                "javascript",
+                "typescript",
+                "c",
+                "c++",
+                "csharp",
+                "go",
+                "ruby",
+            }
+        ),
+        # Formatters
+        "ruff_format": frozenset({"python"}),
+        "prettier": frozenset({"javascript", "typescript"}),
+        "rustfmt": frozenset({"rust"}),
+        "google_java_format": frozenset({"java"}),
+        "gofmt": frozenset({"go"}),
+    }
+)
+
+
+def _invert_plugin_languages() -> Dict[str, FrozenSet[str]]:
+    """Build the language -> plugin names index from PLUGIN_LANGUAGES."""
+    index: Dict[str, Set[str]] = {}
+    for plugin, languages in PLUGIN_LANGUAGES.items():
+        for language in languages:
+            index.setdefault(language.lower(), set()).add(plugin)
+    return {language: frozenset(names) for language, names in index.items()}
+
+
+# Language to supporting plugin names (reverse of PLUGIN_LANGUAGES)
+LANGUAGE_PLUGINS: Dict[str, FrozenSet[str]] = _invert_plugin_languages()
+
+# Plugins restricted to specific languages; all others are language-agnostic
+_LANGUAGE_RESTRICTED_PLUGINS: FrozenSet[str] = frozenset(
+    name for name, languages in PLUGIN_LANGUAGES.items() if languages
+)
+
+# Default domains for most languages - use specific security domains
+# "sast" for static analysis, "sca" for dependency scanning
+_DEFAULT_DOMAINS: Tuple[str, ...] = ("linting", "sast", "sca")
+
+# Languages with full toolchain support also get checks, tests and formatting
+_TOOLCHAIN_DOMAINS: Tuple[str, ...] = _DEFAULT_DOMAINS + (
+    "type_checking",
+    "testing",
+    "coverage",
+    "formatting",
+)
+
+# Language to domains mapping; languages not listed get _DEFAULT_DOMAINS
+LANGUAGE_DOMAINS: Dict[str, Tuple[str, ...]] = {
+    "python": _TOOLCHAIN_DOMAINS,
+    "javascript": _TOOLCHAIN_DOMAINS,
+    "typescript": _TOOLCHAIN_DOMAINS,
+    "java": _TOOLCHAIN_DOMAINS,
+    "kotlin": _TOOLCHAIN_DOMAINS,
+    "rust": _TOOLCHAIN_DOMAINS,
+    "go": _TOOLCHAIN_DOMAINS,
+    "terraform": ("iac",),
+    "yaml": ("iac", "sast"),
+    "json": ("iac", "sast"),
 }
 
 # File extension to language mapping
-EXTENSION_LANGUAGE: Dict[str, str] = {
-    ".py": "python",
-    ".pyi": "python",
-    ".js": "javascript",
-    ".jsx": "javascript",
-    ".ts": "typescript",
-    ".tsx": "typescript",
-    ".java": "java",
-    ".go": "go",
-    ".rs": "rust",
-    ".rb": "ruby",
-    ".tf": "terraform",
-    ".yaml": "yaml",
-    ".yml": "yaml",
-    ".json": "json",
-}
+EXTENSION_LANGUAGE: Mapping[str, str] = MappingProxyType(
+    {
+        ".py": "python",
+        ".pyi": "python",
+        ".js": "javascript",
+        ".jsx": "javascript",
+        ".ts": "typescript",
+        ".tsx": "typescript",
+        ".java": "java",
+        ".go": "go",
+        ".rs": "rust",
+        ".rb": "ruby",
+        ".tf": "terraform",
+        ".yaml": "yaml",
+        ".yml": "yaml",
+        ".json": "json",
+    }
+)
 
 
 def filter_plugins_by_language(
@@ -109,18 +175,17 @@ def filter_plugins_by_language(
     if not project_languages:
         return plugins
 
-    filtered = {}
-    for name, cls in plugins.items():
-        supported_langs = PLUGIN_LANGUAGES.get(name, [])
-        # Include plugin if it supports any of the project languages
-        # or if the plugin has no language restrictions
-        if not supported_langs or any(
-            lang.lower() in [sl.lower() for sl in supported_langs]
-            for lang in project_languages
-        ):
-            filtered[name] = cls
+    # Union the supporting plugins of each requested language once, then
+    # keep matching plugins plus those without language restrictions
+    wanted: Set[str] = set()
+    for lang in project_languages:
+        wanted.update(LANGUAGE_PLUGINS.get(lang.lower(), ()))
 
-    return filtered
+    return {
+        name: cls
+        for name, cls in plugins.items()
+        if name in wanted or name not in _LANGUAGE_RESTRICTED_PLUGINS
+    }
 
 
 def filter_plugins_by_config(
@@ -192,8 +257,21 @@ def detect_language(path: Path) -> str:
     Returns:
         Language name or "unknown".
     """
-    suffix = path.suffix.lower()
-    return EXTENSION_LANGUAGE.get(suffix, "unknown")
+    return _language_for_suffix(path.suffix)
+
+
+@functools.lru_cache(maxsize=64)
+def _language_for_suffix(suffix: str) -> str:
+    """Resolve (and cache) the language for a raw file suffix.
+
+    Scans see thousands of files but only a few dozen distinct suffixes,
+    so the cache is keyed on the suffix string rather than the path.
+    """
+    # Most suffixes are already lowercase; only lowercase on a miss
+    language = EXTENSION_LANGUAGE.get(suffix)
+    if language is None:
+        language = EXTENSION_LANGUAGE.get(suffix.lower(), "unknown")
+    return language
 
 
 def get_domains_for_language(language: str) -> List[str]:
@@ -203,28 +281,9 @@ def get_domains_for_language(language: str) -> List[str]:
         language: Language name.
 
     Returns:
-        List of domain names.
+        List of domain names (a fresh list the caller may modify).
     """
-    # Default domains for most languages - use specific security domains
-    # "sast" for static analysis, "sca" for dependency scanning
-    domains = ["linting", "sast", "sca"]
-
-    if language == "python":
-        domains.extend(["type_checking", "testing", "coverage", "formatting"])
-    elif language in ("javascript", "typescript"):
-        domains.extend(["type_checking", "testing", "coverage", "formatting"])
-    elif language in ("java", "kotlin"):
-        domains.extend(["type_checking", "testing", "coverage", "formatting"])
-    elif language == "rust":
-        domains.extend(["type_checking", "testing", "coverage", "formatting"])
-    elif language == "go":
-        domains.extend(["type_checking", "testing", "coverage", "formatting"])
-    elif language == "terraform":
-        domains = ["iac"]
-    elif language in ("yaml", "json"):
-        domains = ["iac", "sast"]
-
-    return domains
+    return list(LANGUAGE_DOMAINS.get(language, _DEFAULT_DOMAINS))
 
 
 def _has_vitest_config(project_root: Path) -> bool:
@@ -382,13 +441,14 @@ class DomainRunner:
         """
         if not domain_exclude_patterns:
             return context
-        from dataclasses import replace
 
         from lucidshark.config.ignore import IgnorePatterns
 
         domain_patterns = IgnorePatterns(
             domain_exclude_patterns, source="domain-config"
         )
+        # IgnorePatterns.merge is cached, so every domain of every scan
+        # sharing the same rules reuses one merged instance
         merged = IgnorePatterns.merge(context.ignore_patterns, domain_patterns)
         return replace(context, ignore_patterns=merged)
 
@@ -1377,34 +1437,49 @@ class DomainRunner:
         return issues
 
 
+# Severity rank for fail_on thresholds (lower is more severe); severities
+# missing here, such as "info", never meet a known threshold
+_SEVERITY_RANK: Dict[str, int] = {
+    "critical": 0,
+    "high": 1,
+    "medium": 2,
+    "low": 3,
+}
+
+# Threshold name -> severities that meet it, so the check is a set probe
+_SEVERITIES_MEETING: Dict[str, FrozenSet[str]] = {
+    threshold: frozenset(
+        name for name, rank in _SEVERITY_RANK.items() if rank <= threshold_rank
+    )
+    for threshold, threshold_rank in _SEVERITY_RANK.items()
+}
+
+_issue_severity = operator.attrgetter("severity")
+
+
 def check_severity_threshold(
-    issues: List[UnifiedIssue],
+    issues: Iterable[UnifiedIssue],
     threshold: Optional[str],
 ) -> bool:
     """Check if any issues meet or exceed the severity threshold.
 
+    Stops at the first matching issue, so callers may pass a lazy iterable
+    to avoid materializing a filtered list.
+
     Args:
-        issues: List of issues to check.
+        issues: Issues to check.
         threshold: Severity threshold ('critical', 'high', 'medium', 'low').
 
     Returns:
         True if issues at or above threshold exist, False otherwise.
     """
-    if not threshold or not issues:
+    if not threshold:
         return False
 
-    threshold_order = {
-        "critical": 0,
-        "high": 1,
-        "medium": 2,
-        "low": 3,
-    }
-
-    threshold_level = threshold_order.get(threshold.lower(), 99)
-
-    for issue in issues:
-        issue_level = threshold_order.get(issue.severity.value, 99)
-        if issue_level <= threshold_level:
-            return True
-
-    return False
+    meeting = _SEVERITIES_MEETING.get(threshold.lower())
+    if meeting is None:
+        # Unknown thresholds match every issue
+        return next(iter(issues), None) is not None
+    # Severity is a str enum, so members match the plain string names.
+    # isdisjoint stops at the first hit and keeps the whole scan in C.
+    return not meeting.isdisjoint(map(_issue_severity, issues))
@@ -267,14 +267,12 @@ def filter_files_by_extension(
     if extensions is None:
         return files
 
-    # Normalize extensions to include the dot
-    normalized_extensions = set()
-    for ext in extensions:
-        if not ext.startswith("."):
-            ext = f".{ext}"
-        normalized_extensions.add(ext.lower())
-
-    return [f for f in files if f.suffix.lower() in normalized_extensions]
+    # Normalize extensions once to lowercase with a leading dot
+    allowed = frozenset(
+        (ext if ext.startswith(".") else f".{ext}").lower() for ext in extensions
+    )
+
+    return [f for f in files if f.suffix.lower() in allowed]
 
 
 def get_current_commit(project_root: Path, short: bool = True) -> Optional[str]:
@@ -6,8 +6,9 @@ based on user input and git status.
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
-from typing import List, Optional
+from typing import FrozenSet, List, Optional, Sequence
 
 from lucidshark.core.git import get_changed_files
 from lucidshark.core.logging import get_logger
@@ -90,3 +91,48 @@ def resolve_node_bin(project_root: Path, tool_name: str) -> Optional[Path]:
     if plain_path.exists():
         return plain_path
     return None
+
+
+def find_first_file(directory: Path, names: Sequence[str]) -> Optional[Path]:
+    """Find the first of several candidate files in a directory.
+
+    Lists the directory once with os.scandir instead of probing each
+    candidate with a separate stat call.
+
+    Args:
+        directory: Directory to search in.
+        names: Candidate file names in priority order.
+
+    Returns:
+        Path to the highest-priority file that exists, or None.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            found = {
+                entry.name
+                for entry in entries
+                if entry.name in names and entry.is_file()
+            }
+    except OSError:
+        return None
+
+    for name in names:
+        if name in found:
+            return directory / name
+    return None
+
+
+def list_dir_names(directory: Path) -> FrozenSet[str]:
+    """List the entry names of a directory with a single os.scandir call.
+
+    Args:
+        directory: Directory to list.
+
+    Returns:
+        Names of all entries, or an empty set if the directory is unreadable.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
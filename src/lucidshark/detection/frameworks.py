@@ -7,10 +7,14 @@ Detects web frameworks, testing frameworks, and libraries by analyzing:
 
 from __future__ import annotations
 
+import functools
 import json
+import os
 import re
 from pathlib import Path
-from typing import Dict, Optional, Set
+from typing import Callable, Dict, Optional, Set, Tuple
+
+from lucidshark.core.paths import list_dir_names
 
 # Python frameworks and their package names
 PYTHON_FRAMEWORKS: Dict[str, str] = {
@@ -113,6 +117,59 @@ RUST_TEST_FRAMEWORKS: Dict[str, Optional[str]] = {
 }
 
 
+# Manifest and config files read by detection, looked up in a single
+# directory listing rather than one stat() per candidate
+_REQUIREMENTS_FILES = (
+    "requirements.txt",
+    "requirements-dev.txt",
+    "requirements_dev.txt",
+    "dev-requirements.txt",
+)
+_GRADLE_BUILD_FILES = ("build.gradle", "build.gradle.kts")
+_PYTEST_MARKER_FILES = ("pytest.ini", "conftest.py")
+_JEST_CONFIG_FILES = ("jest.config.js", "jest.config.ts", "jest.config.mjs")
+_MARKER_FILES = frozenset(
+    {
+        "pyproject.toml",
+        "package.json",
+        "pom.xml",
+        "Cargo.toml",
+        *_REQUIREMENTS_FILES,
+        *_GRADLE_BUILD_FILES,
+        *_PYTEST_MARKER_FILES,
+        *_JEST_CONFIG_FILES,
+    }
+)
+
+# Dependency manifest patterns, compiled once at import
+# Matches [table] and [[array-of-tables]] header lines; the name is captured
+_TOML_TABLE_HEADER_RE = re.compile(
+    r"^[ \t]*\[\[?([^\[\]]+)\]\]?[ \t]*(?:#.*)?$", re.MULTILINE
+)
+_DEPENDENCIES_ARRAY_RE = re.compile(r"dependencies\s*=\s*\[(.*?)\]", re.DOTALL)
+_POETRY_PACKAGE_RE = re.compile(r"^(\w[\w-]*)\s*=", re.MULTILINE)
+_QUOTED_PACKAGE_RE = re.compile(r'["\']([a-zA-Z][\w.-]*)')
+# Leading package name of each requirements line; comment ("#"), option
+# ("-r", "--index-url") and blank lines never start with a letter
+_REQUIREMENT_NAME_RE = re.compile(r"^[ \t]*([a-zA-Z][\w.-]*)", re.MULTILINE)
+_MAVEN_DEPENDENCY_RE = re.compile(r"<dependency>(.*?)</dependency>", re.DOTALL)
+_MAVEN_PARENT_RE = re.compile(r"<parent>(.*?)</parent>", re.DOTALL)
+_MAVEN_GROUP_RE = re.compile(r"<groupId>([^<]+)</groupId>")
+_MAVEN_ARTIFACT_RE = re.compile(r"<artifactId>([^<]+)</artifactId>")
+_GRADLE_CONFIGURATIONS = (
+    r"(?:implementation|api|compileOnly|runtimeOnly|testImplementation"
+    r"|testCompileOnly|testRuntimeOnly)"
+)
+_GRADLE_DEPENDENCY_RES = (
+    re.compile(_GRADLE_CONFIGURATIONS + r"\s*['\"]([^'\"]+)['\"]"),
+    re.compile(_GRADLE_CONFIGURATIONS + r"\s*\(['\"]([^'\"]+)['\"]\)"),
+)
+
+
+# (name, inode, mtime_ns, size) for each marker file present in a project root
+_MarkerSignature = Tuple[Tuple[str, int, int, int], ...]
+
+
 def detect_frameworks(project_root: Path) -> tuple[list[str], list[str]]:
     """Detect frameworks and test frameworks in a project.
 
@@ -122,11 +179,54 @@ def detect_frameworks(project_root: Path) -> tuple[list[str], list[str]]:
     Returns:
         Tuple of (frameworks, test_frameworks).
     """
+    frameworks, test_frameworks = _detect_frameworks_cached(
+        str(project_root), _marker_file_signature(project_root)
+    )
+    return list(frameworks), list(test_frameworks)
+
+
+def _marker_file_signature(project_root: Path) -> _MarkerSignature:
+    """Stat the manifest/config files present in the project root.
+
+    Args:
+        project_root: Project root directory.
+
+    Returns:
+        Sorted (name, inode, mtime_ns, size) tuples, one per marker file.
+    """
+    signature = []
+    for name in sorted(_MARKER_FILES.intersection(list_dir_names(project_root))):
+        try:
+            st = os.stat(project_root / name)
+        except OSError:
+            continue
+        signature.append((name, st.st_ino, st.st_mtime_ns, st.st_size))
+    return tuple(signature)
+
+
+@functools.lru_cache(maxsize=128)
+def _detect_frameworks_cached(
+    root: str, markers: _MarkerSignature
+) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Detect frameworks, cached on the root and its marker file stats.
+
+    Creating, deleting or editing any manifest changes ``markers`` and
+    therefore forces a fresh detection.
+
+    Args:
+        root: Project root directory.
+        markers: Signature from _marker_file_signature.
+
+    Returns:
+        Tuple of (frameworks, test_frameworks).
+    """
+    project_root = Path(root)
     frameworks = []
     test_frameworks = []
+    present = frozenset(name for name, *_ in markers)
 
     # Check Python dependencies
-    python_deps = _get_python_dependencies(project_root)
+    python_deps = _get_python_dependencies(project_root, present)
     for framework, package in PYTHON_FRAMEWORKS.items():
         if package in python_deps:
             frameworks.append(framework)
@@ -136,7 +236,7 @@ def detect_frameworks(project_root: Path) -> tuple[list[str], list[str]]:
             test_frameworks.append(framework)
 
     # Check JavaScript/TypeScript dependencies
-    js_deps = _get_js_dependencies(project_root)
+    js_deps = _get_js_dependencies(project_root, present)
     for framework, package in JS_FRAMEWORKS.items():
         if package in js_deps:
             frameworks.append(framework)
@@ -146,7 +246,7 @@ def detect_frameworks(project_root: Path) -> tuple[list[str], list[str]]:
             test_frameworks.append(framework)
 
     # Check Java dependencies
-    java_deps = _get_java_dependencies(project_root)
+    java_deps = _get_java_dependencies(project_root, present)
     for framework, identifiers in JAVA_FRAMEWORKS.items():
         if any(identifier in java_deps for identifier in identifiers):
             frameworks.append(framework)
@@ -156,7 +256,7 @@ def detect_frameworks(project_root: Path) -> tuple[list[str], list[str]]:
             test_frameworks.append(framework)
 
     # Check Rust dependencies
-    rust_deps = _get_rust_dependencies(project_root)
+    rust_deps = _get_rust_dependencies(project_root, present)
     for framework, crate_name in RUST_FRAMEWORKS.items():
         if crate_name in rust_deps:
             frameworks.append(framework)
@@ -166,31 +266,29 @@ def detect_frameworks(project_root: Path) -> tuple[list[str], list[str]]:
             test_frameworks.append(framework)
 
     # Rust always has built-in test support
-    if (project_root / "Cargo.toml").exists():
+    if "Cargo.toml" in present:
         if "built-in" not in test_frameworks:
             test_frameworks.append("built-in")
 
     # Check for pytest.ini or conftest.py as indicators
-    if (project_root / "pytest.ini").exists() or (
-        project_root / "conftest.py"
-    ).exists():
+    if not present.isdisjoint(_PYTEST_MARKER_FILES):
         if "pytest" not in test_frameworks:
             test_frameworks.append("pytest")
 
     # Check for jest.config.js
-    jest_configs = ["jest.config.js", "jest.config.ts", "jest.config.mjs"]
-    if any((project_root / cfg).exists() for cfg in jest_configs):
+    if not present.isdisjoint(_JEST_CONFIG_FILES):
         if "jest" not in test_frameworks:
             test_frameworks.append("jest")
 
-    return frameworks, test_frameworks
+    return tuple(frameworks), tuple(test_frameworks)
 
 
-def _get_python_dependencies(project_root: Path) -> set[str]:
+def _get_python_dependencies(project_root: Path, present: frozenset[str]) -> set[str]:
     """Extract Python dependencies from pyproject.toml or requirements.txt.
 
     Args:
         project_root: Project root directory.
+        present: Names of the entries in the project root.
 
     Returns:
         Set of package names (lowercase).
@@ -198,32 +296,19 @@ def _get_python_dependencies(project_root: Path) -> set[str]:
     deps = set()
 
     # Check pyproject.toml
-    pyproject = project_root / "pyproject.toml"
-    if pyproject.exists():
+    if "pyproject.toml" in present:
         try:
-            content = pyproject.read_text()
+            content = (project_root / "pyproject.toml").read_text()
             deps.update(_parse_pyproject_deps(content))
         except Exception:
             pass
 
-    # Check requirements.txt
-    requirements = project_root / "requirements.txt"
-    if requirements.exists():
-        try:
-            deps.update(_parse_requirements_txt(requirements.read_text()))
-        except Exception:
-            pass
-
-    # Check requirements-dev.txt or requirements_dev.txt
-    for dev_req in [
-        "requirements-dev.txt",
-        "requirements_dev.txt",
-        "dev-requirements.txt",
-    ]:
-        dev_requirements = project_root / dev_req
-        if dev_requirements.exists():
+    # Check requirements.txt and its dev variants
+    for requirements in _REQUIREMENTS_FILES:
+        if requirements in present:
             try:
-                deps.update(_parse_requirements_txt(dev_requirements.read_text()))
+                content = (project_root / requirements).read_text()
+                deps.update(_parse_requirements_txt(content))
             except Exception:
                 pass
 
@@ -239,38 +324,44 @@ def _parse_pyproject_deps(content: str) -> set[str]:
     Returns:
         Set of package names.
     """
-    deps = set()
+    deps: set[str] = set()
+
+    # re.split yields [preamble, name, body, name, body, ...]; each table body
+    # is handed to the extractor registered for its header, so no pattern
+    # scans more than the one section it applies to
+    parts = _TOML_TABLE_HEADER_RE.split(content)
+    for name, body in zip(parts[1::2], parts[2::2]):
+        name = name.strip()
+        parser = _PYPROJECT_SECTION_PARSERS.get(name)
+        if parser is not None:
+            deps.update(parser(body))
+        elif name.startswith("project.optional-dependencies"):
+            # Covers both the [project.optional-dependencies] table and
+            # per-group [project.optional-dependencies.<group>] headers
+            deps.update(_extract_package_names(body))
 
-    # Simple regex-based parsing for dependencies
-    # Matches: "package-name>=1.0" or "package-name[extra]>=1.0" etc.
-    # In dependencies array or optional-dependencies
+    return deps
 
-    # Find dependencies section
-    dep_section = re.search(r"dependencies\s*=\s*\[(.*?)\]", content, re.DOTALL)
-    if dep_section:
-        deps.update(_extract_package_names(dep_section.group(1)))
 
-    # Find optional-dependencies (all groups)
-    opt_deps = re.findall(
-        r"\[project\.optional-dependencies\.[^\]]+\]\s*\n([^\[]+)", content
-    )
-    for section in opt_deps:
-        deps.update(_extract_package_names(section))
+def _parse_project_table(body: str) -> set[str]:
+    """Extract the PEP 621 ``dependencies`` array from a [project] table body."""
+    dep_section = _DEPENDENCIES_ARRAY_RE.search(body)
+    if dep_section is None:
+        return set()
+    return _extract_package_names(dep_section.group(1))
 
-    # Also check [tool.poetry.dependencies] for Poetry projects
-    poetry_deps = re.search(
-        r"\[tool\.poetry\.dependencies\](.*?)(?=\[|$)", content, re.DOTALL
-    )
-    if poetry_deps:
-        # Poetry uses package = "version" format
-        package_matches = re.findall(
-            r"^(\w[\w-]*)\s*=", poetry_deps.group(1), re.MULTILINE
-        )
-        deps.update(
-            p.lower().replace("-", "_").replace("_", "-") for p in package_matches
-        )
 
-    return deps
+def _parse_poetry_dependencies_table(body: str) -> set[str]:
+    """Extract package names from a [tool.poetry.dependencies] table body."""
+    # Poetry uses package = "version" format
+    return {p.lower().replace("_", "-") for p in _POETRY_PACKAGE_RE.findall(body)}
+
+
+# pyproject.toml table name -> extractor for that table's body
+_PYPROJECT_SECTION_PARSERS: Dict[str, Callable[[str], set[str]]] = {
+    "project": _parse_project_table,
+    "tool.poetry.dependencies": _parse_poetry_dependencies_table,
+}
 
 
 def _extract_package_names(text: str) -> set[str]:
@@ -284,14 +375,11 @@ def _extract_package_names(text: str) -> set[str]:
     """
     deps = set()
 
-    # Match quoted strings like "fastapi>=0.100" or 'django[async]'
-    matches = re.findall(r'["\']([a-zA-Z][\w.-]*)', text)
-    for match in matches:
-        # Normalize: remove extras, convert to lowercase
-        package = re.sub(r"\[.*?\]", "", match).lower()
-        # Normalize underscores and hyphens
-        package = package.replace("_", "-")
-        deps.add(package)
+    # Match quoted strings like "fastapi>=0.100" or 'django[async]'; the
+    # name pattern stops before any extras, so only case and separators
+    # need normalizing
+    for match in _QUOTED_PACKAGE_RE.findall(text):
+        deps.add(match.lower().replace("_", "-"))
 
     return deps
 
@@ -305,38 +393,28 @@ def _parse_requirements_txt(content: str) -> set[str]:
     Returns:
         Set of package names.
     """
-    deps = set()
-
-    for line in content.splitlines():
-        line = line.strip()
-        # Skip comments and empty lines
-        if not line or line.startswith("#") or line.startswith("-"):
-            continue
+    # One findall over the whole file instead of a strip/match per line
+    return {
+        package.lower().replace("_", "-")
+        for package in _REQUIREMENT_NAME_RE.findall(content)
+    }
 
-        # Extract package name (before any version specifier)
-        match = re.match(r"^([a-zA-Z][\w.-]*)", line)
-        if match:
-            package = match.group(1).lower().replace("_", "-")
-            deps.add(package)
 
-    return deps
-
-
-def _get_js_dependencies(project_root: Path) -> set[str]:
+def _get_js_dependencies(project_root: Path, present: frozenset[str]) -> set[str]:
     """Extract JavaScript/TypeScript dependencies from package.json.
 
     Args:
         project_root: Project root directory.
+        present: Names of the entries in the project root.
 
     Returns:
         Set of package names.
     """
     deps: Set[str] = set()
 
-    package_json = project_root / "package.json"
-    if package_json.exists():
+    if "package.json" in present:
         try:
-            data = json.loads(package_json.read_text())
+            data = json.loads((project_root / "package.json").read_text())
 
             # Collect from all dependency types
             for dep_type in ["dependencies", "devDependencies", "peerDependencies"]:
@@ -348,11 +426,12 @@ def _get_js_dependencies(project_root: Path) -> set[str]:
     return deps
 
 
-def _get_java_dependencies(project_root: Path) -> Set[str]:
+def _get_java_dependencies(project_root: Path, present: frozenset[str]) -> Set[str]:
     """Extract Java dependencies from pom.xml or build.gradle.
 
     Args:
         project_root: Project root directory.
+        present: Names of the entries in the project root.
 
     Returns:
         Set of dependency identifiers (groupId:artifactId format or artifact names).
@@ -360,19 +439,18 @@ def _get_java_dependencies(project_root: Path) -> Set[str]:
     deps: Set[str] = set()
 
     # Check Maven pom.xml
-    pom_xml = project_root / "pom.xml"
-    if pom_xml.exists():
+    if "pom.xml" in present:
         try:
-            deps.update(_parse_maven_pom(pom_xml.read_text()))
+            deps.update(_parse_maven_pom((project_root / "pom.xml").read_text()))
         except Exception:
             pass
 
     # Check Gradle build files
-    for gradle_file in ["build.gradle", "build.gradle.kts"]:
-        gradle_path = project_root / gradle_file
-        if gradle_path.exists():
+    for gradle_file in _GRADLE_BUILD_FILES:
+        if gradle_file in present:
             try:
-                deps.update(_parse_gradle_build(gradle_path.read_text()))
+                content = (project_root / gradle_file).read_text()
+                deps.update(_parse_gradle_build(content))
             except Exception:
                 pass
 
@@ -395,15 +473,11 @@ def _parse_maven_pom(content: str) -> Set[str]:
     # This is a simplified parser - for full accuracy, use XML parsing
 
     # Find all dependencies
-    dep_pattern = r"<dependency>(.*?)</dependency>"
-    group_pattern = r"<groupId>([^<]+)</groupId>"
-    artifact_pattern = r"<artifactId>([^<]+)</artifactId>"
-
-    for dep_match in re.finditer(dep_pattern, content, re.DOTALL):
+    for dep_match in _MAVEN_DEPENDENCY_RE.finditer(content):
         dep_content = dep_match.group(1)
 
-        group_match = re.search(group_pattern, dep_content)
-        artifact_match = re.search(artifact_pattern, dep_content)
+        group_match = _MAVEN_GROUP_RE.search(dep_content)
+        artifact_match = _MAVEN_ARTIFACT_RE.search(dep_content)
 
         if group_match and artifact_match:
             group_id = group_match.group(1).strip()
@@ -412,12 +486,11 @@ def _parse_maven_pom(content: str) -> Set[str]:
             deps.add(artifact_id)  # Also add just artifact for simpler matching
 
     # Check parent for Spring Boot etc.
-    parent_pattern = r"<parent>(.*?)</parent>"
-    parent_match = re.search(parent_pattern, content, re.DOTALL)
+    parent_match = _MAVEN_PARENT_RE.search(content)
     if parent_match:
         parent_content = parent_match.group(1)
-        group_match = re.search(group_pattern, parent_content)
-        artifact_match = re.search(artifact_pattern, parent_content)
+        group_match = _MAVEN_GROUP_RE.search(parent_content)
+        artifact_match = _MAVEN_ARTIFACT_RE.search(parent_content)
         if group_match and artifact_match:
             group_id = group_match.group(1).strip()
             artifact_id = artifact_match.group(1).strip()
@@ -443,14 +516,8 @@ def _parse_gradle_build(content: str) -> Set[str]:
     # implementation("org.springframework.boot:spring-boot-starter-web")
     # testImplementation 'junit:junit:4.13.2'
 
-    # Pattern for quoted dependencies
-    dep_patterns = [
-        r"(?:implementation|api|compileOnly|runtimeOnly|testImplementation|testCompileOnly|testRuntimeOnly)\s*['\"]([^'\"]+)['\"]",
-        r"(?:implementation|api|compileOnly|runtimeOnly|testImplementation|testCompileOnly|testRuntimeOnly)\s*\(['\"]([^'\"]+)['\"]\)",
-    ]
-
-    for pattern in dep_patterns:
-        for match in re.finditer(pattern, content):
+    for pattern in _GRADLE_DEPENDENCY_RES:
+        for match in pattern.finditer(content):
             dep = match.group(1)
             # Format: group:artifact:version or group:artifact
             parts = dep.split(":")
@@ -469,21 +536,21 @@ def _parse_gradle_build(content: str) -> Set[str]:
     return deps
 
 
-def _get_rust_dependencies(project_root: Path) -> set[str]:
+def _get_rust_dependencies(project_root: Path, present: frozenset[str]) -> set[str]:
     """Extract Rust dependencies from Cargo.toml.
 
     Args:
         project_root: Project root directory.
+        present: Names of the entries in the project root.
 
     Returns:
         Set of crate names (lowercase).
     """
     deps: Set[str] = set()
 
-    cargo_toml = project_root / "Cargo.toml"
-    if cargo_toml.exists():
+    if "Cargo.toml" in present:
         try:
-            content = cargo_toml.read_text()
+            content = (project_root / "Cargo.toml").read_text()
             deps.update(_parse_cargo_toml_deps(content))
         except Exception:
             pass
@@ -8,36 +8,42 @@ Detects programming languages in a project by analyzing:
 
 from __future__ import annotations
 
+import functools
+import os
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
-
-# Directories to skip during detection
-SKIP_DIRS = {
-    ".git",
-    ".svn",
-    ".hg",
-    "node_modules",
-    "__pycache__",
-    ".venv",
-    "venv",
-    ".env",
-    "env",
-    ".tox",
-    ".pytest_cache",
-    ".mypy_cache",
-    ".ruff_cache",
-    "dist",
-    "build",
-    "target",
-    "vendor",
-    ".next",
-    ".nuxt",
-    "coverage",
-    ".coverage",
-    "htmlcov",
-}
+from typing import Callable, Iterator, Optional
+
+from lucidshark.core.paths import list_dir_names
+
+# Directories to skip during detection (hidden directories are always skipped)
+SKIP_DIRS: frozenset[str] = frozenset(
+    {
+        ".git",
+        ".svn",
+        ".hg",
+        "node_modules",
+        "__pycache__",
+        ".venv",
+        "venv",
+        ".env",
+        "env",
+        ".tox",
+        ".pytest_cache",
+        ".mypy_cache",
+        ".ruff_cache",
+        "dist",
+        "build",
+        "target",
+        "vendor",
+        ".next",
+        ".nuxt",
+        "coverage",
+        ".coverage",
+        "htmlcov",
+    }
+)
 
 # File extension to language mapping
 EXTENSION_MAP = {
@@ -70,6 +76,10 @@ EXTENSION_MAP = {
     ".hpp": "cpp",
 }
 
+# EXTENSION_MAP keyed without the leading dot, for lookups on the text
+# after a file name's last "."
+_EXTENSION_LANGUAGES = {ext[1:]: lang for ext, lang in EXTENSION_MAP.items()}
+
 # Marker files that indicate a language
 MARKER_FILES = {
     "python": [
@@ -89,7 +99,36 @@ MARKER_FILES = {
 }
 
 
-@dataclass
+# Reverse index of MARKER_FILES: marker file name -> language
+_MARKER_LANGUAGES = {
+    marker: lang for lang, markers in MARKER_FILES.items() for marker in markers
+}
+
+# Marker/config files are read at most this far; the version fields the
+# _detect_*_version helpers look for sit near the top, and a pathological
+# multi-megabyte manifest should not be pulled wholly into memory
+_MAX_MARKER_FILE_CHARS = 1 << 20
+
+# Version patterns for the _detect_*_version helpers, compiled once at import
+_REQUIRES_PYTHON_RE = re.compile(r'requires-python\s*=\s*["\']([^"\']+)["\']')
+_MAJOR_MINOR_RE = re.compile(r"(\d+\.\d+)")
+_VERSION_PREFIX_RE = re.compile(r"^[\^~>=<]+")
+_GO_DIRECTIVE_RE = re.compile(r"^go\s+(\d+\.\d+)", re.MULTILINE)
+_RUST_EDITION_RE = re.compile(r'edition\s*=\s*["\'](\d+)["\']')
+_MAVEN_JAVA_VERSION_RE = re.compile(
+    r"<(?:maven\.compiler\.source|java\.version)>(\d+)</"
+)
+_MAVEN_RELEASE_RE = re.compile(r"<release>(\d+)</release>")
+_GRADLE_COMPATIBILITY_RE = re.compile(
+    r"(?:source|target)Compatibility\s*=\s*['\"]?(?:JavaVersion\.VERSION_)?(\d+)"
+)
+_GRADLE_TOOLCHAIN_RE = re.compile(
+    r"languageVersion\.set\s*\(\s*JavaLanguageVersion\.of\s*\(\s*(\d+)\s*\)"
+)
+_LEADING_NUMBER_RE = re.compile(r"(\d+)")
+
+
+@dataclass(slots=True, frozen=True)
 class LanguageInfo:
     """Information about a detected language."""
 
@@ -115,19 +154,25 @@ def detect_languages(project_root: Path) -> list[LanguageInfo]:
     # Count files by extension
     extension_counts: dict[str, int] = {}
 
-    for file_path in _walk_files(project_root):
-        ext = file_path.suffix.lower()
-        if ext in EXTENSION_MAP:
-            lang = EXTENSION_MAP[ext]
+    # Tally straight off the directory entries; no Path list is built
+    for entry in _iter_file_entries(str(project_root)):
+        # rpartition avoids a PurePath/splitext per file; an empty stem
+        # means a dotfile such as ".py", which has no extension
+        stem, _, ext = entry.name.rpartition(".")
+        if not stem:
+            continue
+        lang = _EXTENSION_LANGUAGES.get(ext.lower())
+        if lang is not None:
             extension_counts[lang] = extension_counts.get(lang, 0) + 1
 
-    # Check for marker files
-    marker_languages = set()
-    for lang, markers in MARKER_FILES.items():
-        for marker in markers:
-            if (project_root / marker).exists():
-                marker_languages.add(lang)
-                break
+    # Marker files only matter for languages no source file revealed; when
+    # any remain, map the root listing through the marker index in one pass
+    marker_languages: set[str] = set()
+    if not MARKER_FILES.keys() <= extension_counts.keys():
+        root_names = list_dir_names(project_root)
+        marker_languages = {
+            _MARKER_LANGUAGES[name] for name in _MARKER_LANGUAGES.keys() & root_names
+        }
 
     # Combine results
     all_languages = set(extension_counts.keys()) | marker_languages
@@ -148,34 +193,88 @@ def detect_languages(project_root: Path) -> list[LanguageInfo]:
     return results
 
 
-def _walk_files(root: Path, max_depth: int = 10) -> list[Path]:
-    """Walk directory tree yielding files.
+def _iter_file_entries(
+    path: str, max_depth: int = 10, depth: int = 0
+) -> Iterator[os.DirEntry[str]]:
+    """Yield a directory entry for each file under path.
+
+    Directories in SKIP_DIRS and hidden directories are not descended into.
 
     Args:
-        root: Root directory to walk.
+        path: Directory to walk.
         max_depth: Maximum recursion depth.
+        depth: Depth of path below the walk root.
 
-    Returns:
-        List of file paths.
+    Yields:
+        DirEntry for each regular file found.
     """
-    files = []
+    if depth > max_depth:
+        return
+
+    try:
+        # DirEntry type checks reuse the d_type returned by readdir, so
+        # regular files and directories cost no extra stat() call
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    name = entry.name
+                    if not name.startswith(".") and name not in SKIP_DIRS:
+                        yield from _iter_file_entries(entry.path, max_depth, depth + 1)
+                elif entry.is_file():
+                    yield entry
+    except PermissionError:
+        pass
+
+
+def _read_version(path: Path, parse: Callable[[str], Optional[str]]) -> Optional[str]:
+    """Parse a version out of a marker or config file through the stat-keyed cache.
+
+    Args:
+        path: File to read.
+        parse: Extracts the version from the file content.
 
-    def _walk(path: Path, depth: int) -> None:
-        if depth > max_depth:
-            return
+    Returns:
+        Parsed version, or None if the file is missing, unreadable or has
+        no version.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return _read_version_cached(str(path), st.st_ino, st.st_mtime_ns, st.st_size, parse)
+
+
+@functools.lru_cache(maxsize=128)
+def _read_version_cached(
+    path: str,
+    inode: int,
+    mtime_ns: int,
+    size: int,
+    parse: Callable[[str], Optional[str]],
+) -> Optional[str]:
+    """Read a text file and parse it, cached on (path, inode, mtime, size).
+
+    Only the parsed version string is kept, never the file content. The
+    stat fields are only part of the cache key: any change to the file
+    produces a new key and therefore a fresh read.
 
-        try:
-            for item in path.iterdir():
-                if item.is_dir():
-                    if item.name not in SKIP_DIRS and not item.name.startswith("."):
-                        _walk(item, depth + 1)
-                elif item.is_file():
-                    files.append(item)
-        except PermissionError:
-            pass
+    Args:
+        path: File path.
+        inode: File inode number.
+        mtime_ns: File modification time in nanoseconds.
+        size: File size in bytes.
+        parse: Extracts the version from the file content.
 
-    _walk(root, 0)
-    return files
+    Returns:
+        Parsed version, or None if the file cannot be read as text or has
+        no version.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            content = f.read(_MAX_MARKER_FILE_CHARS)
+        return parse(content)
+    except Exception:
+        return None
 
 
 def _detect_version(language: str, project_root: Path) -> Optional[str]:
@@ -203,137 +302,118 @@ def _detect_version(language: str, project_root: Path) -> Optional[str]:
 
 def _detect_python_version(project_root: Path) -> Optional[str]:
     """Detect Python version from pyproject.toml or other files."""
-    pyproject = project_root / "pyproject.toml"
-    if pyproject.exists():
-        try:
-            content = pyproject.read_text()
-            # Look for requires-python
-            match = re.search(r'requires-python\s*=\s*["\']([^"\']+)["\']', content)
-            if match:
-                version_spec = match.group(1)
-                # Extract version number (e.g., ">=3.10" -> "3.10")
-                version_match = re.search(r"(\d+\.\d+)", version_spec)
-                if version_match:
-                    return version_match.group(1)
-        except Exception:
-            pass
+    version = _read_version(project_root / "pyproject.toml", _parse_requires_python)
+    if version is not None:
+        return version
 
     # Check .python-version file
-    python_version_file = project_root / ".python-version"
-    if python_version_file.exists():
-        try:
-            version = python_version_file.read_text().strip()
-            return (
-                version.split(".")[0] + "." + version.split(".")[1]
-                if "." in version
-                else version
-            )
-        except Exception:
-            pass
-
+    return _read_version(project_root / ".python-version", _parse_python_version_file)
+
+
+def _parse_requires_python(content: str) -> Optional[str]:
+    """Extract the major.minor version from pyproject.toml's requires-python."""
+    match = _REQUIRES_PYTHON_RE.search(content)
+    if match:
+        version_spec = match.group(1)
+        # Extract version number (e.g., ">=3.10" -> "3.10")
+        version_match = _MAJOR_MINOR_RE.search(version_spec)
+        if version_match:
+            return version_match.group(1)
     return None
 
 
+def _parse_python_version_file(content: str) -> Optional[str]:
+    """Extract the major.minor version from a .python-version file."""
+    version = content.strip()
+    return (
+        version.split(".")[0] + "." + version.split(".")[1]
+        if "." in version
+        else version
+    )
+
+
 def _detect_typescript_version(project_root: Path) -> Optional[str]:
     """Detect TypeScript version from package.json."""
-    package_json = project_root / "package.json"
-    if package_json.exists():
-        try:
-            import json
-
-            data = json.loads(package_json.read_text())
-            deps = {**data.get("dependencies", {}), **data.get("devDependencies", {})}
-            if "typescript" in deps:
-                version = deps["typescript"]
-                # Strip version prefix (^, ~, etc.)
-                return re.sub(r"^[\^~>=<]+", "", version)
-        except Exception:
-            pass
+    return _read_version(project_root / "package.json", _parse_typescript_dependency)
+
+
+def _parse_typescript_dependency(content: str) -> Optional[str]:
+    """Extract the typescript dependency version from package.json."""
+    import json
+
+    data = json.loads(content)
+    deps = {**data.get("dependencies", {}), **data.get("devDependencies", {})}
+    if "typescript" in deps:
+        version = deps["typescript"]
+        # Strip version prefix (^, ~, etc.)
+        return _VERSION_PREFIX_RE.sub("", version)
     return None
 
 
 def _detect_go_version(project_root: Path) -> Optional[str]:
     """Detect Go version from go.mod."""
-    go_mod = project_root / "go.mod"
-    if go_mod.exists():
-        try:
-            content = go_mod.read_text()
-            match = re.search(r"^go\s+(\d+\.\d+)", content, re.MULTILINE)
-            if match:
-                return match.group(1)
-        except Exception:
-            pass
-    return None
+    return _read_version(project_root / "go.mod", _parse_go_directive)
+
+
+def _parse_go_directive(content: str) -> Optional[str]:
+    """Extract the go directive version from go.mod."""
+    match = _GO_DIRECTIVE_RE.search(content)
+    return match.group(1) if match else None
 
 
 def _detect_rust_version(project_root: Path) -> Optional[str]:
     """Detect Rust edition from Cargo.toml."""
-    cargo_toml = project_root / "Cargo.toml"
-    if cargo_toml.exists():
-        try:
-            content = cargo_toml.read_text()
-            match = re.search(r'edition\s*=\s*["\'](\d+)["\']', content)
-            if match:
-                return match.group(1)
-        except Exception:
-            pass
-    return None
+    return _read_version(project_root / "Cargo.toml", _parse_rust_edition)
+
+
+def _parse_rust_edition(content: str) -> Optional[str]:
+    """Extract the edition from Cargo.toml."""
+    match = _RUST_EDITION_RE.search(content)
+    return match.group(1) if match else None
 
 
 def _detect_java_version(project_root: Path) -> Optional[str]:
     """Detect Java version from pom.xml or build.gradle."""
     # Check pom.xml (Maven)
-    pom_xml = project_root / "pom.xml"
-    if pom_xml.exists():
-        try:
-            content = pom_xml.read_text()
-            # Look for maven.compiler.source or java.version property
-            match = re.search(
-                r"<(?:maven\.compiler\.source|java\.version)>(\d+)</",
-                content,
-            )
-            if match:
-                return match.group(1)
-            # Look for release property
-            match = re.search(r"<release>(\d+)</release>", content)
-            if match:
-                return match.group(1)
-        except Exception:
-            pass
+    version = _read_version(project_root / "pom.xml", _parse_maven_java_version)
+    if version is not None:
+        return version
 
     # Check build.gradle (Gradle)
     for gradle_file in ["build.gradle", "build.gradle.kts"]:
-        gradle_path = project_root / gradle_file
-        if gradle_path.exists():
-            try:
-                content = gradle_path.read_text()
-                # Look for sourceCompatibility or targetCompatibility
-                match = re.search(
-                    r"(?:source|target)Compatibility\s*=\s*['\"]?(?:JavaVersion\.VERSION_)?(\d+)",
-                    content,
-                )
-                if match:
-                    return match.group(1)
-                # Look for toolchain languageVersion
-                match = re.search(
-                    r"languageVersion\.set\s*\(\s*JavaLanguageVersion\.of\s*\(\s*(\d+)\s*\)",
-                    content,
-                )
-                if match:
-                    return match.group(1)
-            except Exception:
-                pass
+        version = _read_version(project_root / gradle_file, _parse_gradle_java_version)
+        if version is not None:
+            return version
 
     # Check .java-version file
-    java_version_file = project_root / ".java-version"
-    if java_version_file.exists():
-        try:
-            version = java_version_file.read_text().strip()
-            # Extract major version (e.g., "17.0.2" -> "17")
-            match = re.match(r"(\d+)", version)
-            if match:
-                return match.group(1)
-        except Exception:
-            pass
-
-    return None
+    return _read_version(project_root / ".java-version", _parse_java_version_file)
+
+
+def _parse_maven_java_version(content: str) -> Optional[str]:
+    """Extract the Java version from pom.xml properties."""
+    # Look for maven.compiler.source or java.version property
+    match = _MAVEN_JAVA_VERSION_RE.search(content)
+    if match:
+        return match.group(1)
+    # Look for release property
+    match = _MAVEN_RELEASE_RE.search(content)
+    return match.group(1) if match else None
+
+
+def _parse_gradle_java_version(content: str) -> Optional[str]:
+    """Extract the Java version from a Gradle build script."""
+    # Look for sourceCompatibility or targetCompatibility
+    match = _GRADLE_COMPATIBILITY_RE.search(content)
+    if match:
+        return match.group(1)
+    # Look for toolchain languageVersion
+    match = _GRADLE_TOOLCHAIN_RE.search(content)
+    return match.group(1) if match else None
+
+
+def _parse_java_version_file(content: str) -> Optional[str]:
+    """Extract the major version from a .java-version file."""
+    version = content.strip()
+    # Extract major version (e.g., "17.0.2" -> "17")
+    match = _LEADING_NUMBER_RE.match(version)
+    return match.group(1) if match else None
@@ -755,6 +755,27 @@ class TestDomainRunnerExcludePatterns:
         for dp in domain_patterns:
             assert dp in patterns
 
+    def test_context_with_domain_excludes_reuses_merged_patterns(self) -> None:
+        """Test that identical global + domain patterns share one merged instance."""
+        from lucidshark.core.domain_runner import DomainRunner
+
+        config = LucidSharkConfig()
+        runner = DomainRunner(Path("/project"), config)
+
+        context = ScanContext(
+            project_root=Path("/project"),
+            paths=[],
+            enabled_domains=[ToolDomain.LINTING],
+            ignore_patterns=IgnorePatterns(["global/**"]),
+        )
+
+        first = runner._context_with_domain_excludes(context, ["domain/**"])
+        second = runner._context_with_domain_excludes(context, ["domain/**"])
+        other = runner._context_with_domain_excludes(context, ["other/**"])
+
+        assert first.ignore_patterns is second.ignore_patterns
+        assert other.ignore_patterns is not first.ignore_patterns
+
 
 class TestCombiningGlobalAndDomainExcludes:
     """Tests for the full flow of combining global + domain excludes."""
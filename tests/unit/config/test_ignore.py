@@ -109,6 +109,49 @@ class TestIgnorePatterns:
         assert not patterns.matches(Path("/project/any/file.py"), root)
         assert patterns.get_exclude_patterns() == []
 
+    def test_anchored_patterns_match_under_literal_base(self) -> None:
+        """Test anchored patterns sharing literal base directories."""
+        patterns = IgnorePatterns(["scripts/**", "/generated/*.py", "src/gen/"])
+        root = Path("/project")
+
+        assert patterns.matches(Path("/project/scripts/deploy.sh"), root)
+        assert patterns.matches(Path("/project/generated/models.py"), root)
+        assert patterns.matches(Path("/project/src/gen/api.py"), root)
+        assert not patterns.matches(Path("/project/src/main.py"), root)
+        assert not patterns.matches(Path("/project/scriptsx/run.sh"), root)
+        assert not patterns.matches(Path("/project/lib/scripts/run.sh"), root)
+
+    def test_unanchored_pattern_matches_at_any_depth(self) -> None:
+        """Test that mixing in unanchored patterns still matches nested paths."""
+        patterns = IgnorePatterns(["scripts/**", "*.log"])
+        root = Path("/project")
+
+        assert patterns.matches(Path("/project/scripts/run.sh"), root)
+        assert patterns.matches(Path("/project/deep/nested/app.log"), root)
+        assert not patterns.matches(Path("/project/src/main.py"), root)
+
+    def test_matches_rel_with_precomputed_path(self) -> None:
+        """Test matching a precomputed root-relative POSIX path."""
+        patterns = IgnorePatterns(["scripts/**", "*.log"])
+
+        assert patterns.matches_rel("scripts/run.sh")
+        assert patterns.matches_rel("deep/app.log")
+        assert patterns.matches_rel("./scripts/run.sh")
+        assert not patterns.matches_rel("src/main.py")
+
+    def test_identical_rules_share_compiled_spec(self) -> None:
+        """Test that instances with the same cleaned rules reuse one PathSpec."""
+        first = IgnorePatterns(["*.log", "# comment", "build/"], source="file")
+        second = IgnorePatterns(["*.log", "build/"], source="config")
+        merged = IgnorePatterns.merge(
+            IgnorePatterns(["*.log"]), IgnorePatterns(["build/"])
+        )
+        other = IgnorePatterns(["*.tmp"])
+
+        assert first._spec is second._spec
+        assert merged._spec is first._spec
+        assert other._spec is not first._spec
+
 
 class TestIgnorePatternsFromFile:
     """Tests for IgnorePatterns.from_file class method."""
@@ -137,6 +180,33 @@ class TestIgnorePatternsFromFile:
         assert patterns is not None
         assert patterns.get_exclude_patterns() == []
 
+    def test_strips_comments_and_blank_lines(self, tmp_path: Path) -> None:
+        """Test that comments, blanks and surrounding whitespace are dropped."""
+        ignore_file = tmp_path / ".lucidsharkignore"
+        ignore_file.write_text("# Header\n\n  *.log  \r\n\n   \nbuild/\n")
+
+        patterns = IgnorePatterns.from_file(ignore_file)
+        assert patterns is not None
+        assert patterns.get_exclude_patterns() == ["*.log", "build/"]
+
+    def test_keeps_escaped_trailing_space(self, tmp_path: Path) -> None:
+        """Test that an escaped trailing space survives loading."""
+        ignore_file = tmp_path / ".lucidsharkignore"
+        ignore_file.write_text("foo\\ \n*.log\n")
+
+        patterns = IgnorePatterns.from_file(ignore_file)
+        assert patterns is not None
+        assert patterns.matches(tmp_path / "foo ", tmp_path)
+        assert not patterns.matches(tmp_path / "foo", tmp_path)
+        assert patterns.matches(tmp_path / "debug.log", tmp_path)
+
+    def test_returns_none_for_non_utf8_file(self, tmp_path: Path) -> None:
+        """Test that an undecodable file is rejected rather than guessed at."""
+        ignore_file = tmp_path / ".lucidsharkignore"
+        ignore_file.write_bytes(b"*.log\n\xff\xfe\n")
+
+        assert IgnorePatterns.from_file(ignore_file) is None
+
 
 class TestIgnorePatternsMerge:
     """Tests for IgnorePatterns.merge class method."""
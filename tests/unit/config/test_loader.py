@@ -9,11 +9,12 @@ from unittest.mock import patch
 
 import pytest
 
+from lucidshark.config import loader
 from lucidshark.config.loader import (
     ConfigError,
-    _normalize_aliases,
     _parse_coverage_pipeline_config,
     _parse_domain_pipeline_config,
+    _parse_yaml_cached,
     dict_to_config,
     expand_env_vars,
     find_project_config,
@@ -28,59 +29,65 @@ class TestExpandEnvVars:
     """Tests for expand_env_vars function."""
 
     def test_expands_simple_env_var(self) -> None:
+        result = expand_env_vars("${MY_VAR}", env={"MY_VAR": "test_value"})
+        assert result == "test_value"
+
+    def test_defaults_to_os_environ(self) -> None:
         with patch.dict(os.environ, {"MY_VAR": "test_value"}):
             result = expand_env_vars("${MY_VAR}")
             assert result == "test_value"
 
     def test_expands_env_var_with_default(self) -> None:
-        # Remove the var if it exists
-        with patch.dict(os.environ, {}, clear=True):
-            os.environ.pop("UNSET_VAR", None)
-            result = expand_env_vars("${UNSET_VAR:-default}")
-            assert result == "default"
+        result = expand_env_vars("${UNSET_VAR:-default}", env={})
+        assert result == "default"
 
     def test_uses_value_when_set_ignoring_default(self) -> None:
-        with patch.dict(os.environ, {"SET_VAR": "actual"}):
-            result = expand_env_vars("${SET_VAR:-default}")
-            assert result == "actual"
+        result = expand_env_vars("${SET_VAR:-default}", env={"SET_VAR": "actual"})
+        assert result == "actual"
 
     def test_returns_empty_for_unset_without_default(self) -> None:
-        with patch.dict(os.environ, {}, clear=True):
-            os.environ.pop("UNSET_VAR", None)
-            result = expand_env_vars("${UNSET_VAR}")
-            assert result == ""
+        result = expand_env_vars("${UNSET_VAR}", env={})
+        assert result == ""
 
     def test_expands_in_dict_values(self) -> None:
-        with patch.dict(os.environ, {"TOKEN": "secret"}):
-            data = {"api_token": "${TOKEN}"}
-            result = expand_env_vars(data)
-            assert result == {"api_token": "secret"}
+        data = {"api_token": "${TOKEN}"}
+        result = expand_env_vars(data, env={"TOKEN": "secret"})
+        assert result == {"api_token": "secret"}
 
     def test_expands_in_list_items(self) -> None:
-        with patch.dict(os.environ, {"PATH1": "/a", "PATH2": "/b"}):
-            data = ["${PATH1}", "${PATH2}"]
-            result = expand_env_vars(data)
-            assert result == ["/a", "/b"]
+        data = ["${PATH1}", "${PATH2}"]
+        result = expand_env_vars(data, env={"PATH1": "/a", "PATH2": "/b"})
+        assert result == ["/a", "/b"]
 
     def test_expands_in_nested_structures(self) -> None:
-        with patch.dict(os.environ, {"TOKEN": "secret", "URL": "http://example.com"}):
-            data = {
-                "api": {
-                    "token": "${TOKEN}",
-                    "url": "${URL}",
-                },
-                "paths": ["${TOKEN}"],
-            }
-            result = expand_env_vars(data)
-            assert result["api"]["token"] == "secret"
-            assert result["api"]["url"] == "http://example.com"
-            assert result["paths"] == ["secret"]
+        env = {"TOKEN": "secret", "URL": "http://example.com"}
+        data = {
+            "api": {
+                "token": "${TOKEN}",
+                "url": "${URL}",
+            },
+            "paths": ["${TOKEN}"],
+        }
+        result = expand_env_vars(data, env=env)
+        assert result["api"]["token"] == "secret"
+        assert result["api"]["url"] == "http://example.com"
+        assert result["paths"] == ["secret"]
 
     def test_preserves_non_string_values(self) -> None:
         data = {"number": 42, "boolean": True, "none": None}
         result = expand_env_vars(data)
         assert result == data
 
+    def test_does_not_mutate_input(self) -> None:
+        data = {"api": {"tokens": ["${TOKEN}"]}}
+        result = expand_env_vars(data, env={"TOKEN": "secret"})
+        assert result == {"api": {"tokens": ["secret"]}}
+        assert data == {"api": {"tokens": ["${TOKEN}"]}}
+
+    def test_returns_string_without_reference_unchanged(self) -> None:
+        value = "plain {braces} and :- markers"
+        assert expand_env_vars(value) is value
+
 
 class TestMergeConfigs:
     """Tests for merge_configs function."""
@@ -119,6 +126,20 @@ class TestMergeConfigs:
         result = merge_configs({}, overlay)
         assert result == {"a": 1}
 
+    def test_merges_disjoint_subtrees(self) -> None:
+        base = {"scanners": {"sca": {"enabled": True}}}
+        overlay = {"scanners": {"sast": {"enabled": False}}}
+        result = merge_configs(base, overlay)
+        assert result == {
+            "scanners": {"sca": {"enabled": True}, "sast": {"enabled": False}}
+        }
+
+    def test_does_not_mutate_base(self) -> None:
+        base = {"scanners": {"sca": {"enabled": True, "timeout": 60}}}
+        overlay = {"scanners": {"sca": {"timeout": 120}}}
+        merge_configs(base, overlay)
+        assert base == {"scanners": {"sca": {"enabled": True, "timeout": 60}}}
+
 
 class TestDictToConfig:
     """Tests for dict_to_config function."""
@@ -129,6 +150,12 @@ class TestDictToConfig:
         assert config.ignore == []
         assert config.output.format == "json"
         assert config.scanners == {}
+        assert config == LucidSharkConfig()
+
+    def test_empty_dict_returns_independent_configs(self) -> None:
+        first = dict_to_config({})
+        first.ignore.append("tests/**")
+        assert dict_to_config({}).ignore == []
 
     def test_parses_fail_on(self) -> None:
         config = dict_to_config({"fail_on": "high"})
@@ -323,6 +350,33 @@ class TestLoadYamlFile:
         with pytest.raises(ConfigError):
             load_yaml_file(config_file)
 
+    def test_reloads_after_file_changes(self, tmp_path: Path) -> None:
+        config_file = tmp_path / "config.yml"
+        config_file.write_text("fail_on: high")
+        assert load_yaml_file(config_file) == {"fail_on": "high"}
+
+        config_file.write_text("fail_on: critical")
+        assert load_yaml_file(config_file) == {"fail_on": "critical"}
+
+    def test_repeated_loads_return_independent_dicts(self, tmp_path: Path) -> None:
+        config_file = tmp_path / "config.yml"
+        config_file.write_text("ignore:\n  - tests/**")
+        first = load_yaml_file(config_file)
+        first["ignore"].append("build/**")
+
+        assert load_yaml_file(config_file) == {"ignore": ["tests/**"]}
+
+    def test_unchanged_file_is_parsed_once(self, tmp_path: Path) -> None:
+        config_file = tmp_path / "config.yml"
+        config_file.write_text("fail_on: high")
+        _parse_yaml_cached.cache_clear()
+
+        load_yaml_file(config_file)
+        load_yaml_file(config_file)
+
+        info = _parse_yaml_cached.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
 
 class TestLoadConfig:
     """Tests for load_config function."""
@@ -675,7 +729,7 @@ class TestNormalizeAliases:
     def test_top_level_languages_mapped_to_project(self) -> None:
         """Top-level 'languages' should be mapped to project.languages."""
         data = {"languages": ["python", "typescript"]}
-        result = _normalize_aliases(data)
+        result = loader._normalize_aliases(data)
         assert "languages" not in result
         assert result["project"]["languages"] == ["python", "typescript"]
 
@@ -685,7 +739,7 @@ class TestNormalizeAliases:
             "languages": ["python"],
             "project": {"name": "my-project", "languages": ["java"]},
         }
-        result = _normalize_aliases(data)
+        result = loader._normalize_aliases(data)
         assert result["project"]["languages"] == ["java"]
         assert result["project"]["name"] == "my-project"
 
@@ -695,7 +749,7 @@ class TestNormalizeAliases:
             "languages": ["python"],
             "project": {"name": "my-project"},
         }
-        result = _normalize_aliases(data)
+        result = loader._normalize_aliases(data)
         assert result["project"]["name"] == "my-project"
         assert result["project"]["languages"] == ["python"]
 
@@ -707,7 +761,7 @@ class TestNormalizeAliases:
                 "type_checking": {"enabled": True, "tools": ["mypy"]},
             }
         }
-        result = _normalize_aliases(data)
+        result = loader._normalize_aliases(data)
         assert "domains" not in result
         assert result["pipeline"]["linting"] == {"enabled": True, "tools": ["ruff"]}
         assert result["pipeline"]["type_checking"] == {
@@ -726,7 +780,7 @@ class TestNormalizeAliases:
                 "max_workers": 2,
             },
         }
-        result = _normalize_aliases(data)
+        result = loader._normalize_aliases(data)
         # pipeline.linting should win over domains.linting
         assert result["pipeline"]["linting"] == {"enabled": True, "tools": ["ruff"]}
         assert result["pipeline"]["max_workers"] == 2
@@ -734,7 +788,7 @@ class TestNormalizeAliases:
     def test_top_level_exclude_patterns_mapped_to_exclude(self) -> None:
         """Top-level 'exclude_patterns' should be mapped to 'exclude'."""
         data = {"exclude_patterns": ["tests/**", "build/**"]}
-        result = _normalize_aliases(data)
+        result = loader._normalize_aliases(data)
         assert "exclude_patterns" not in result
         assert result["exclude"] == ["tests/**", "build/**"]
 
@@ -744,7 +798,7 @@ class TestNormalizeAliases:
             "exclude_patterns": ["tests/**"],
             "exclude": ["build/**"],
         }
-        result = _normalize_aliases(data)
+        result = loader._normalize_aliases(data)
         assert result["exclude"] == ["build/**"]
 
     def test_exclude_patterns_does_not_overwrite_ignore(self) -> None:
@@ -753,7 +807,7 @@ class TestNormalizeAliases:
             "exclude_patterns": ["tests/**"],
             "ignore": ["build/**"],
         }
-        result = _normalize_aliases(data)
+        result = loader._normalize_aliases(data)
         assert result["ignore"] == ["build/**"]
         assert "exclude" not in result
 
@@ -789,7 +843,7 @@ class TestNormalizeAliases:
             "pipeline": {"linting": {"enabled": True, "tools": ["ruff"]}},
             "exclude": ["tests/**"],
         }
-        result = _normalize_aliases(data)
+        result = loader._normalize_aliases(data)
         assert result == data
 
     def test_all_aliases_combined(self) -> None:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import pytest
 
 from lucidshark.config.models import (
     CoveragePipelineConfig,
@@ -67,6 +68,10 @@ class TestDefaultPlugins:
     def test_iac_defaults_to_checkov(self) -> None:
         assert DEFAULT_PLUGINS["iac"] == "checkov"
 
+    def test_is_read_only(self) -> None:
+        with pytest.raises(TypeError):
+            DEFAULT_PLUGINS["sca"] = "other"  # type: ignore[index]
+
 
 class TestLucidSharkConfig:
     """Tests for LucidSharkConfig dataclass."""
@@ -148,6 +153,12 @@ class TestLucidSharkConfigGetEnabledDomains:
         assert "sast" not in enabled
         assert "iac" in enabled
 
+    def test_reflects_in_place_scanner_changes(self) -> None:
+        config = LucidSharkConfig(scanners={"sca": ScannerDomainConfig(enabled=True)})
+        assert config.get_enabled_domains() == ["sca"]
+        config.scanners["iac"] = ScannerDomainConfig(enabled=True)
+        assert config.get_enabled_domains() == ["sca", "iac"]
+
 
 class TestLucidSharkConfigGetPluginForDomain:
     """Tests for LucidSharkConfig.get_plugin_for_domain method."""
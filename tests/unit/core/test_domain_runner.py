@@ -5,23 +5,30 @@ from __future__ import annotations
 import json
 import subprocess
 from pathlib import Path
-from typing import Any, Dict, Type
+from typing import Any, Dict, List, Tuple, Type
 from unittest.mock import patch, MagicMock
 
+import pytest
 
 from lucidshark.config.models import LucidSharkConfig
+from lucidshark.core import domain_runner
 from lucidshark.core.domain_runner import (
     DomainRunner,
     EXTENSION_LANGUAGE,
+    LANGUAGE_PLUGINS,
     PLUGIN_LANGUAGES,
     _has_jest_config,
     _has_vitest_config,
+    _language_for_suffix,
     check_severity_threshold,
     detect_language,
     filter_plugins_by_language,
     get_domains_for_language,
 )
-from lucidshark.core.models import Severity, ToolDomain, UnifiedIssue
+from lucidshark.core.models import ScanContext, Severity, ToolDomain, UnifiedIssue
+
+# DomainRunner only reads its config, so tests can share one default instance
+_DEFAULT_CONFIG = LucidSharkConfig()
 
 
 class MockPlugin:
@@ -100,6 +107,12 @@ class TestFilterPluginsByLanguage:
 
         assert "unknown_plugin" in result
 
+    def test_language_plugins_is_reverse_of_plugin_languages(self) -> None:
+        """Test the reverse index agrees with PLUGIN_LANGUAGES."""
+        for plugin, languages in PLUGIN_LANGUAGES.items():
+            for language in languages:
+                assert plugin in LANGUAGE_PLUGINS[language]
+
     def test_multiple_languages_filter(self) -> None:
         """Test filtering with multiple languages."""
         plugins: Dict[str, Type[Any]] = {
@@ -120,116 +133,68 @@ class TestFilterPluginsByLanguage:
 class TestDetectLanguage:
     """Tests for detect_language function."""
 
-    def test_detects_python(self) -> None:
-        """Test Python detection from .py extension."""
-        assert detect_language(Path("test.py")) == "python"
-
-    def test_detects_python_stub(self) -> None:
-        """Test Python stub detection from .pyi extension."""
-        assert detect_language(Path("types.pyi")) == "python"
-
-    def test_detects_javascript(self) -> None:
-        """Test JavaScript detection from .js extension."""
-        assert detect_language(Path("index.js")) == "javascript"
-
-    def test_detects_jsx(self) -> None:
-        """Test JSX detection as javascript."""
-        assert detect_language(Path("component.jsx")) == "javascript"
-
-    def test_detects_typescript(self) -> None:
-        """Test TypeScript detection from .ts extension."""
-        assert detect_language(Path("app.ts")) == "typescript"
-
-    def test_detects_tsx(self) -> None:
-        """Test TSX detection as typescript."""
-        assert detect_language(Path("component.tsx")) == "typescript"
-
-    def test_detects_java(self) -> None:
-        """Test Java detection from .java extension."""
-        assert detect_language(Path("Main.java")) == "java"
-
-    def test_detects_go(self) -> None:
-        """Test Go detection from .go extension."""
-        assert detect_language(Path("main.go")) == "go"
-
-    def test_detects_rust(self) -> None:
-        """Test Rust detection from .rs extension."""
-        assert detect_language(Path("lib.rs")) == "rust"
-
-    def test_detects_terraform(self) -> None:
-        """Test Terraform detection from .tf extension."""
-        assert detect_language(Path("main.tf")) == "terraform"
-
-    def test_detects_yaml(self) -> None:
-        """Test YAML detection from .yaml and .yml extensions."""
-        assert detect_language(Path("config.yaml")) == "yaml"
-        assert detect_language(Path("config.yml")) == "yaml"
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [
+            ("test.py", "python"),
+            ("types.pyi", "python"),
+            ("index.js", "javascript"),
+            ("component.jsx", "javascript"),
+            ("app.ts", "typescript"),
+            ("component.tsx", "typescript"),
+            ("Main.java", "java"),
+            ("main.go", "go"),
+            ("lib.rs", "rust"),
+            ("main.tf", "terraform"),
+            ("config.yaml", "yaml"),
+            ("config.yml", "yaml"),
+            ("package.json", "json"),
+            ("readme.md", "unknown"),
+            ("Makefile", "unknown"),
+            ("script.sh", "unknown"),
+            ("Test.PY", "python"),
+            ("App.TS", "typescript"),
+        ],
+    )
+    def test_detects_language(self, name: str, expected: str) -> None:
+        """Test language detection from the file extension, ignoring case."""
+        assert detect_language(Path(name)) == expected
 
-    def test_detects_json(self) -> None:
-        """Test JSON detection from .json extension."""
-        assert detect_language(Path("package.json")) == "json"
+    def test_caches_by_suffix(self) -> None:
+        """Test files sharing a suffix reuse one cached lookup."""
+        _language_for_suffix.cache_clear()
+        detect_language(Path("a.rs"))
+        detect_language(Path("src/b.rs"))
+        info = _language_for_suffix.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
 
-    def test_returns_unknown_for_unrecognized(self) -> None:
-        """Test unknown returned for unrecognized extensions."""
-        assert detect_language(Path("readme.md")) == "unknown"
-        assert detect_language(Path("Makefile")) == "unknown"
-        assert detect_language(Path("script.sh")) == "unknown"
 
-    def test_case_insensitive_extension(self) -> None:
-        """Test extension matching is case insensitive."""
-        assert detect_language(Path("Test.PY")) == "python"
-        assert detect_language(Path("App.TS")) == "typescript"
+_STANDARD_DOMAINS = ["linting", "type_checking", "testing", "coverage"]
 
 
 class TestGetDomainsForLanguage:
     """Tests for get_domains_for_language function."""
 
-    def test_python_domains(self) -> None:
-        """Test Python gets all standard domains."""
-        domains = get_domains_for_language("python")
+    @pytest.mark.parametrize(
+        ("language", "expected"),
+        [
+            ("python", [*_STANDARD_DOMAINS, "sast", "sca"]),
+            ("javascript", _STANDARD_DOMAINS),
+            ("typescript", _STANDARD_DOMAINS),
+            ("java", _STANDARD_DOMAINS),
+            ("kotlin", _STANDARD_DOMAINS),
+            ("yaml", ["iac", "sast"]),
+            ("json", ["iac", "sast"]),
+            ("unknown", ["linting", "sast", "sca"]),
+        ],
+    )
+    def test_language_domains(self, language: str, expected: List[str]) -> None:
+        """Test each language gets at least its expected domains."""
+        domains = get_domains_for_language(language)
 
-        assert "linting" in domains
-        assert "type_checking" in domains
-        assert "testing" in domains
-        assert "coverage" in domains
-        assert "sast" in domains
-        assert "sca" in domains
-
-    def test_javascript_domains(self) -> None:
-        """Test JavaScript gets all standard domains."""
-        domains = get_domains_for_language("javascript")
-
-        assert "linting" in domains
-        assert "type_checking" in domains
-        assert "testing" in domains
-        assert "coverage" in domains
-
-    def test_typescript_domains(self) -> None:
-        """Test TypeScript gets all standard domains."""
-        domains = get_domains_for_language("typescript")
-
-        assert "linting" in domains
-        assert "type_checking" in domains
-        assert "testing" in domains
-        assert "coverage" in domains
-
-    def test_java_domains(self) -> None:
-        """Test Java gets all standard domains."""
-        domains = get_domains_for_language("java")
-
-        assert "linting" in domains
-        assert "type_checking" in domains
-        assert "testing" in domains
-        assert "coverage" in domains
-
-    def test_kotlin_domains(self) -> None:
-        """Test Kotlin gets all standard domains."""
-        domains = get_domains_for_language("kotlin")
-
-        assert "linting" in domains
-        assert "type_checking" in domains
-        assert "testing" in domains
-        assert "coverage" in domains
+        for domain in expected:
+            assert domain in domains
 
     def test_terraform_domains(self) -> None:
         """Test Terraform gets IAC domain only."""
@@ -237,27 +202,12 @@ class TestGetDomainsForLanguage:
 
         assert domains == ["iac"]
 
-    def test_yaml_domains(self) -> None:
-        """Test YAML gets IAC and SAST domains."""
-        domains = get_domains_for_language("yaml")
-
-        assert "iac" in domains
-        assert "sast" in domains
-
-    def test_json_domains(self) -> None:
-        """Test JSON gets IAC and SAST domains."""
-        domains = get_domains_for_language("json")
-
-        assert "iac" in domains
-        assert "sast" in domains
-
-    def test_unknown_language_domains(self) -> None:
-        """Test unknown language gets default domains."""
-        domains = get_domains_for_language("unknown")
+    def test_returns_independent_lists(self) -> None:
+        """Test callers can modify the result without affecting later calls."""
+        domains = get_domains_for_language("python")
+        domains.clear()
 
-        assert "linting" in domains
-        assert "sast" in domains
-        assert "sca" in domains
+        assert get_domains_for_language("python")
 
 
 class TestCheckSeverityThreshold:
@@ -275,6 +225,23 @@ class TestCheckSeverityThreshold:
             description="Test description",
         )
 
+    def test_stops_at_first_matching_issue(self) -> None:
+        """Test a lazy iterable is only consumed up to the first match."""
+        issues = iter(
+            [
+                self._create_issue(Severity.LOW),
+                self._create_issue(Severity.CRITICAL),
+                self._create_issue(Severity.LOW),
+            ]
+        )
+
+        assert check_severity_threshold(issues, "high") is True
+        assert len(list(issues)) == 1
+
+    def test_returns_false_for_empty_iterable(self) -> None:
+        """Test an exhausted generator meets no threshold."""
+        assert check_severity_threshold(iter([]), "low") is False
+
     def test_returns_false_when_no_threshold(self) -> None:
         """Test returns False when no threshold specified."""
         issues = [self._create_issue(Severity.CRITICAL)]
@@ -333,6 +300,14 @@ class TestCheckSeverityThreshold:
         # Unknown threshold gets level 99, all issue severities (0-3) will be <= 99
         assert check_severity_threshold(issues, "unknown_level") is True
 
+    def test_info_never_meets_known_threshold(self) -> None:
+        """Test info issues only trip unknown thresholds."""
+        issues = [self._create_issue(Severity.INFO)]
+
+        assert check_severity_threshold(issues, "low") is False
+        assert check_severity_threshold(issues, "unknown_level") is True
+        assert check_severity_threshold([], "unknown_level") is False
+
 
 class TestPluginLanguagesMapping:
     """Tests for PLUGIN_LANGUAGES constant."""
@@ -362,77 +337,104 @@ class TestPluginLanguagesMapping:
         assert "javascript" in duplo_langs
         assert "go" in duplo_langs
 
+    def test_mapping_is_read_only(self) -> None:
+        """Test the lookup tables cannot be mutated at runtime."""
+        assert isinstance(PLUGIN_LANGUAGES["ruff"], frozenset)
+        with pytest.raises(TypeError):
+            PLUGIN_LANGUAGES["ruff"] = frozenset()  # type: ignore[index]
+        with pytest.raises(TypeError):
+            EXTENSION_LANGUAGE[".py"] = "ruby"  # type: ignore[index]
+
 
 class TestExtensionLanguageMapping:
     """Tests for EXTENSION_LANGUAGE constant."""
 
-    def test_python_extensions(self) -> None:
-        """Test Python extensions are mapped correctly."""
-        assert EXTENSION_LANGUAGE[".py"] == "python"
-        assert EXTENSION_LANGUAGE[".pyi"] == "python"
+    @pytest.mark.parametrize(
+        ("extension", "language"),
+        [
+            (".py", "python"),
+            (".pyi", "python"),
+            (".js", "javascript"),
+            (".jsx", "javascript"),
+            (".ts", "typescript"),
+            (".tsx", "typescript"),
+            (".java", "java"),
+            (".tf", "terraform"),
+            (".yaml", "yaml"),
+            (".yml", "yaml"),
+            (".json", "json"),
+        ],
+    )
+    def test_extension_mapping(self, extension: str, language: str) -> None:
+        """Test extensions are mapped to the right language."""
+        assert EXTENSION_LANGUAGE[extension] == language
+
+
+# Shared, read-only subprocess results for the command tests
+_RUN_OK = subprocess.CompletedProcess(args="", returncode=0, stdout="OK", stderr="")
+_RUN_SILENT = subprocess.CompletedProcess(args="", returncode=0, stdout="", stderr="")
+_RUN_FAILED = subprocess.CompletedProcess(
+    args="", returncode=1, stdout="", stderr="FAILED: test_foo"
+)
+_RUN_CLEANUP_ERROR = subprocess.CompletedProcess(
+    args="", returncode=1, stdout="", stderr="cleanup error"
+)
+
+
+class _RunRecorder:
+    """Stand-in for subprocess.run that records commands and replays results."""
 
-    def test_javascript_extensions(self) -> None:
-        """Test JavaScript extensions are mapped correctly."""
-        assert EXTENSION_LANGUAGE[".js"] == "javascript"
-        assert EXTENSION_LANGUAGE[".jsx"] == "javascript"
+    def __init__(self) -> None:
+        self.calls: List[Tuple[str, Dict[str, Any]]] = []
+        self.results: List[Any] = []
 
-    def test_typescript_extensions(self) -> None:
-        """Test TypeScript extensions are mapped correctly."""
-        assert EXTENSION_LANGUAGE[".ts"] == "typescript"
-        assert EXTENSION_LANGUAGE[".tsx"] == "typescript"
+    def __call__(self, cmd: str, **kwargs: Any) -> Any:
+        self.calls.append((cmd, kwargs))
+        return self.results[min(len(self.calls), len(self.results)) - 1]
 
-    def test_java_extension(self) -> None:
-        """Test Java extension is mapped correctly."""
-        assert EXTENSION_LANGUAGE[".java"] == "java"
+    @property
+    def commands(self) -> List[str]:
+        return [cmd for cmd, _ in self.calls]
 
-    def test_infrastructure_extensions(self) -> None:
-        """Test infrastructure file extensions are mapped."""
-        assert EXTENSION_LANGUAGE[".tf"] == "terraform"
-        assert EXTENSION_LANGUAGE[".yaml"] == "yaml"
-        assert EXTENSION_LANGUAGE[".yml"] == "yaml"
-        assert EXTENSION_LANGUAGE[".json"] == "json"
+
+@pytest.fixture
+def fake_run(monkeypatch: pytest.MonkeyPatch) -> _RunRecorder:
+    """Replace subprocess.run in the domain runner with a recorder."""
+    recorder = _RunRecorder()
+    monkeypatch.setattr(domain_runner.subprocess, "run", recorder)
+    return recorder
 
 
 class TestDomainRunnerCommand:
     """Tests for DomainRunner.run_tests with command and post_command."""
 
     def _make_runner(self, tmp_path: Path) -> DomainRunner:
-        """Create a DomainRunner with default config."""
-        config = LucidSharkConfig()
-        return DomainRunner(tmp_path, config)
+        """Create a DomainRunner with the shared default config."""
+        return DomainRunner(tmp_path, _DEFAULT_CONFIG)
 
-    def _make_context(self, tmp_path: Path) -> Any:
-        """Create a minimal ScanContext-like mock."""
-        ctx = MagicMock()
-        ctx.project_root = tmp_path
-        ctx.ignore_patterns = MagicMock()
-        return ctx
+    def _make_context(self, tmp_path: Path) -> ScanContext:
+        """Create a minimal ScanContext for the project root."""
+        return ScanContext(project_root=tmp_path, paths=[tmp_path], enabled_domains=[])
 
-    def test_command_success(self, tmp_path: Path) -> None:
+    def test_command_success(self, tmp_path: Path, fake_run: _RunRecorder) -> None:
         """Test that a successful command returns no issues."""
         runner = self._make_runner(tmp_path)
         context = self._make_context(tmp_path)
+        fake_run.results = [_RUN_OK]
 
-        with patch("lucidshark.core.domain_runner.subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=0, stdout="OK", stderr="")
-            issues = runner.run_tests(context, command="echo test")
+        issues = runner.run_tests(context, command="echo test")
 
         assert len(issues) == 0
-        mock_run.assert_called_once()
-        call_args = mock_run.call_args
-        assert call_args[0][0] == "echo test"
-        assert call_args[1]["shell"] is True
+        assert fake_run.commands == ["echo test"]
+        assert fake_run.calls[0][1]["shell"] is True
 
-    def test_command_failure(self, tmp_path: Path) -> None:
+    def test_command_failure(self, tmp_path: Path, fake_run: _RunRecorder) -> None:
         """Test that a failed command creates a test failure issue."""
         runner = self._make_runner(tmp_path)
         context = self._make_context(tmp_path)
+        fake_run.results = [_RUN_FAILED]
 
-        with patch("lucidshark.core.domain_runner.subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(
-                returncode=1, stdout="", stderr="FAILED: test_foo"
-            )
-            issues = runner.run_tests(context, command="make test")
+        issues = runner.run_tests(context, command="make test")
 
         assert len(issues) == 1
         assert issues[0].id == "custom-test-failure"
@@ -441,18 +443,17 @@ class TestDomainRunnerCommand:
         assert "exited with code 1" in issues[0].description
         assert "FAILED: test_foo" in issues[0].description
 
-    def test_command_skips_plugin_discovery(self, tmp_path: Path) -> None:
+    def test_command_skips_plugin_discovery(
+        self, tmp_path: Path, fake_run: _RunRecorder
+    ) -> None:
         """Test that command skips plugin-based test runner discovery."""
         runner = self._make_runner(tmp_path)
         context = self._make_context(tmp_path)
+        fake_run.results = [_RUN_OK]
 
-        with (
-            patch("lucidshark.core.domain_runner.subprocess.run") as mock_run,
-            patch(
-                "lucidshark.plugins.test_runners.discover_test_runner_plugins"
-            ) as mock_discover,
-        ):
-            mock_run.return_value = MagicMock(returncode=0, stdout="OK", stderr="")
+        with patch(
+            "lucidshark.plugins.test_runners.discover_test_runner_plugins"
+        ) as mock_discover:
             runner.run_tests(context, command="npm test")
 
         # Plugin discovery should NOT be called when command is set
@@ -471,68 +472,51 @@ class TestDomainRunnerCommand:
 
         mock_discover.assert_called_once()
 
-    def test_post_command_runs_after_command(self, tmp_path: Path) -> None:
+    def test_post_command_runs_after_command(
+        self, tmp_path: Path, fake_run: _RunRecorder
+    ) -> None:
         """Test that post_command runs after command."""
         runner = self._make_runner(tmp_path)
         context = self._make_context(tmp_path)
-        call_order: list[str] = []
-
-        def side_effect(cmd: str, **_kwargs: Any) -> MagicMock:
-            call_order.append(cmd)
-            return MagicMock(returncode=0, stdout="", stderr="")
+        fake_run.results = [_RUN_SILENT]
 
-        with patch(
-            "lucidshark.core.domain_runner.subprocess.run", side_effect=side_effect
-        ):
-            runner.run_tests(
-                context,
-                command="make test",
-                post_command="make clean",
-            )
+        runner.run_tests(
+            context,
+            command="make test",
+            post_command="make clean",
+        )
 
-        assert call_order == ["make test", "make clean"]
+        assert fake_run.commands == ["make test", "make clean"]
 
-    def test_post_command_runs_after_plugins(self, tmp_path: Path) -> None:
+    def test_post_command_runs_after_plugins(
+        self, tmp_path: Path, fake_run: _RunRecorder
+    ) -> None:
         """Test that post_command runs after plugin-based tests (no command)."""
         runner = self._make_runner(tmp_path)
         context = self._make_context(tmp_path)
+        fake_run.results = [_RUN_SILENT]
 
-        with (
-            patch(
-                "lucidshark.plugins.test_runners.discover_test_runner_plugins"
-            ) as mock_discover,
-            patch("lucidshark.core.domain_runner.subprocess.run") as mock_run,
-        ):
+        with patch(
+            "lucidshark.plugins.test_runners.discover_test_runner_plugins"
+        ) as mock_discover:
             mock_discover.return_value = {}
-            mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
             runner.run_tests(context, post_command="make clean")
 
-        mock_run.assert_called_once()
-        call_args = mock_run.call_args
-        assert call_args[0][0] == "make clean"
+        assert fake_run.commands == ["make clean"]
 
-    def test_post_command_failure_logged_not_raised(self, tmp_path: Path) -> None:
+    def test_post_command_failure_logged_not_raised(
+        self, tmp_path: Path, fake_run: _RunRecorder
+    ) -> None:
         """Test that post_command failure is logged but doesn't raise."""
         runner = self._make_runner(tmp_path)
         context = self._make_context(tmp_path)
+        fake_run.results = [_RUN_OK, _RUN_CLEANUP_ERROR]
 
-        call_count = 0
-
-        def side_effect(_cmd: str, **_kwargs: Any) -> MagicMock:
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                return MagicMock(returncode=0, stdout="OK", stderr="")
-            return MagicMock(returncode=1, stdout="", stderr="cleanup error")
-
-        with patch(
-            "lucidshark.core.domain_runner.subprocess.run", side_effect=side_effect
-        ):
-            issues = runner.run_tests(
-                context,
-                command="make test",
-                post_command="bad-cleanup",
-            )
+        issues = runner.run_tests(
+            context,
+            command="make test",
+            post_command="bad-cleanup",
+        )
 
         # Test command succeeded, so no test failure issues
         assert len(issues) == 0
@@ -542,51 +526,43 @@ class TestDomainRunnerCoveragePostCommand:
     """Tests for DomainRunner.run_coverage with post_command."""
 
     def _make_runner(self, tmp_path: Path) -> DomainRunner:
-        """Create a DomainRunner with default config."""
-        config = LucidSharkConfig()
-        return DomainRunner(tmp_path, config)
+        """Create a DomainRunner with the shared default config."""
+        return DomainRunner(tmp_path, _DEFAULT_CONFIG)
 
-    def _make_context(self, tmp_path: Path) -> Any:
-        """Create a minimal ScanContext-like mock."""
-        ctx = MagicMock()
-        ctx.project_root = tmp_path
-        ctx.ignore_patterns = MagicMock()
-        return ctx
+    def _make_context(self, tmp_path: Path) -> ScanContext:
+        """Create a minimal ScanContext for the project root."""
+        return ScanContext(project_root=tmp_path, paths=[tmp_path], enabled_domains=[])
 
-    def test_post_command_runs_after_coverage(self, tmp_path: Path) -> None:
+    def test_post_command_runs_after_coverage(
+        self, tmp_path: Path, fake_run: _RunRecorder
+    ) -> None:
         """Test that post_command runs after coverage analysis."""
         runner = self._make_runner(tmp_path)
         context = self._make_context(tmp_path)
+        fake_run.results = [_RUN_SILENT]
 
-        with (
-            patch(
-                "lucidshark.plugins.coverage.discover_coverage_plugins"
-            ) as mock_discover,
-            patch("lucidshark.core.domain_runner.subprocess.run") as mock_run,
-        ):
+        with patch(
+            "lucidshark.plugins.coverage.discover_coverage_plugins"
+        ) as mock_discover:
             mock_discover.return_value = {}
-            mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
             runner.run_coverage(context, post_command="make report")
 
-        mock_run.assert_called_once()
-        call_args = mock_run.call_args
-        assert call_args[0][0] == "make report"
+        assert fake_run.commands == ["make report"]
 
-    def test_no_post_command_skips_subprocess(self, tmp_path: Path) -> None:
+    def test_no_post_command_skips_subprocess(
+        self, tmp_path: Path, fake_run: _RunRecorder
+    ) -> None:
         """Test that no post_command means no subprocess call."""
         runner = self._make_runner(tmp_path)
         context = self._make_context(tmp_path)
 
-        with (
-            patch(
-                "lucidshark.plugins.coverage.discover_coverage_plugins"
-            ) as mock_discover,
-            patch("lucidshark.core.domain_runner.subprocess.run") as mock_run,
-        ):
+        with patch(
+            "lucidshark.plugins.coverage.discover_coverage_plugins"
+        ) as mock_discover:
             mock_discover.return_value = {}
             runner.run_coverage(context, post_command=None)
 
-        mock_run.assert_not_called()
+        assert fake_run.calls == []
 
 
 # ---------------------------------------------------------------------------
@@ -595,17 +571,13 @@ class TestDomainRunnerCoveragePostCommand:
 
 
 def _make_runner(tmp_path: Path) -> DomainRunner:
-    """Create a DomainRunner with default config."""
-    config = LucidSharkConfig()
-    return DomainRunner(tmp_path, config)
+    """Create a DomainRunner with the shared default config."""
+    return DomainRunner(tmp_path, _DEFAULT_CONFIG)
 
 
-def _make_context(tmp_path: Path) -> Any:
-    """Create a minimal ScanContext-like mock."""
-    ctx = MagicMock()
-    ctx.project_root = tmp_path
-    ctx.ignore_patterns = MagicMock()
-    return ctx
+def _make_context(tmp_path: Path) -> ScanContext:
+    """Create a minimal ScanContext for the project root."""
+    return ScanContext(project_root=tmp_path, paths=[tmp_path], enabled_domains=[])
 
 
 def _completed(
@@ -1089,7 +1061,9 @@ class TestParseJsonOutput:
 class TestLintingCommand:
     """Tests for DomainRunner.run_linting with command and post_command."""
 
-    def test_command_with_json_output(self, tmp_path: Path) -> None:
+    def test_command_with_json_output(
+        self, tmp_path: Path, fake_run: _RunRecorder
+    ) -> None:
         """Linting command returning JSON issues → parsed into UnifiedIssues."""
         runner = _make_runner(tmp_path)
         context = _make_context(tmp_path)
@@ -1102,15 +1076,17 @@ class TestLintingCommand:
             }
         ]
 
-        with patch("lucidshark.core.domain_runner.subprocess.run") as mock_run:
-            mock_run.return_value = _completed(returncode=1, stdout=json.dumps(data))
-            issues = runner.run_linting(context, command="custom-lint .")
+        fake_run.results = [_completed(returncode=1, stdout=json.dumps(data))]
+
+        issues = runner.run_linting(context, command="custom-lint .")
 
         assert len(issues) == 1
         assert issues[0].domain == ToolDomain.LINTING
         assert "missing docstring" in issues[0].description
 
-    def test_command_with_sarif_output(self, tmp_path: Path) -> None:
+    def test_command_with_sarif_output(
+        self, tmp_path: Path, fake_run: _RunRecorder
+    ) -> None:
         """Linting command returning SARIF → parsed correctly."""
         runner = _make_runner(tmp_path)
         context = _make_context(tmp_path)
@@ -1125,73 +1101,75 @@ class TestLintingCommand:
             ]
         )
 
-        with patch("lucidshark.core.domain_runner.subprocess.run") as mock_run:
-            mock_run.return_value = _completed(returncode=1, stdout=sarif)
-            issues = runner.run_linting(context, command="sarif-lint")
+        fake_run.results = [_completed(returncode=1, stdout=sarif)]
+
+        issues = runner.run_linting(context, command="sarif-lint")
 
         assert len(issues) == 1
         assert issues[0].rule_id == "E501"
 
-    def test_command_failure_plain_text(self, tmp_path: Path) -> None:
+    def test_command_failure_plain_text(
+        self, tmp_path: Path, fake_run: _RunRecorder
+    ) -> None:
         """Command failure with non-JSON output → failure issue."""
         runner = _make_runner(tmp_path)
         context = _make_context(tmp_path)
 
-        with patch("lucidshark.core.domain_runner.subprocess.run") as mock_run:
-            mock_run.return_value = _completed(
-                returncode=2, stdout="syntax error", stderr="crash"
-            )
-            issues = runner.run_linting(context, command="broken-lint")
+        fake_run.results = [
+            _completed(returncode=2, stdout="syntax error", stderr="crash")
+        ]
+
+        issues = runner.run_linting(context, command="broken-lint")
 
         assert len(issues) == 1
         assert issues[0].severity == Severity.MEDIUM
         assert "exited with code 2" in issues[0].description
 
-    def test_command_success_no_issues(self, tmp_path: Path) -> None:
+    def test_command_success_no_issues(
+        self, tmp_path: Path, fake_run: _RunRecorder
+    ) -> None:
         """Successful command with no parseable output → empty list."""
         runner = _make_runner(tmp_path)
         context = _make_context(tmp_path)
 
-        with patch("lucidshark.core.domain_runner.subprocess.run") as mock_run:
-            mock_run.return_value = _completed(returncode=0, stdout="All clean")
-            issues = runner.run_linting(context, command="lint .")
+        fake_run.results = [_completed(returncode=0, stdout="All clean")]
+
+        issues = runner.run_linting(context, command="lint .")
 
         assert issues == []
 
-    def test_command_skips_plugin_discovery(self, tmp_path: Path) -> None:
+    def test_command_skips_plugin_discovery(
+        self, tmp_path: Path, fake_run: _RunRecorder
+    ) -> None:
         """When command is set, linter plugins are not discovered."""
         runner = _make_runner(tmp_path)
         context = _make_context(tmp_path)
 
-        with (
-            patch("lucidshark.core.domain_runner.subprocess.run") as mock_run,
-            patch(
-                "lucidshark.plugins.linters.discover_linter_plugins"
-            ) as mock_discover,
-        ):
-            mock_run.return_value = _completed(returncode=0, stdout="")
+        fake_run.results = [_completed(returncode=0, stdout="")]
+
+        with patch(
+            "lucidshark.plugins.linters.discover_linter_plugins"
+        ) as mock_discover:
             runner.run_linting(context, command="my-lint")
 
         mock_discover.assert_not_called()
 
-    def test_post_command_runs_after_command(self, tmp_path: Path) -> None:
+    def test_post_command_runs_after_command(
+        self, tmp_path: Path, fake_run: _RunRecorder
+    ) -> None:
         """post_command executes after main command."""
         runner = _make_runner(tmp_path)
         context = _make_context(tmp_path)
-        call_order: list[str] = []
 
-        def side_effect(cmd: str, **_kwargs: Any) -> subprocess.CompletedProcess[str]:
-            call_order.append(cmd)
-            return _completed(returncode=0)
+        fake_run.results = [_completed(returncode=0)]
 
-        with patch(
-            "lucidshark.core.domain_runner.subprocess.run", side_effect=side_effect
-        ):
-            runner.run_linting(context, command="lint .", post_command="lint-report")
+        runner.run_linting(context, command="lint .", post_command="lint-report")
 
-        assert call_order == ["lint .", "lint-report"]
+        assert fake_run.commands == ["lint .", "lint-report"]
 
-    def test_post_command_runs_after_plugins(self, tmp_path: Path) -> None:
+    def test_post_command_runs_after_plugins(
+        self, tmp_path: Path, fake_run: _RunRecorder
+    ) -> None:
         """post_command runs even without custom command (after plugins)."""
         runner = _make_runner(tmp_path)
         context = _make_context(tmp_path)
@@ -1200,6 +1178,8 @@ class TestLintingCommand:
         mock_plugin.return_value.supports_fix = False
         mock_plugin.return_value.lint.return_value = []
 
+        fake_run.results = [_completed(returncode=0)]
+
         with (
             patch(
                 "lucidshark.plugins.linters.discover_linter_plugins"
@@ -1207,37 +1187,29 @@ class TestLintingCommand:
             patch(
                 "lucidshark.core.domain_runner.filter_plugins_by_config"
             ) as mock_filter,
-            patch("lucidshark.core.domain_runner.subprocess.run") as mock_run,
         ):
             mock_discover.return_value = {"mock_linter": mock_plugin}
             mock_filter.return_value = {"mock_linter": mock_plugin}
-            mock_run.return_value = _completed(returncode=0)
             runner.run_linting(context, post_command="post-lint-hook")
 
-        mock_run.assert_called_once()
-        assert mock_run.call_args[0][0] == "post-lint-hook"
+        assert fake_run.commands == ["post-lint-hook"]
 
-    def test_post_command_failure_logged(self, tmp_path: Path) -> None:
+    def test_post_command_failure_logged(
+        self, tmp_path: Path, fake_run: _RunRecorder
+    ) -> None:
         """post_command failure is logged, not raised."""
         runner = _make_runner(tmp_path)
         context = _make_context(tmp_path)
-        call_count = 0
-
-        def side_effect(_cmd: str, **_kwargs: Any) -> subprocess.CompletedProcess[str]:
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                return _completed(returncode=0, stdout="OK")
-            return _completed(returncode=1, stderr="cleanup failed")
+        fake_run.results = [
+            _completed(returncode=0, stdout="OK"),
+            _completed(returncode=1, stderr="cleanup failed"),
+        ]
 
-        with patch(
-            "lucidshark.core.domain_runner.subprocess.run", side_effect=side_effect
-        ):
-            issues = runner.run_linting(
-                context,
-                command="lint .",
-                post_command="bad-cleanup",
-            )
+        issues = runner.run_linting(
+            context,
+            command="lint .",
+            post_command="bad-cleanup",
+        )
 
         # Main command succeeded → no issues despite post_command failure
         assert issues == []
@@ -1251,7 +1223,9 @@ class TestLintingCommand:
 class TestTypeCheckingCommand:
     """Tests for DomainRunner.run_type_checking with command and post_command."""
 
-    def test_command_with_json_output(self, tmp_path: Path) -> None:
+    def test_command_with_json_output(
+        self, tmp_path: Path, fake_run: _RunRecorder
+    ) -> None:
         """Type checking command returning JSON → parsed."""
         runner = _make_runner(tmp_path)
         context = _make_context(tmp_path)
@@ -1264,85 +1238,76 @@ class TestTypeCheckingCommand:
             }
         ]
 
-        with patch("lucidshark.core.domain_runner.subprocess.run") as mock_run:
-            mock_run.return_value = _completed(returncode=1, stdout=json.dumps(data))
-            issues = runner.run_type_checking(context, command="mypy --json .")
+        fake_run.results = [_completed(returncode=1, stdout=json.dumps(data))]
+
+        issues = runner.run_type_checking(context, command="mypy --json .")
 
         assert len(issues) == 1
         assert issues[0].domain == ToolDomain.TYPE_CHECKING
         assert "Incompatible types" in issues[0].description
 
-    def test_command_failure_plain_text(self, tmp_path: Path) -> None:
+    def test_command_failure_plain_text(
+        self, tmp_path: Path, fake_run: _RunRecorder
+    ) -> None:
         """Command failure with plain text → failure issue."""
         runner = _make_runner(tmp_path)
         context = _make_context(tmp_path)
 
-        with patch("lucidshark.core.domain_runner.subprocess.run") as mock_run:
-            mock_run.return_value = _completed(
-                returncode=1, stdout="error: module not found", stderr=""
-            )
-            issues = runner.run_type_checking(context, command="pyright .")
+        fake_run.results = [
+            _completed(returncode=1, stdout="error: module not found", stderr="")
+        ]
+
+        issues = runner.run_type_checking(context, command="pyright .")
 
         assert len(issues) == 1
         assert issues[0].domain == ToolDomain.TYPE_CHECKING
         assert "exited with code 1" in issues[0].description
 
-    def test_command_skips_plugin_discovery(self, tmp_path: Path) -> None:
+    def test_command_skips_plugin_discovery(
+        self, tmp_path: Path, fake_run: _RunRecorder
+    ) -> None:
         """When command is set, type checker plugins are not discovered."""
         runner = _make_runner(tmp_path)
         context = _make_context(tmp_path)
 
-        with (
-            patch("lucidshark.core.domain_runner.subprocess.run") as mock_run,
-            patch(
-                "lucidshark.plugins.type_checkers.discover_type_checker_plugins"
-            ) as mock_discover,
-        ):
-            mock_run.return_value = _completed(returncode=0)
+        fake_run.results = [_completed(returncode=0)]
+
+        with patch(
+            "lucidshark.plugins.type_checkers.discover_type_checker_plugins"
+        ) as mock_discover:
             runner.run_type_checking(context, command="mypy .")
 
         mock_discover.assert_not_called()
 
-    def test_post_command_runs_after_command(self, tmp_path: Path) -> None:
+    def test_post_command_runs_after_command(
+        self, tmp_path: Path, fake_run: _RunRecorder
+    ) -> None:
         """post_command executes after main command."""
         runner = _make_runner(tmp_path)
         context = _make_context(tmp_path)
-        call_order: list[str] = []
 
-        def side_effect(cmd: str, **_kwargs: Any) -> subprocess.CompletedProcess[str]:
-            call_order.append(cmd)
-            return _completed(returncode=0)
+        fake_run.results = [_completed(returncode=0)]
 
-        with patch(
-            "lucidshark.core.domain_runner.subprocess.run", side_effect=side_effect
-        ):
-            runner.run_type_checking(
-                context, command="mypy .", post_command="type-report"
-            )
+        runner.run_type_checking(context, command="mypy .", post_command="type-report")
 
-        assert call_order == ["mypy .", "type-report"]
+        assert fake_run.commands == ["mypy .", "type-report"]
 
-    def test_post_command_failure_logged(self, tmp_path: Path) -> None:
+    def test_post_command_failure_logged(
+        self, tmp_path: Path, fake_run: _RunRecorder
+    ) -> None:
         """post_command failure is logged, not raised."""
         runner = _make_runner(tmp_path)
         context = _make_context(tmp_path)
-        call_count = 0
-
-        def side_effect(_cmd: str, **_kwargs: Any) -> subprocess.CompletedProcess[str]:
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                return _completed(returncode=0)
-            return _completed(returncode=1, stderr="report failed")
+        fake_run.results = [
+            _completed(returncode=0),
+            _completed(returncode=1, stderr="report failed"),
+        ]
 
-        with patch(
-            "lucidshark.core.domain_runner.subprocess.run", side_effect=side_effect
-        ):
-            issues = runner.run_type_checking(
-                context,
-                command="mypy .",
-                post_command="bad-hook",
-            )
+        issues = runner.run_type_checking(
+            context,
+            command="mypy .",
+            post_command="bad-hook",
+        )
 
         assert issues == []
 
@@ -1355,27 +1320,27 @@ class TestTypeCheckingCommand:
 class TestCoverageCommand:
     """Tests for DomainRunner.run_coverage with command and post_command."""
 
-    def test_command_success(self, tmp_path: Path) -> None:
+    def test_command_success(self, tmp_path: Path, fake_run: _RunRecorder) -> None:
         """Successful coverage command → no issues."""
         runner = _make_runner(tmp_path)
         context = _make_context(tmp_path)
 
-        with patch("lucidshark.core.domain_runner.subprocess.run") as mock_run:
-            mock_run.return_value = _completed(returncode=0, stdout="Coverage: 90%")
-            issues = runner.run_coverage(context, command="coverage run")
+        fake_run.results = [_completed(returncode=0, stdout="Coverage: 90%")]
+
+        issues = runner.run_coverage(context, command="coverage run")
 
         assert issues == []
 
-    def test_command_failure(self, tmp_path: Path) -> None:
+    def test_command_failure(self, tmp_path: Path, fake_run: _RunRecorder) -> None:
         """Failed coverage command → MEDIUM severity issue (not HIGH like testing)."""
         runner = _make_runner(tmp_path)
         context = _make_context(tmp_path)
 
-        with patch("lucidshark.core.domain_runner.subprocess.run") as mock_run:
-            mock_run.return_value = _completed(
-                returncode=1, stdout="", stderr="Coverage below threshold"
-            )
-            issues = runner.run_coverage(context, command="coverage run")
+        fake_run.results = [
+            _completed(returncode=1, stdout="", stderr="Coverage below threshold")
+        ]
+
+        issues = runner.run_coverage(context, command="coverage run")
 
         assert len(issues) == 1
         assert issues[0].id == "custom-coverage-failure"
@@ -1383,66 +1348,64 @@ class TestCoverageCommand:
         assert issues[0].severity == Severity.MEDIUM
         assert "Coverage below threshold" in issues[0].description
 
-    def test_command_skips_plugin_discovery(self, tmp_path: Path) -> None:
+    def test_command_skips_plugin_discovery(
+        self, tmp_path: Path, fake_run: _RunRecorder
+    ) -> None:
         """When command is set, coverage plugins are not discovered."""
         runner = _make_runner(tmp_path)
         context = _make_context(tmp_path)
 
-        with (
-            patch("lucidshark.core.domain_runner.subprocess.run") as mock_run,
-            patch(
-                "lucidshark.plugins.coverage.discover_coverage_plugins"
-            ) as mock_discover,
-        ):
-            mock_run.return_value = _completed(returncode=0)
+        fake_run.results = [_completed(returncode=0)]
+
+        with patch(
+            "lucidshark.plugins.coverage.discover_coverage_plugins"
+        ) as mock_discover:
             runner.run_coverage(context, command="coverage run")
 
         mock_discover.assert_not_called()
 
-    def test_post_command_runs_after_command(self, tmp_path: Path) -> None:
+    def test_post_command_runs_after_command(
+        self, tmp_path: Path, fake_run: _RunRecorder
+    ) -> None:
         """post_command executes after main coverage command."""
         runner = _make_runner(tmp_path)
         context = _make_context(tmp_path)
-        call_order: list[str] = []
 
-        def side_effect(cmd: str, **_kwargs: Any) -> subprocess.CompletedProcess[str]:
-            call_order.append(cmd)
-            return _completed(returncode=0)
+        fake_run.results = [_completed(returncode=0)]
 
-        with patch(
-            "lucidshark.core.domain_runner.subprocess.run", side_effect=side_effect
-        ):
-            runner.run_coverage(
-                context, command="coverage run", post_command="coverage html"
-            )
+        runner.run_coverage(
+            context, command="coverage run", post_command="coverage html"
+        )
 
-        assert call_order == ["coverage run", "coverage html"]
+        assert fake_run.commands == ["coverage run", "coverage html"]
 
-    def test_command_success_sets_coverage_result(self, tmp_path: Path) -> None:
+    def test_command_success_sets_coverage_result(
+        self, tmp_path: Path, fake_run: _RunRecorder
+    ) -> None:
         """Successful coverage command sets context.coverage_result."""
         runner = _make_runner(tmp_path)
         context = _make_context(tmp_path)
 
-        with patch("lucidshark.core.domain_runner.subprocess.run") as mock_run:
-            mock_run.return_value = _completed(returncode=0, stdout="Coverage: 90%")
-            runner.run_coverage(context, command="coverage run", threshold=80.0)
+        fake_run.results = [_completed(returncode=0, stdout="Coverage: 90%")]
+
+        runner.run_coverage(context, command="coverage run", threshold=80.0)
 
         assert context.coverage_result is not None
         assert context.coverage_result.threshold == 80.0
         assert context.coverage_result.tool == "custom"
 
-    def test_command_failure_sets_coverage_result(self, tmp_path: Path) -> None:
+    def test_command_failure_sets_coverage_result(
+        self, tmp_path: Path, fake_run: _RunRecorder
+    ) -> None:
         """Failed coverage command also sets context.coverage_result."""
         runner = _make_runner(tmp_path)
         context = _make_context(tmp_path)
 
-        with patch("lucidshark.core.domain_runner.subprocess.run") as mock_run:
-            mock_run.return_value = _completed(
-                returncode=1, stdout="", stderr="Coverage below threshold"
-            )
-            issues = runner.run_coverage(
-                context, command="coverage run", threshold=80.0
-            )
+        fake_run.results = [
+            _completed(returncode=1, stdout="", stderr="Coverage below threshold")
+        ]
+
+        issues = runner.run_coverage(context, command="coverage run", threshold=80.0)
 
         # coverage_result should be set even on failure
         assert context.coverage_result is not None
@@ -1452,7 +1415,7 @@ class TestCoverageCommand:
         assert len(issues) == 1
 
     def test_coverage_result_set_on_original_context_with_exclude_patterns(
-        self, tmp_path: Path
+        self, tmp_path: Path, fake_run: _RunRecorder
     ) -> None:
         """Coverage result must be set on original context even when exclude_patterns are provided.
 
@@ -1468,14 +1431,14 @@ class TestCoverageCommand:
             project_root=tmp_path, paths=[tmp_path], enabled_domains=[]
         )
 
-        with patch("lucidshark.core.domain_runner.subprocess.run") as mock_run:
-            mock_run.return_value = _completed(returncode=0, stdout="Coverage: 90%")
-            runner.run_coverage(
-                context,
-                command="coverage run",
-                threshold=80.0,
-                exclude_patterns=["**/test_*.py"],  # This triggers context copy
-            )
+        fake_run.results = [_completed(returncode=0, stdout="Coverage: 90%")]
+
+        runner.run_coverage(
+            context,
+            command="coverage run",
+            threshold=80.0,
+            exclude_patterns=["**/test_*.py"],  # This triggers context copy
+        )
 
         # The coverage_result must be set on the ORIGINAL context, not just the copy
         assert context.coverage_result is not None
@@ -1535,141 +1498,112 @@ class TestCoverageCommand:
 class TestPreCommand:
     """Tests for pre_command support across all domains."""
 
-    def test_pre_command_runs_before_test_command(self, tmp_path: Path) -> None:
+    def test_pre_command_runs_before_test_command(
+        self, tmp_path: Path, fake_run: _RunRecorder
+    ) -> None:
         """pre_command executes before main test command."""
         runner = _make_runner(tmp_path)
         context = _make_context(tmp_path)
-        call_order: list[str] = []
 
-        def side_effect(cmd: str, **_kwargs: Any) -> subprocess.CompletedProcess[str]:
-            call_order.append(cmd)
-            return _completed(returncode=0)
+        fake_run.results = [_completed(returncode=0)]
 
-        with patch(
-            "lucidshark.core.domain_runner.subprocess.run", side_effect=side_effect
-        ):
-            runner.run_tests(
-                context,
-                command="make test",
-                pre_command="docker stop mongo",
-                post_command="make clean",
-            )
+        runner.run_tests(
+            context,
+            command="make test",
+            pre_command="docker stop mongo",
+            post_command="make clean",
+        )
 
-        assert call_order == ["docker stop mongo", "make test", "make clean"]
+        assert fake_run.commands == ["docker stop mongo", "make test", "make clean"]
 
-    def test_pre_command_runs_before_linting_command(self, tmp_path: Path) -> None:
+    def test_pre_command_runs_before_linting_command(
+        self, tmp_path: Path, fake_run: _RunRecorder
+    ) -> None:
         """pre_command executes before main linting command."""
         runner = _make_runner(tmp_path)
         context = _make_context(tmp_path)
-        call_order: list[str] = []
 
-        def side_effect(cmd: str, **_kwargs: Any) -> subprocess.CompletedProcess[str]:
-            call_order.append(cmd)
-            return _completed(returncode=0)
+        fake_run.results = [_completed(returncode=0)]
 
-        with patch(
-            "lucidshark.core.domain_runner.subprocess.run", side_effect=side_effect
-        ):
-            runner.run_linting(
-                context,
-                command="lint .",
-                pre_command="setup-lint",
-                post_command="cleanup-lint",
-            )
+        runner.run_linting(
+            context,
+            command="lint .",
+            pre_command="setup-lint",
+            post_command="cleanup-lint",
+        )
 
-        assert call_order == ["setup-lint", "lint .", "cleanup-lint"]
+        assert fake_run.commands == ["setup-lint", "lint .", "cleanup-lint"]
 
     def test_pre_command_runs_before_type_checking_command(
-        self, tmp_path: Path
+        self, tmp_path: Path, fake_run: _RunRecorder
     ) -> None:
         """pre_command executes before main type checking command."""
         runner = _make_runner(tmp_path)
         context = _make_context(tmp_path)
-        call_order: list[str] = []
 
-        def side_effect(cmd: str, **_kwargs: Any) -> subprocess.CompletedProcess[str]:
-            call_order.append(cmd)
-            return _completed(returncode=0)
+        fake_run.results = [_completed(returncode=0)]
 
-        with patch(
-            "lucidshark.core.domain_runner.subprocess.run", side_effect=side_effect
-        ):
-            runner.run_type_checking(
-                context,
-                command="mypy .",
-                pre_command="generate-stubs",
-                post_command="cleanup-stubs",
-            )
+        runner.run_type_checking(
+            context,
+            command="mypy .",
+            pre_command="generate-stubs",
+            post_command="cleanup-stubs",
+        )
 
-        assert call_order == ["generate-stubs", "mypy .", "cleanup-stubs"]
+        assert fake_run.commands == ["generate-stubs", "mypy .", "cleanup-stubs"]
 
-    def test_pre_command_runs_before_coverage_command(self, tmp_path: Path) -> None:
+    def test_pre_command_runs_before_coverage_command(
+        self, tmp_path: Path, fake_run: _RunRecorder
+    ) -> None:
         """pre_command executes before main coverage command."""
         runner = _make_runner(tmp_path)
         context = _make_context(tmp_path)
-        call_order: list[str] = []
 
-        def side_effect(cmd: str, **_kwargs: Any) -> subprocess.CompletedProcess[str]:
-            call_order.append(cmd)
-            return _completed(returncode=0)
+        fake_run.results = [_completed(returncode=0)]
 
-        with patch(
-            "lucidshark.core.domain_runner.subprocess.run", side_effect=side_effect
-        ):
-            runner.run_coverage(
-                context,
-                command="coverage run",
-                pre_command="docker stop db",
-                post_command="coverage html",
-            )
+        runner.run_coverage(
+            context,
+            command="coverage run",
+            pre_command="docker stop db",
+            post_command="coverage html",
+        )
 
-        assert call_order == ["docker stop db", "coverage run", "coverage html"]
+        assert fake_run.commands == ["docker stop db", "coverage run", "coverage html"]
 
-    def test_pre_command_failure_logged_not_raised(self, tmp_path: Path) -> None:
+    def test_pre_command_failure_logged_not_raised(
+        self, tmp_path: Path, fake_run: _RunRecorder
+    ) -> None:
         """pre_command failure is logged but main command still runs."""
         runner = _make_runner(tmp_path)
         context = _make_context(tmp_path)
-        call_count = 0
-
-        def side_effect(_cmd: str, **_kwargs: Any) -> subprocess.CompletedProcess[str]:
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                # pre_command fails
-                return _completed(returncode=1, stderr="cleanup failed")
-            # main command succeeds
-            return _completed(returncode=0, stdout="OK")
+        fake_run.results = [
+            _completed(returncode=1, stderr="cleanup failed"),
+            _completed(returncode=0, stdout="OK"),
+        ]
 
-        with patch(
-            "lucidshark.core.domain_runner.subprocess.run", side_effect=side_effect
-        ):
-            issues = runner.run_tests(
-                context,
-                command="make test",
-                pre_command="bad-cleanup",
-            )
+        issues = runner.run_tests(
+            context,
+            command="make test",
+            pre_command="bad-cleanup",
+        )
 
         # Main command succeeded, so no test failure issues
         # (pre_command failure is just logged)
         assert len(issues) == 0
-        assert call_count == 2  # Both commands ran
+        assert len(fake_run.calls) == 2  # Both commands ran
 
-    def test_pre_command_none_skips_subprocess(self, tmp_path: Path) -> None:
+    def test_pre_command_none_skips_subprocess(
+        self, tmp_path: Path, fake_run: _RunRecorder
+    ) -> None:
         """No pre_command means no extra subprocess call."""
         runner = _make_runner(tmp_path)
         context = _make_context(tmp_path)
-        call_order: list[str] = []
 
-        def side_effect(cmd: str, **_kwargs: Any) -> subprocess.CompletedProcess[str]:
-            call_order.append(cmd)
-            return _completed(returncode=0)
+        fake_run.results = [_completed(returncode=0)]
 
-        with patch(
-            "lucidshark.core.domain_runner.subprocess.run", side_effect=side_effect
-        ):
-            runner.run_tests(context, command="make test", pre_command=None)
+        runner.run_tests(context, command="make test", pre_command=None)
 
-        assert call_order == ["make test"]
+        assert fake_run.commands == ["make test"]
 
 
 # ---------------------------------------------------------------------------
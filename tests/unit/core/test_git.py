@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import shutil
 import subprocess
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
 from lucidshark.core.git import (
     filter_files_by_extension,
     get_changed_files,
@@ -15,14 +18,55 @@ from lucidshark.core.git import (
 )
 
 
+def _init_git(path: Path, branch: str | None = None) -> None:
+    """Initialize and configure a repository with a single shell invocation."""
+    init = f"git init -q -b {branch}" if branch else "git init -q"
+    subprocess.run(
+        f"{init} && git config user.email test@test.com && git config user.name Test",
+        cwd=path,
+        shell=True,
+        check=True,
+    )
+
+
+def _git(path: Path, *args: str) -> None:
+    """Run a git setup command, discarding its output."""
+    subprocess.run(
+        ["git", *args],
+        cwd=path,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=True,
+    )
+
+
+def _commit(path: Path, message: str, *paths: str) -> None:
+    """Stage paths and commit them."""
+    _git(path, "add", "--", *paths)
+    _git(path, "commit", "-q", "-m", message)
+
+
+@pytest.fixture(scope="session")
+def git_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Initialize one configured repository to copy into individual tests."""
+    template = tmp_path_factory.mktemp("git_template")
+    _init_git(template)
+    return template
+
+
+@pytest.fixture
+def git_repo(git_template: Path, tmp_path: Path) -> Path:
+    """Fresh copy of the template repository in the test's tmp_path."""
+    shutil.copytree(git_template, tmp_path, dirs_exist_ok=True)
+    return tmp_path
+
+
 class TestIsGitRepo:
     """Tests for is_git_repo function."""
 
-    def test_is_git_repo_true(self, tmp_path: Path) -> None:
+    def test_is_git_repo_true(self, git_repo: Path) -> None:
         """Test detection of a git repository."""
-        # Initialize a git repo
-        subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True)
-        assert is_git_repo(tmp_path) is True
+        assert is_git_repo(git_repo) is True
 
     def test_is_git_repo_false(self, tmp_path: Path) -> None:
         """Test detection of non-git directory."""
@@ -37,17 +81,15 @@ class TestIsGitRepo:
 class TestGetGitRoot:
     """Tests for get_git_root function."""
 
-    def test_get_git_root(self, tmp_path: Path) -> None:
+    def test_get_git_root(self, git_repo: Path) -> None:
         """Test getting git root directory."""
-        subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True)
-        assert get_git_root(tmp_path) == tmp_path
+        assert get_git_root(git_repo) == git_repo
 
-    def test_get_git_root_subdir(self, tmp_path: Path) -> None:
+    def test_get_git_root_subdir(self, git_repo: Path) -> None:
         """Test getting git root from subdirectory."""
-        subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True)
-        subdir = tmp_path / "subdir"
+        subdir = git_repo / "subdir"
         subdir.mkdir()
-        assert get_git_root(subdir) == tmp_path
+        assert get_git_root(subdir) == git_repo
 
     def test_get_git_root_not_repo(self, tmp_path: Path) -> None:
         """Test get_git_root on non-git directory."""
@@ -62,85 +104,43 @@ class TestGetChangedFiles:
         result = get_changed_files(tmp_path)
         assert result is None
 
-    def test_get_changed_files_no_changes(self, tmp_path: Path) -> None:
+    def test_get_changed_files_no_changes(self, git_repo: Path) -> None:
         """Test returns empty list when no changes."""
-        subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@test.com"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
-        result = get_changed_files(tmp_path)
+        result = get_changed_files(git_repo)
         assert result == []
 
-    def test_get_changed_files_untracked(self, tmp_path: Path) -> None:
+    def test_get_changed_files_untracked(self, git_repo: Path) -> None:
         """Test detection of untracked files."""
-        subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True)
-
         # Create an untracked file
-        test_file = tmp_path / "test.py"
+        test_file = git_repo / "test.py"
         test_file.write_text("print('hello')")
 
-        result = get_changed_files(tmp_path)
+        result = get_changed_files(git_repo)
         assert result is not None
         assert test_file in result
 
-    def test_get_changed_files_staged(self, tmp_path: Path) -> None:
+    def test_get_changed_files_staged(self, git_repo: Path) -> None:
         """Test detection of staged files."""
-        subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@test.com"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
-
         # Create and stage a file
-        test_file = tmp_path / "test.py"
+        test_file = git_repo / "test.py"
         test_file.write_text("print('hello')")
-        subprocess.run(["git", "add", "test.py"], cwd=tmp_path, capture_output=True)
+        _git(git_repo, "add", "test.py")
 
-        result = get_changed_files(tmp_path)
+        result = get_changed_files(git_repo)
         assert result is not None
         assert test_file in result
 
-    def test_get_changed_files_modified(self, tmp_path: Path) -> None:
+    def test_get_changed_files_modified(self, git_repo: Path) -> None:
         """Test detection of modified files."""
-        subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@test.com"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
-
         # Create, commit, then modify a file
-        test_file = tmp_path / "test.py"
+        test_file = git_repo / "test.py"
         test_file.write_text("print('hello')")
-        subprocess.run(["git", "add", "test.py"], cwd=tmp_path, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "initial"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
+        _commit(git_repo, "initial", "test.py")
 
         # Modify the file
         test_file.write_text("print('hello world')")
 
-        result = get_changed_files(tmp_path)
+        result = get_changed_files(git_repo)
         assert result is not None
         assert test_file in result
 
@@ -192,106 +192,44 @@ class TestGetChangedFilesSinceBranch:
         result = get_changed_files_since_branch(tmp_path, "main")
         assert result is None
 
-    def test_branch_does_not_exist(self, tmp_path: Path) -> None:
+    def test_branch_does_not_exist(self, git_repo: Path) -> None:
         """Test returns None when base branch doesn't exist."""
-        subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@test.com"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
-
         # Create initial commit
-        test_file = tmp_path / "test.py"
+        test_file = git_repo / "test.py"
         test_file.write_text("print('hello')")
-        subprocess.run(["git", "add", "test.py"], cwd=tmp_path, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "initial"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
+        _commit(git_repo, "initial", "test.py")
 
         # Try to compare against non-existent branch
-        result = get_changed_files_since_branch(tmp_path, "nonexistent-branch")
+        result = get_changed_files_since_branch(git_repo, "nonexistent-branch")
         assert result is None
 
-    def test_no_changes_since_branch(self, tmp_path: Path) -> None:
+    def test_no_changes_since_branch(self, git_repo: Path) -> None:
         """Test returns empty list when no changes since branch."""
-        subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@test.com"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
-
         # Create initial commit on main
-        test_file = tmp_path / "test.py"
+        test_file = git_repo / "test.py"
         test_file.write_text("print('hello')")
-        subprocess.run(["git", "add", "test.py"], cwd=tmp_path, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "initial"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
+        _commit(git_repo, "initial", "test.py")
 
         # HEAD is same as main, no changes
-        result = get_changed_files_since_branch(tmp_path, "HEAD")
+        result = get_changed_files_since_branch(git_repo, "HEAD")
         assert result == []
 
     def test_detects_changes_on_feature_branch(self, tmp_path: Path) -> None:
         """Test detection of files changed on feature branch."""
-        subprocess.run(["git", "init", "-b", "main"], cwd=tmp_path, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@test.com"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
+        _init_git(tmp_path, branch="main")
 
         # Create initial commit on main
         test_file = tmp_path / "test.py"
         test_file.write_text("print('hello')")
-        subprocess.run(["git", "add", "test.py"], cwd=tmp_path, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "initial"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
+        _commit(tmp_path, "initial", "test.py")
 
         # Create and switch to feature branch
-        subprocess.run(
-            ["git", "checkout", "-b", "feature"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
+        _git(tmp_path, "checkout", "-b", "feature")
 
         # Add a new file on feature branch
         new_file = tmp_path / "new_feature.py"
         new_file.write_text("print('new feature')")
-        subprocess.run(
-            ["git", "add", "new_feature.py"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "commit", "-m", "add feature"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
+        _commit(tmp_path, "add feature", "new_feature.py")
 
         # Compare feature branch against main
         result = get_changed_files_since_branch(tmp_path, "main")
@@ -301,43 +239,19 @@ class TestGetChangedFilesSinceBranch:
 
     def test_detects_modified_files_on_feature_branch(self, tmp_path: Path) -> None:
         """Test detection of modified files on feature branch."""
-        subprocess.run(["git", "init", "-b", "main"], cwd=tmp_path, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@test.com"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
+        _init_git(tmp_path, branch="main")
 
         # Create initial commit on main
         test_file = tmp_path / "test.py"
         test_file.write_text("print('hello')")
-        subprocess.run(["git", "add", "test.py"], cwd=tmp_path, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "initial"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
+        _commit(tmp_path, "initial", "test.py")
 
         # Create and switch to feature branch
-        subprocess.run(
-            ["git", "checkout", "-b", "feature"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
+        _git(tmp_path, "checkout", "-b", "feature")
 
         # Modify existing file
         test_file.write_text("print('modified')")
-        subprocess.run(["git", "add", "test.py"], cwd=tmp_path, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "modify file"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
+        _commit(tmp_path, "modify file", "test.py")
 
         # Compare feature branch against main
         result = get_changed_files_since_branch(tmp_path, "main")
@@ -346,63 +260,29 @@ class TestGetChangedFilesSinceBranch:
 
     def test_multiple_commits_on_feature_branch(self, tmp_path: Path) -> None:
         """Test detection with multiple commits on feature branch."""
-        subprocess.run(["git", "init", "-b", "main"], cwd=tmp_path, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@test.com"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
+        _init_git(tmp_path, branch="main")
 
         # Create initial commit on main
         test_file = tmp_path / "test.py"
         test_file.write_text("print('hello')")
-        subprocess.run(["git", "add", "test.py"], cwd=tmp_path, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "initial"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
+        _commit(tmp_path, "initial", "test.py")
 
         # Create and switch to feature branch
-        subprocess.run(
-            ["git", "checkout", "-b", "feature"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
+        _git(tmp_path, "checkout", "-b", "feature")
 
         # First commit - add file1
         file1 = tmp_path / "file1.py"
         file1.write_text("print('file1')")
-        subprocess.run(["git", "add", "file1.py"], cwd=tmp_path, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "add file1"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
+        _commit(tmp_path, "add file1", "file1.py")
 
         # Second commit - add file2
         file2 = tmp_path / "file2.py"
         file2.write_text("print('file2')")
-        subprocess.run(["git", "add", "file2.py"], cwd=tmp_path, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "add file2"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
+        _commit(tmp_path, "add file2", "file2.py")
 
         # Third commit - modify file1
         file1.write_text("print('file1 modified')")
-        subprocess.run(["git", "add", "file1.py"], cwd=tmp_path, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "modify file1"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
+        _commit(tmp_path, "modify file1", "file1.py")
 
         # Should detect both files changed since main
         result = get_changed_files_since_branch(tmp_path, "main")
@@ -413,53 +293,25 @@ class TestGetChangedFilesSinceBranch:
 
     def test_deleted_file_not_in_result(self, tmp_path: Path) -> None:
         """Test that deleted files are not included (they don't exist)."""
-        subprocess.run(["git", "init", "-b", "main"], cwd=tmp_path, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@test.com"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
+        _init_git(tmp_path, branch="main")
 
         # Create initial commit with two files on main
         file1 = tmp_path / "file1.py"
         file2 = tmp_path / "file2.py"
         file1.write_text("print('file1')")
         file2.write_text("print('file2')")
-        subprocess.run(["git", "add", "."], cwd=tmp_path, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "initial"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
+        _commit(tmp_path, "initial", ".")
 
         # Create and switch to feature branch
-        subprocess.run(
-            ["git", "checkout", "-b", "feature"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
+        _git(tmp_path, "checkout", "-b", "feature")
 
         # Delete file2 on feature branch
-        subprocess.run(["git", "rm", "file2.py"], cwd=tmp_path, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "delete file2"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
+        _git(tmp_path, "rm", "file2.py")
+        _git(tmp_path, "commit", "-m", "delete file2")
 
         # Modify file1
         file1.write_text("print('file1 modified')")
-        subprocess.run(["git", "add", "file1.py"], cwd=tmp_path, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "modify file1"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
+        _commit(tmp_path, "modify file1", "file1.py")
 
         # file2 doesn't exist anymore, so it shouldn't be in result
         result = get_changed_files_since_branch(tmp_path, "main")
@@ -467,68 +319,38 @@ class TestGetChangedFilesSinceBranch:
         assert file1 in result
         assert file2 not in result  # Deleted file not included
 
-    def test_git_timeout(self, tmp_path: Path) -> None:
+    def test_git_timeout(self, git_repo: Path) -> None:
         """Test handling of git command timeout."""
-        subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True)
-
         with patch(
             "subprocess.run", side_effect=subprocess.TimeoutExpired(cmd=[], timeout=30)
         ):
-            result = get_changed_files_since_branch(tmp_path, "main")
+            result = get_changed_files_since_branch(git_repo, "main")
             assert result is None
 
-    def test_git_command_error(self, tmp_path: Path) -> None:
+    def test_git_command_error(self, git_repo: Path) -> None:
         """Test handling of git command error."""
-        subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True)
-
         with patch(
             "subprocess.run", side_effect=subprocess.SubprocessError("git error")
         ):
-            result = get_changed_files_since_branch(tmp_path, "main")
+            result = get_changed_files_since_branch(git_repo, "main")
             assert result is None
 
     def test_includes_uncommitted_changes_by_default(self, tmp_path: Path) -> None:
         """Test that uncommitted changes are included by default."""
-        subprocess.run(["git", "init", "-b", "main"], cwd=tmp_path, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@test.com"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
+        _init_git(tmp_path, branch="main")
 
         # Create initial commit on main
         test_file = tmp_path / "test.py"
         test_file.write_text("print('hello')")
-        subprocess.run(["git", "add", "test.py"], cwd=tmp_path, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "initial"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
+        _commit(tmp_path, "initial", "test.py")
 
         # Create and switch to feature branch
-        subprocess.run(
-            ["git", "checkout", "-b", "feature"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
+        _git(tmp_path, "checkout", "-b", "feature")
 
         # Add committed change on feature branch
         committed_file = tmp_path / "committed.py"
         committed_file.write_text("print('committed')")
-        subprocess.run(
-            ["git", "add", "committed.py"], cwd=tmp_path, capture_output=True
-        )
-        subprocess.run(
-            ["git", "commit", "-m", "add committed file"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
+        _commit(tmp_path, "add committed file", "committed.py")
 
         # Add uncommitted changes
         uncommitted_file = tmp_path / "uncommitted.py"
@@ -542,46 +364,20 @@ class TestGetChangedFilesSinceBranch:
 
     def test_excludes_uncommitted_when_disabled(self, tmp_path: Path) -> None:
         """Test that uncommitted changes are excluded when include_uncommitted=False."""
-        subprocess.run(["git", "init", "-b", "main"], cwd=tmp_path, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@test.com"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
+        _init_git(tmp_path, branch="main")
 
         # Create initial commit on main
         test_file = tmp_path / "test.py"
         test_file.write_text("print('hello')")
-        subprocess.run(["git", "add", "test.py"], cwd=tmp_path, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "initial"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
+        _commit(tmp_path, "initial", "test.py")
 
         # Create and switch to feature branch
-        subprocess.run(
-            ["git", "checkout", "-b", "feature"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
+        _git(tmp_path, "checkout", "-b", "feature")
 
         # Add committed change on feature branch
         committed_file = tmp_path / "committed.py"
         committed_file.write_text("print('committed')")
-        subprocess.run(
-            ["git", "add", "committed.py"], cwd=tmp_path, capture_output=True
-        )
-        subprocess.run(
-            ["git", "commit", "-m", "add committed file"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
+        _commit(tmp_path, "add committed file", "committed.py")
 
         # Add uncommitted changes
         uncommitted_file = tmp_path / "uncommitted.py"
@@ -597,32 +393,17 @@ class TestGetChangedFilesSinceBranch:
 
     def test_includes_staged_changes(self, tmp_path: Path) -> None:
         """Test that staged changes are included with uncommitted."""
-        subprocess.run(["git", "init", "-b", "main"], cwd=tmp_path, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@test.com"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
+        _init_git(tmp_path, branch="main")
 
         # Create initial commit on main
         test_file = tmp_path / "test.py"
         test_file.write_text("print('hello')")
-        subprocess.run(["git", "add", "test.py"], cwd=tmp_path, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "initial"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
+        _commit(tmp_path, "initial", "test.py")
 
         # Add a staged file (not committed)
         staged_file = tmp_path / "staged.py"
         staged_file.write_text("print('staged')")
-        subprocess.run(["git", "add", "staged.py"], cwd=tmp_path, capture_output=True)
+        _git(tmp_path, "add", "staged.py")
 
         # Should include staged file
         result = get_changed_files_since_branch(tmp_path, "HEAD")
@@ -631,27 +412,12 @@ class TestGetChangedFilesSinceBranch:
 
     def test_includes_unstaged_modifications(self, tmp_path: Path) -> None:
         """Test that unstaged modifications are included with uncommitted."""
-        subprocess.run(["git", "init", "-b", "main"], cwd=tmp_path, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@test.com"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
+        _init_git(tmp_path, branch="main")
 
         # Create initial commit on main
         test_file = tmp_path / "test.py"
         test_file.write_text("print('hello')")
-        subprocess.run(["git", "add", "test.py"], cwd=tmp_path, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "initial"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
+        _commit(tmp_path, "initial", "test.py")
 
         # Modify the file without staging
         test_file.write_text("print('modified')")
@@ -663,51 +429,25 @@ class TestGetChangedFilesSinceBranch:
 
     def test_combined_committed_and_uncommitted_changes(self, tmp_path: Path) -> None:
         """Test detection of both committed branch changes and uncommitted changes."""
-        subprocess.run(["git", "init", "-b", "main"], cwd=tmp_path, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@test.com"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
+        _init_git(tmp_path, branch="main")
 
         # Create initial commit on main
         initial_file = tmp_path / "initial.py"
         initial_file.write_text("print('initial')")
-        subprocess.run(["git", "add", "initial.py"], cwd=tmp_path, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "initial"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
+        _commit(tmp_path, "initial", "initial.py")
 
         # Create and switch to feature branch
-        subprocess.run(
-            ["git", "checkout", "-b", "feature"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
+        _git(tmp_path, "checkout", "-b", "feature")
 
         # Committed change on feature branch
         committed_file = tmp_path / "committed.py"
         committed_file.write_text("print('committed')")
-        subprocess.run(
-            ["git", "add", "committed.py"], cwd=tmp_path, capture_output=True
-        )
-        subprocess.run(
-            ["git", "commit", "-m", "add committed"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
+        _commit(tmp_path, "add committed", "committed.py")
 
         # Staged change (not committed)
         staged_file = tmp_path / "staged.py"
         staged_file.write_text("print('staged')")
-        subprocess.run(["git", "add", "staged.py"], cwd=tmp_path, capture_output=True)
+        _git(tmp_path, "add", "staged.py")
 
         # Unstaged modification
         committed_file.write_text("print('committed modified')")
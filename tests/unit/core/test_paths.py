@@ -7,7 +7,12 @@ from pathlib import Path
 from unittest.mock import patch
 
 
-from lucidshark.core.paths import determine_scan_paths, resolve_node_bin
+from lucidshark.core.paths import (
+    determine_scan_paths,
+    find_first_file,
+    list_dir_names,
+    resolve_node_bin,
+)
 
 
 class TestDetermineScanPaths:
@@ -133,3 +138,55 @@ class TestResolveNodeBin:
             result = resolve_node_bin(project_root, "eslint")
 
             assert result is None
+
+
+class TestFindFirstFile:
+    """Tests for find_first_file function."""
+
+    def test_returns_highest_priority_match(self) -> None:
+        """Test that the first name in priority order wins."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            directory = Path(tmpdir)
+            (directory / "b.yml").touch()
+            (directory / "c.yml").touch()
+
+            result = find_first_file(directory, ["a.yml", "b.yml", "c.yml"])
+
+            assert result == directory / "b.yml"
+
+    def test_ignores_directories(self) -> None:
+        """Test that a directory with a candidate name is not returned."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            directory = Path(tmpdir)
+            (directory / "a.yml").mkdir()
+
+            result = find_first_file(directory, ["a.yml"])
+
+            assert result is None
+
+    def test_returns_none_when_directory_missing(self) -> None:
+        """Test that a missing directory returns None."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            directory = Path(tmpdir) / "missing"
+
+            result = find_first_file(directory, ["a.yml"])
+
+            assert result is None
+
+
+class TestListDirNames:
+    """Tests for list_dir_names function."""
+
+    def test_lists_files_and_directories(self) -> None:
+        """Test that every entry name is returned."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            directory = Path(tmpdir)
+            (directory / "a.yml").touch()
+            (directory / "sub").mkdir()
+
+            assert list_dir_names(directory) == {"a.yml", "sub"}
+
+    def test_returns_empty_set_when_directory_missing(self) -> None:
+        """Test that a missing directory lists as empty."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            assert list_dir_names(Path(tmpdir) / "missing") == frozenset()
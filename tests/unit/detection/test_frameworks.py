@@ -4,10 +4,14 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+from typing import Dict, Union
 
+import pytest
 
+from lucidshark.core.paths import list_dir_names
 from lucidshark.detection.frameworks import (
     detect_frameworks,
+    _detect_frameworks_cached,
     _get_python_dependencies,
     _get_js_dependencies,
     _get_java_dependencies,
@@ -25,131 +29,85 @@ from lucidshark.detection.frameworks import (
 )
 
 
-class TestDetectFrameworks:
-    """Tests for detect_frameworks function."""
-
-    def test_detect_python_framework_fastapi(self, tmp_path: Path) -> None:
-        """Test detecting FastAPI framework."""
-        pyproject = """
+# package.json payloads, serialized once at import
+_PKG_REACT = json.dumps({"dependencies": {"react": "^18.0.0"}}).encode()
+_PKG_VUE = json.dumps({"dependencies": {"vue": "^3.0.0"}}).encode()
+_PKG_ANGULAR = json.dumps({"dependencies": {"@angular/core": "^16.0.0"}}).encode()
+_PKG_NEXT = json.dumps({"dependencies": {"next": "^13.0.0"}}).encode()
+_PKG_EXPRESS = json.dumps({"dependencies": {"express": "^4.18.0"}}).encode()
+_PKG_JEST = json.dumps({"devDependencies": {"jest": "^29.0.0"}}).encode()
+_PKG_VITEST = json.dumps({"devDependencies": {"vitest": "^1.0.0"}}).encode()
+_PKG_DEPS = json.dumps(
+    {"dependencies": {"react": "^18.0.0", "axios": "^1.0.0"}}
+).encode()
+_PKG_DEV_DEPS = json.dumps(
+    {"devDependencies": {"jest": "^29.0.0", "typescript": "^5.0.0"}}
+).encode()
+_PKG_PEER_DEPS = json.dumps({"peerDependencies": {"react": ">=17.0.0"}}).encode()
+_PKG_ALL_DEP_TYPES = json.dumps(
+    {
+        "dependencies": {"react": "^18.0.0"},
+        "devDependencies": {"jest": "^29.0.0"},
+        "peerDependencies": {"lodash": "^4.0.0"},
+    }
+).encode()
+
+
+def _write_project(root: Path, files: Dict[str, Union[str, bytes]]) -> Path:
+    """Write a filename -> content mapping into root and return root."""
+    for name, content in files.items():
+        if isinstance(content, str):
+            content = content.encode()
+        (root / name).write_bytes(content)
+    return root
+
+
+_FASTAPI_PYPROJECT = """
 [project]
 dependencies = ["fastapi>=0.100.0"]
 """
-        (tmp_path / "pyproject.toml").write_text(pyproject)
-
-        frameworks, test_frameworks = detect_frameworks(tmp_path)
-        assert "fastapi" in frameworks
-
-    def test_detect_python_framework_django(self, tmp_path: Path) -> None:
-        """Test detecting Django framework."""
-        (tmp_path / "requirements.txt").write_text("django>=4.0\n")
-
-        frameworks, test_frameworks = detect_frameworks(tmp_path)
-        assert "django" in frameworks
-
-    def test_detect_python_framework_flask(self, tmp_path: Path) -> None:
-        """Test detecting Flask framework."""
-        (tmp_path / "requirements.txt").write_text("flask==2.3.0\n")
-
-        frameworks, test_frameworks = detect_frameworks(tmp_path)
-        assert "flask" in frameworks
-
-    def test_detect_python_test_framework_pytest(self, tmp_path: Path) -> None:
-        """Test detecting pytest test framework."""
-        (tmp_path / "requirements.txt").write_text("pytest>=7.0\n")
-
-        frameworks, test_frameworks = detect_frameworks(tmp_path)
-        assert "pytest" in test_frameworks
-
-    def test_detect_pytest_by_config_file(self, tmp_path: Path) -> None:
-        """Test detecting pytest by pytest.ini."""
-        (tmp_path / "pytest.ini").write_text("[pytest]\n")
-
-        frameworks, test_frameworks = detect_frameworks(tmp_path)
-        assert "pytest" in test_frameworks
-
-    def test_detect_pytest_by_conftest(self, tmp_path: Path) -> None:
-        """Test detecting pytest by conftest.py."""
-        (tmp_path / "conftest.py").write_text("# conftest")
-
-        frameworks, test_frameworks = detect_frameworks(tmp_path)
-        assert "pytest" in test_frameworks
-
-    def test_detect_js_framework_react(self, tmp_path: Path) -> None:
-        """Test detecting React framework."""
-        package_json = {"dependencies": {"react": "^18.0.0"}}
-        (tmp_path / "package.json").write_text(json.dumps(package_json))
-
-        frameworks, test_frameworks = detect_frameworks(tmp_path)
-        assert "react" in frameworks
-
-    def test_detect_js_framework_vue(self, tmp_path: Path) -> None:
-        """Test detecting Vue framework."""
-        package_json = {"dependencies": {"vue": "^3.0.0"}}
-        (tmp_path / "package.json").write_text(json.dumps(package_json))
-
-        frameworks, test_frameworks = detect_frameworks(tmp_path)
-        assert "vue" in frameworks
-
-    def test_detect_js_framework_angular(self, tmp_path: Path) -> None:
-        """Test detecting Angular framework."""
-        package_json = {"dependencies": {"@angular/core": "^16.0.0"}}
-        (tmp_path / "package.json").write_text(json.dumps(package_json))
-
-        frameworks, test_frameworks = detect_frameworks(tmp_path)
-        assert "angular" in frameworks
-
-    def test_detect_js_framework_next(self, tmp_path: Path) -> None:
-        """Test detecting Next.js framework."""
-        package_json = {"dependencies": {"next": "^13.0.0"}}
-        (tmp_path / "package.json").write_text(json.dumps(package_json))
-
-        frameworks, test_frameworks = detect_frameworks(tmp_path)
-        assert "next" in frameworks
-
-    def test_detect_js_framework_express(self, tmp_path: Path) -> None:
-        """Test detecting Express framework."""
-        package_json = {"dependencies": {"express": "^4.18.0"}}
-        (tmp_path / "package.json").write_text(json.dumps(package_json))
-
-        frameworks, test_frameworks = detect_frameworks(tmp_path)
-        assert "express" in frameworks
-
-    def test_detect_js_test_framework_jest(self, tmp_path: Path) -> None:
-        """Test detecting Jest test framework."""
-        package_json = {"devDependencies": {"jest": "^29.0.0"}}
-        (tmp_path / "package.json").write_text(json.dumps(package_json))
-
-        frameworks, test_frameworks = detect_frameworks(tmp_path)
-        assert "jest" in test_frameworks
-
-    def test_detect_jest_by_config_file(self, tmp_path: Path) -> None:
-        """Test detecting Jest by jest.config.js."""
-        (tmp_path / "jest.config.js").write_text("module.exports = {}")
-
-        frameworks, test_frameworks = detect_frameworks(tmp_path)
-        assert "jest" in test_frameworks
-
-    def test_detect_jest_by_ts_config(self, tmp_path: Path) -> None:
-        """Test detecting Jest by jest.config.ts."""
-        (tmp_path / "jest.config.ts").write_text("export default {}")
-
-        frameworks, test_frameworks = detect_frameworks(tmp_path)
-        assert "jest" in test_frameworks
 
-    def test_detect_jest_by_mjs_config(self, tmp_path: Path) -> None:
-        """Test detecting Jest by jest.config.mjs."""
-        (tmp_path / "jest.config.mjs").write_text("export default {}")
+# (filename, content, expected name, whether it is a test framework)
+_SINGLE_FRAMEWORK_CASES = [
+    pytest.param("pyproject.toml", _FASTAPI_PYPROJECT, "fastapi", False, id="fastapi"),
+    pytest.param("requirements.txt", "django>=4.0\n", "django", False, id="django"),
+    pytest.param("requirements.txt", "flask==2.3.0\n", "flask", False, id="flask"),
+    pytest.param("requirements.txt", "pytest>=7.0\n", "pytest", True, id="pytest"),
+    pytest.param("pytest.ini", "[pytest]\n", "pytest", True, id="pytest-ini"),
+    pytest.param("conftest.py", "# conftest", "pytest", True, id="pytest-conftest"),
+    pytest.param("package.json", _PKG_REACT, "react", False, id="react"),
+    pytest.param("package.json", _PKG_VUE, "vue", False, id="vue"),
+    pytest.param("package.json", _PKG_ANGULAR, "angular", False, id="angular"),
+    pytest.param("package.json", _PKG_NEXT, "next", False, id="next"),
+    pytest.param("package.json", _PKG_EXPRESS, "express", False, id="express"),
+    pytest.param("package.json", _PKG_JEST, "jest", True, id="jest"),
+    pytest.param("jest.config.js", "module.exports = {}", "jest", True, id="jest-js"),
+    pytest.param("jest.config.ts", "export default {}", "jest", True, id="jest-ts"),
+    pytest.param("jest.config.mjs", "export default {}", "jest", True, id="jest-mjs"),
+    pytest.param("package.json", _PKG_VITEST, "vitest", True, id="vitest"),
+]
 
-        frameworks, test_frameworks = detect_frameworks(tmp_path)
-        assert "jest" in test_frameworks
 
-    def test_detect_js_test_framework_vitest(self, tmp_path: Path) -> None:
-        """Test detecting Vitest test framework."""
-        package_json = {"devDependencies": {"vitest": "^1.0.0"}}
-        (tmp_path / "package.json").write_text(json.dumps(package_json))
+class TestDetectFrameworks:
+    """Tests for detect_frameworks function."""
 
-        frameworks, test_frameworks = detect_frameworks(tmp_path)
-        assert "vitest" in test_frameworks
+    @pytest.mark.parametrize(
+        ("filename", "content", "expected", "is_test_framework"),
+        _SINGLE_FRAMEWORK_CASES,
+    )
+    def test_detects_single_framework(
+        self,
+        tmp_path: Path,
+        filename: str,
+        content: Union[str, bytes],
+        expected: str,
+        is_test_framework: bool,
+    ) -> None:
+        """Test detecting a framework from one manifest or config file."""
+        project = _write_project(tmp_path, {filename: content})
+
+        frameworks, test_frameworks = detect_frameworks(project)
+        assert expected in (test_frameworks if is_test_framework else frameworks)
 
     def test_detect_multiple_frameworks(self, tmp_path: Path) -> None:
         """Test detecting multiple frameworks."""
@@ -157,9 +115,9 @@ dependencies = ["fastapi>=0.100.0"]
 [project]
 dependencies = ["fastapi>=0.100.0", "starlette>=0.20.0"]
 """
-        (tmp_path / "pyproject.toml").write_text(pyproject)
+        project = _write_project(tmp_path, {"pyproject.toml": pyproject})
 
-        frameworks, test_frameworks = detect_frameworks(tmp_path)
+        frameworks, test_frameworks = detect_frameworks(project)
         assert "fastapi" in frameworks
         assert "starlette" in frameworks
 
@@ -169,22 +127,52 @@ dependencies = ["fastapi>=0.100.0", "starlette>=0.20.0"]
         assert frameworks == []
         assert test_frameworks == []
 
+    def test_missing_project_root(self, tmp_path: Path) -> None:
+        """Test a nonexistent root is treated as having no manifests."""
+        frameworks, test_frameworks = detect_frameworks(tmp_path / "missing")
+        assert frameworks == []
+        assert test_frameworks == []
+
+    def test_repeat_detection_uses_cache(self, tmp_path: Path) -> None:
+        """Test an unchanged project is served from the cache as fresh lists."""
+        project = _write_project(tmp_path, {"package.json": _PKG_REACT})
+        first, _ = detect_frameworks(project)
+        first.append("mutated")
+        hits = _detect_frameworks_cached.cache_info().hits
+
+        frameworks, _ = detect_frameworks(project)
+        assert _detect_frameworks_cached.cache_info().hits == hits + 1
+        assert frameworks == ["react"]
+
+    def test_manifest_edit_invalidates_cache(self, tmp_path: Path) -> None:
+        """Test editing a manifest in place triggers a fresh detection."""
+        (tmp_path / "requirements.txt").write_bytes(b"flask\n")
+        assert detect_frameworks(tmp_path)[0] == ["flask"]
+
+        (tmp_path / "requirements.txt").write_bytes(b"django>=4.0\n")
+        assert detect_frameworks(tmp_path)[0] == ["django"]
+
     def test_doesnt_duplicate_pytest(self, tmp_path: Path) -> None:
         """Test pytest isn't duplicated when found multiple ways."""
-        (tmp_path / "requirements.txt").write_text("pytest>=7.0\n")
-        (tmp_path / "pytest.ini").write_text("[pytest]\n")
+        project = _write_project(
+            tmp_path, {"requirements.txt": "pytest>=7.0\n", "pytest.ini": "[pytest]\n"}
+        )
 
-        frameworks, test_frameworks = detect_frameworks(tmp_path)
+        frameworks, test_frameworks = detect_frameworks(project)
         # Should only appear once
         assert test_frameworks.count("pytest") == 1
 
     def test_doesnt_duplicate_jest(self, tmp_path: Path) -> None:
         """Test jest isn't duplicated when found multiple ways."""
-        package_json = {"devDependencies": {"jest": "^29.0.0"}}
-        (tmp_path / "package.json").write_text(json.dumps(package_json))
-        (tmp_path / "jest.config.js").write_text("module.exports = {}")
-
-        frameworks, test_frameworks = detect_frameworks(tmp_path)
+        project = _write_project(
+            tmp_path,
+            {
+                "package.json": _PKG_JEST,
+                "jest.config.js": "module.exports = {}",
+            },
+        )
+
+        frameworks, test_frameworks = detect_frameworks(project)
         # Should only appear once
         assert test_frameworks.count("jest") == 1
 
@@ -194,57 +182,29 @@ class TestGetPythonDependencies:
 
     def test_from_pyproject(self, tmp_path: Path) -> None:
         """Test getting deps from pyproject.toml."""
-        pyproject = """
+        pyproject = b"""
 [project]
 dependencies = ["fastapi>=0.100.0", "pydantic>=2.0"]
 """
-        (tmp_path / "pyproject.toml").write_text(pyproject)
+        (tmp_path / "pyproject.toml").write_bytes(pyproject)
 
-        deps = _get_python_dependencies(tmp_path)
+        deps = _get_python_dependencies(tmp_path, list_dir_names(tmp_path))
         assert "fastapi" in deps
         assert "pydantic" in deps
 
-    def test_from_requirements_txt(self, tmp_path: Path) -> None:
-        """Test getting deps from requirements.txt."""
-        (tmp_path / "requirements.txt").write_text("flask>=2.0\nrequests==2.28.0\n")
-
-        deps = _get_python_dependencies(tmp_path)
-        assert "flask" in deps
-        assert "requests" in deps
-
-    def test_from_requirements_dev_txt(self, tmp_path: Path) -> None:
-        """Test getting deps from requirements-dev.txt."""
-        (tmp_path / "requirements-dev.txt").write_text("pytest>=7.0\n")
-
-        deps = _get_python_dependencies(tmp_path)
-        assert "pytest" in deps
-
-    def test_from_requirements_dev_underscore(self, tmp_path: Path) -> None:
-        """Test getting deps from requirements_dev.txt."""
-        (tmp_path / "requirements_dev.txt").write_text("black>=23.0\n")
-
-        deps = _get_python_dependencies(tmp_path)
-        assert "black" in deps
-
-    def test_from_dev_requirements_txt(self, tmp_path: Path) -> None:
-        """Test getting deps from dev-requirements.txt."""
-        (tmp_path / "dev-requirements.txt").write_text("mypy>=1.0\n")
-
-        deps = _get_python_dependencies(tmp_path)
-        assert "mypy" in deps
-
-    def test_combines_multiple_sources(self, tmp_path: Path) -> None:
-        """Test combining deps from multiple sources."""
-        (tmp_path / "requirements.txt").write_text("flask>=2.0\n")
-        (tmp_path / "requirements-dev.txt").write_text("pytest>=7.0\n")
+    def test_combines_all_requirements_files(self, tmp_path: Path) -> None:
+        """Test deps from every requirements file variant are combined."""
+        (tmp_path / "requirements.txt").write_bytes(b"flask>=2.0\nrequests==2.28.0\n")
+        (tmp_path / "requirements-dev.txt").write_bytes(b"pytest>=7.0\n")
+        (tmp_path / "requirements_dev.txt").write_bytes(b"black>=23.0\n")
+        (tmp_path / "dev-requirements.txt").write_bytes(b"mypy>=1.0\n")
 
-        deps = _get_python_dependencies(tmp_path)
-        assert "flask" in deps
-        assert "pytest" in deps
+        deps = _get_python_dependencies(tmp_path, list_dir_names(tmp_path))
+        assert deps == {"flask", "requests", "pytest", "black", "mypy"}
 
     def test_empty_project(self, tmp_path: Path) -> None:
         """Test empty project returns empty set."""
-        deps = _get_python_dependencies(tmp_path)
+        deps = _get_python_dependencies(tmp_path, list_dir_names(tmp_path))
         assert deps == set()
 
     def test_handles_invalid_file(self, tmp_path: Path) -> None:
@@ -253,7 +213,7 @@ dependencies = ["fastapi>=0.100.0", "pydantic>=2.0"]
         (tmp_path / "pyproject.toml").write_bytes(b"\x00\x01\x02")
 
         # Should not raise, just return empty
-        deps = _get_python_dependencies(tmp_path)
+        deps = _get_python_dependencies(tmp_path, list_dir_names(tmp_path))
         assert isinstance(deps, set)
 
 
@@ -285,6 +245,27 @@ dependencies = [
         assert "pytest" in deps
         assert "black" in deps
 
+    def test_parse_optional_dependencies_table(self) -> None:
+        """Test parsing the single [project.optional-dependencies] table form."""
+        content = """
+[project.optional-dependencies]
+dev = ["pytest>=7.0", "black>=23.0"]
+"""
+        deps = _parse_pyproject_deps(content)
+        assert deps == {"pytest", "black"}
+
+    def test_poetry_section_ends_at_next_table(self) -> None:
+        """Test keys from following tables are not read as Poetry deps."""
+        content = """
+[tool.poetry.dependencies]
+fastapi = "^0.100.0"
+
+[[tool.poetry.source]]
+name = "internal"
+"""
+        deps = _parse_pyproject_deps(content)
+        assert deps == {"fastapi"}
+
     def test_parse_poetry_dependencies(self) -> None:
         """Test parsing Poetry-style dependencies."""
         content = """
@@ -348,6 +329,13 @@ class TestParseRequirementsTxt:
         assert "flask" in deps
         assert len(deps) == 1
 
+    def test_handles_indentation_and_non_package_lines(self) -> None:
+        """Test indented names are read and local path lines are skipped."""
+        content = "  Flask[async]>=2.0\n\tpytest\n./local-pkg\n"
+
+        deps = _parse_requirements_txt(content)
+        assert deps == {"flask", "pytest"}
+
     def test_normalizes_underscores(self) -> None:
         """Test underscores are normalized to hyphens."""
         content = "some_package>=1.0\n"
@@ -408,61 +396,53 @@ class TestGetJsDependencies:
 
     def test_from_dependencies(self, tmp_path: Path) -> None:
         """Test getting from dependencies."""
-        package_json = {"dependencies": {"react": "^18.0.0", "axios": "^1.0.0"}}
-        (tmp_path / "package.json").write_text(json.dumps(package_json))
+        (tmp_path / "package.json").write_bytes(_PKG_DEPS)
 
-        deps = _get_js_dependencies(tmp_path)
+        deps = _get_js_dependencies(tmp_path, list_dir_names(tmp_path))
         assert "react" in deps
         assert "axios" in deps
 
     def test_from_dev_dependencies(self, tmp_path: Path) -> None:
         """Test getting from devDependencies."""
-        package_json = {"devDependencies": {"jest": "^29.0.0", "typescript": "^5.0.0"}}
-        (tmp_path / "package.json").write_text(json.dumps(package_json))
+        (tmp_path / "package.json").write_bytes(_PKG_DEV_DEPS)
 
-        deps = _get_js_dependencies(tmp_path)
+        deps = _get_js_dependencies(tmp_path, list_dir_names(tmp_path))
         assert "jest" in deps
         assert "typescript" in deps
 
     def test_from_peer_dependencies(self, tmp_path: Path) -> None:
         """Test getting from peerDependencies."""
-        package_json = {"peerDependencies": {"react": ">=17.0.0"}}
-        (tmp_path / "package.json").write_text(json.dumps(package_json))
+        (tmp_path / "package.json").write_bytes(_PKG_PEER_DEPS)
 
-        deps = _get_js_dependencies(tmp_path)
+        deps = _get_js_dependencies(tmp_path, list_dir_names(tmp_path))
         assert "react" in deps
 
     def test_combines_all_dependency_types(self, tmp_path: Path) -> None:
         """Test combining all dependency types."""
-        package_json = {
-            "dependencies": {"react": "^18.0.0"},
-            "devDependencies": {"jest": "^29.0.0"},
-            "peerDependencies": {"lodash": "^4.0.0"},
-        }
-        (tmp_path / "package.json").write_text(json.dumps(package_json))
-
-        deps = _get_js_dependencies(tmp_path)
+        (tmp_path / "package.json").write_bytes(_PKG_ALL_DEP_TYPES)
+
+        deps = _get_js_dependencies(tmp_path, list_dir_names(tmp_path))
         assert "react" in deps
         assert "jest" in deps
         assert "lodash" in deps
 
     def test_no_package_json(self, tmp_path: Path) -> None:
         """Test when no package.json exists."""
-        deps = _get_js_dependencies(tmp_path)
+        deps = _get_js_dependencies(tmp_path, list_dir_names(tmp_path))
         assert deps == set()
 
     def test_handles_invalid_json(self, tmp_path: Path) -> None:
         """Test handling invalid JSON gracefully."""
-        (tmp_path / "package.json").write_text("not valid json {{{")
+        (tmp_path / "package.json").write_bytes(b"not valid json {{{")
 
-        deps = _get_js_dependencies(tmp_path)
+        deps = _get_js_dependencies(tmp_path, list_dir_names(tmp_path))
         assert deps == set()
 
     def test_handles_empty_package_json(self, tmp_path: Path) -> None:
         """Test handling empty package.json."""
-        (tmp_path / "package.json").write_text("{}")
+        (tmp_path / "package.json").write_bytes(b"{}")
 
-        deps = _get_js_dependencies(tmp_path)
+        deps = _get_js_dependencies(tmp_path, list_dir_names(tmp_path))
         assert deps == set()
 
 
@@ -517,7 +497,7 @@ class TestDetectJavaFrameworks:
 
     def test_detect_spring_boot_from_pom(self, tmp_path: Path) -> None:
         """Test detecting Spring Boot from pom.xml."""
-        pom_xml = """<?xml version="1.0" encoding="UTF-8"?>
+        pom_xml = b"""<?xml version="1.0" encoding="UTF-8"?>
 <project>
     <parent>
         <groupId>org.springframework.boot</groupId>
@@ -532,14 +512,14 @@ class TestDetectJavaFrameworks:
     </dependencies>
 </project>
 """
-        (tmp_path / "pom.xml").write_text(pom_xml)
+        (tmp_path / "pom.xml").write_bytes(pom_xml)
 
         frameworks, test_frameworks = detect_frameworks(tmp_path)
         assert "spring-boot" in frameworks
 
     def test_detect_junit5_from_pom(self, tmp_path: Path) -> None:
         """Test detecting JUnit 5 from pom.xml."""
-        pom_xml = """<?xml version="1.0" encoding="UTF-8"?>
+        pom_xml = b"""<?xml version="1.0" encoding="UTF-8"?>
 <project>
     <dependencies>
         <dependency>
@@ -551,14 +531,14 @@ class TestDetectJavaFrameworks:
     </dependencies>
 </project>
 """
-        (tmp_path / "pom.xml").write_text(pom_xml)
+        (tmp_path / "pom.xml").write_bytes(pom_xml)
 
         frameworks, test_frameworks = detect_frameworks(tmp_path)
         assert "junit5" in test_frameworks
 
     def test_detect_mockito_from_pom(self, tmp_path: Path) -> None:
         """Test detecting Mockito from pom.xml."""
-        pom_xml = """<?xml version="1.0" encoding="UTF-8"?>
+        pom_xml = b"""<?xml version="1.0" encoding="UTF-8"?>
 <project>
     <dependencies>
         <dependency>
@@ -570,14 +550,14 @@ class TestDetectJavaFrameworks:
     </dependencies>
 </project>
 """
-        (tmp_path / "pom.xml").write_text(pom_xml)
+        (tmp_path / "pom.xml").write_bytes(pom_xml)
 
         frameworks, test_frameworks = detect_frameworks(tmp_path)
         assert "mockito" in test_frameworks
 
     def test_detect_quarkus_from_gradle(self, tmp_path: Path) -> None:
         """Test detecting Quarkus from build.gradle."""
-        build_gradle = """
+        build_gradle = b"""
 plugins {
     id 'java'
     id 'io.quarkus' version '3.6.0'
@@ -588,14 +568,14 @@ dependencies {
     testImplementation 'io.quarkus:quarkus-junit5'
 }
 """
-        (tmp_path / "build.gradle").write_text(build_gradle)
+        (tmp_path / "build.gradle").write_bytes(build_gradle)
 
         frameworks, test_frameworks = detect_frameworks(tmp_path)
         assert "quarkus" in frameworks
 
     def test_detect_spring_boot_from_gradle(self, tmp_path: Path) -> None:
         """Test detecting Spring Boot from build.gradle with plugin."""
-        build_gradle = """
+        build_gradle = b"""
 plugins {
     id 'java'
     id 'org.springframework.boot' version '3.2.0'
@@ -605,7 +585,7 @@ dependencies {
     implementation 'org.springframework.boot:spring-boot-starter-web'
 }
 """
-        (tmp_path / "build.gradle").write_text(build_gradle)
+        (tmp_path / "build.gradle").write_bytes(build_gradle)
 
         frameworks, test_frameworks = detect_frameworks(tmp_path)
         assert "spring-boot" in frameworks
@@ -616,7 +596,7 @@ class TestGetJavaDependencies:
 
     def test_from_pom_xml(self, tmp_path: Path) -> None:
         """Test getting dependencies from pom.xml."""
-        pom_xml = """<?xml version="1.0" encoding="UTF-8"?>
+        pom_xml = b"""<?xml version="1.0" encoding="UTF-8"?>
 <project>
     <dependencies>
         <dependency>
@@ -626,30 +606,30 @@ class TestGetJavaDependencies:
     </dependencies>
 </project>
 """
-        (tmp_path / "pom.xml").write_text(pom_xml)
+        (tmp_path / "pom.xml").write_bytes(pom_xml)
 
-        deps = _get_java_dependencies(tmp_path)
+        deps = _get_java_dependencies(tmp_path, list_dir_names(tmp_path))
         assert "org.springframework.boot:spring-boot-starter-web" in deps
         assert "spring-boot-starter-web" in deps
 
     def test_from_build_gradle(self, tmp_path: Path) -> None:
         """Test getting dependencies from build.gradle."""
-        build_gradle = """
+        build_gradle = b"""
 dependencies {
     implementation 'org.springframework.boot:spring-boot-starter-web:3.2.0'
     testImplementation 'org.junit.jupiter:junit-jupiter:5.10.0'
 }
 """
-        (tmp_path / "build.gradle").write_text(build_gradle)
+        (tmp_path / "build.gradle").write_bytes(build_gradle)
 
-        deps = _get_java_dependencies(tmp_path)
+        deps = _get_java_dependencies(tmp_path, list_dir_names(tmp_path))
         assert "org.springframework.boot:spring-boot-starter-web" in deps
         assert "spring-boot-starter-web" in deps
         assert "org.junit.jupiter:junit-jupiter" in deps
 
     def test_no_java_files(self, tmp_path: Path) -> None:
         """Test when no Java build files exist."""
-        deps = _get_java_dependencies(tmp_path)
+        deps = _get_java_dependencies(tmp_path, list_dir_names(tmp_path))
         assert deps == set()
 
 
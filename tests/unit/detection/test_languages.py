@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
+import dataclasses
 import json
 from pathlib import Path
 
+import pytest
 
+from lucidshark.detection import languages as languages_module
 from lucidshark.detection.languages import (
     LanguageInfo,
     detect_languages,
-    _walk_files,
+    _iter_file_entries,
+    _read_version,
+    _read_version_cached,
+    _parse_go_directive,
     _detect_version,
     _detect_python_version,
     _detect_typescript_version,
@@ -22,6 +28,11 @@ from lucidshark.detection.languages import (
 )
 
 
+def _by_name(languages: list[LanguageInfo]) -> dict[str, LanguageInfo]:
+    """Index detected languages by name."""
+    return {lang.name: lang for lang in languages}
+
+
 class TestLanguageInfo:
     """Tests for LanguageInfo dataclass."""
 
@@ -39,6 +50,14 @@ class TestLanguageInfo:
         assert info.version == "3.11"
         assert info.file_count == 42
 
+    def test_language_info_is_frozen_and_hashable(self) -> None:
+        """Test LanguageInfo instances are immutable value objects."""
+        info = LanguageInfo(name="python", version="3.11", file_count=42)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            info.file_count = 1  # type: ignore[misc]
+        assert len({info, LanguageInfo("python", "3.11", 42)}) == 1
+
 
 class TestDetectLanguages:
     """Tests for detect_languages function."""
@@ -50,7 +69,7 @@ class TestDetectLanguages:
 
         languages = detect_languages(tmp_path)
 
-        python_lang = next((lang for lang in languages if lang.name == "python"), None)
+        python_lang = _by_name(languages).get("python")
         assert python_lang is not None
         assert python_lang.file_count == 2
 
@@ -61,7 +80,7 @@ class TestDetectLanguages:
 
         languages = detect_languages(tmp_path)
 
-        js_lang = next((lang for lang in languages if lang.name == "javascript"), None)
+        js_lang = _by_name(languages).get("javascript")
         assert js_lang is not None
         assert js_lang.file_count == 2
 
@@ -72,7 +91,7 @@ class TestDetectLanguages:
 
         languages = detect_languages(tmp_path)
 
-        ts_lang = next((lang for lang in languages if lang.name == "typescript"), None)
+        ts_lang = _by_name(languages).get("typescript")
         assert ts_lang is not None
         assert ts_lang.file_count == 2
 
@@ -82,7 +101,7 @@ class TestDetectLanguages:
 
         languages = detect_languages(tmp_path)
 
-        python_lang = next((lang for lang in languages if lang.name == "python"), None)
+        python_lang = _by_name(languages).get("python")
         assert python_lang is not None
 
     def test_detect_go_by_marker(self, tmp_path: Path) -> None:
@@ -91,7 +110,7 @@ class TestDetectLanguages:
 
         languages = detect_languages(tmp_path)
 
-        go_lang = next((lang for lang in languages if lang.name == "go"), None)
+        go_lang = _by_name(languages).get("go")
         assert go_lang is not None
 
     def test_detect_rust_by_marker(self, tmp_path: Path) -> None:
@@ -100,7 +119,7 @@ class TestDetectLanguages:
 
         languages = detect_languages(tmp_path)
 
-        rust_lang = next((lang for lang in languages if lang.name == "rust"), None)
+        rust_lang = _by_name(languages).get("rust")
         assert rust_lang is not None
 
     def test_detect_java_by_marker(self, tmp_path: Path) -> None:
@@ -109,7 +128,7 @@ class TestDetectLanguages:
 
         languages = detect_languages(tmp_path)
 
-        java_lang = next((lang for lang in languages if lang.name == "java"), None)
+        java_lang = _by_name(languages).get("java")
         assert java_lang is not None
 
     def test_detect_multiple_languages(self, tmp_path: Path) -> None:
@@ -142,6 +161,16 @@ class TestDetectLanguages:
         languages = detect_languages(tmp_path)
         assert languages == []
 
+    def test_extension_matching_rules(self, tmp_path: Path) -> None:
+        """Test extensions match case-insensitively and dotfiles are ignored."""
+        (tmp_path / "Main.PY").write_text("# upper")
+        (tmp_path / "archive.tar.py").write_text("# last suffix wins")
+        (tmp_path / ".ts").write_text("// dotfile, no extension")
+
+        languages = detect_languages(tmp_path)
+
+        assert [(lang.name, lang.file_count) for lang in languages] == [("python", 2)]
+
     def test_skips_node_modules(self, tmp_path: Path) -> None:
         """Test that node_modules is skipped."""
         node_modules = tmp_path / "node_modules"
@@ -153,19 +182,19 @@ class TestDetectLanguages:
         languages = detect_languages(tmp_path)
 
         # Should only find Python, not JavaScript from node_modules
-        js_lang = next((lang for lang in languages if lang.name == "javascript"), None)
+        js_lang = _by_name(languages).get("javascript")
         assert js_lang is None
 
 
-class TestWalkFiles:
-    """Tests for _walk_files function."""
+class TestIterFileEntries:
+    """Tests for _iter_file_entries function."""
 
     def test_walk_files_basic(self, tmp_path: Path) -> None:
         """Test basic file walking."""
         (tmp_path / "file1.txt").write_text("content1")
         (tmp_path / "file2.txt").write_text("content2")
 
-        files = _walk_files(tmp_path)
+        files = list(_iter_file_entries(str(tmp_path)))
 
         assert len(files) == 2
 
@@ -176,7 +205,7 @@ class TestWalkFiles:
         (tmp_path / "root.txt").write_text("root")
         (subdir / "nested.txt").write_text("nested")
 
-        files = _walk_files(tmp_path)
+        files = list(_iter_file_entries(str(tmp_path)))
 
         assert len(files) == 2
 
@@ -189,7 +218,7 @@ class TestWalkFiles:
 
         (tmp_path / "included.txt").write_text("included")
 
-        files = _walk_files(tmp_path)
+        files = list(_iter_file_entries(str(tmp_path)))
 
         assert len(files) == 1
         assert files[0].name == "included.txt"
@@ -202,7 +231,7 @@ class TestWalkFiles:
 
         (tmp_path / "visible.txt").write_text("visible")
 
-        files = _walk_files(tmp_path)
+        files = list(_iter_file_entries(str(tmp_path)))
 
         assert len(files) == 1
         assert files[0].name == "visible.txt"
@@ -215,7 +244,7 @@ class TestWalkFiles:
             current.mkdir()
             (current / "file.txt").write_text(f"level {i}")
 
-        files = _walk_files(tmp_path, max_depth=3)
+        files = list(_iter_file_entries(str(tmp_path), max_depth=3))
 
         # Should find files up to depth 3, not all 15
         assert len(files) < 15
@@ -227,10 +256,47 @@ class TestWalkFiles:
         # This test would require actually setting permissions,
         # which may not work on all systems. Just verify the function
         # completes without error.
-        files = _walk_files(tmp_path)
+        files = list(_iter_file_entries(str(tmp_path)))
         assert len(files) >= 1
 
 
+class TestReadVersion:
+    """Tests for _read_version function."""
+
+    def test_missing_file_returns_none(self, tmp_path: Path) -> None:
+        """Test a missing file yields no version."""
+        assert _read_version(tmp_path / "go.mod", _parse_go_directive) is None
+
+    def test_repeat_read_is_cached(self, tmp_path: Path) -> None:
+        """Test an unchanged file is served from the cache."""
+        go_mod = tmp_path / "go.mod"
+        go_mod.write_text("go 1.21\n")
+        assert _read_version(go_mod, _parse_go_directive) == "1.21"
+        hits = _read_version_cached.cache_info().hits
+
+        assert _read_version(go_mod, _parse_go_directive) == "1.21"
+        assert _read_version_cached.cache_info().hits == hits + 1
+
+    def test_read_is_capped(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test only the head of an oversized file is parsed."""
+        monkeypatch.setattr(languages_module, "_MAX_MARKER_FILE_CHARS", 8)
+        go_mod = tmp_path / "go.mod"
+        go_mod.write_text("go 1.21\n" + "x" * 100)
+
+        assert _read_version(go_mod, lambda content: content) == "go 1.21\n"
+
+    def test_edit_invalidates_cache(self, tmp_path: Path) -> None:
+        """Test rewriting a file returns the new content."""
+        go_mod = tmp_path / "go.mod"
+        go_mod.write_text("go 1.21\n")
+        assert _detect_go_version(tmp_path) == "1.21"
+
+        go_mod.write_text("go 1.22.1\n")
+        assert _detect_go_version(tmp_path) == "1.22"
+
+
 class TestDetectVersion:
     """Tests for _detect_version function."""
 